@@ -1,6 +1,45 @@
-from app.api.v1.endpoints import categories, questions
+from app.api.v1.endpoints import (
+    bootstrap,
+    categories,
+    categories_async,
+    questions,
+    questions_async,
+)
+from app.core.responses import FastJSONResponse
+from app.db.database import ASYNC_DB
 from fastapi import APIRouter
+from fastapi.routing import APIRoute
 
-api_router = APIRouter()
-api_router.include_router(categories.router, prefix="/categories", tags=["categories"])
-api_router.include_router(questions.router, prefix="/questions", tags=["questions"])
+
+def with_route_overrides(base: APIRouter, overrides: APIRouter) -> APIRouter:
+    """
+    Copy `base`, replacing routes that `overrides` defines for the same path and methods.
+
+    Route order of `base` is kept, so static paths such as `/search` still match
+    before `/{question_id}`.
+    """
+    replacements = {
+        (route.path, frozenset(route.methods)): route
+        for route in overrides.routes
+        if isinstance(route, APIRoute)
+    }
+    router = APIRouter()
+    router.routes.extend(
+        replacements.get((route.path, frozenset(route.methods)), route)
+        if isinstance(route, APIRoute)
+        else route
+        for route in base.routes
+    )
+    return router
+
+
+categories_router = categories.router
+questions_router = questions.router
+if ASYNC_DB:
+    categories_router = with_route_overrides(categories.router, categories_async.router)
+    questions_router = with_route_overrides(questions.router, questions_async.router)
+
+api_router = APIRouter(default_response_class=FastJSONResponse)
+api_router.include_router(categories_router, prefix="/categories", tags=["categories"])
+api_router.include_router(questions_router, prefix="/questions", tags=["questions"])
+api_router.include_router(bootstrap.router, prefix="/bootstrap", tags=["bootstrap"])
@@ -0,0 +1,19 @@
+from typing import Annotated
+
+from app.schemas.batch import MAX_BATCH_IDS
+from fastapi import HTTPException, Query
+
+
+def ids_query(
+    ids: Annotated[str, Query(description="Comma-separated IDs", examples=["1,2,3"])],
+) -> list[int]:
+    """Dependency parsing `?ids=1,2,3` into at most MAX_BATCH_IDS integers."""
+    try:
+        parsed = [int(part) for part in ids.split(",") if part.strip()]
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Invalid ids") from exc
+    if not parsed or len(parsed) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=400, detail=f"Between 1 and {MAX_BATCH_IDS} ids are required"
+        )
+    return parsed
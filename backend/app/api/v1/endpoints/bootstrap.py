@@ -0,0 +1,48 @@
+from typing import Annotated
+
+from app.api.v1.etag import conditional_get
+from app.core.metrics import serialization_timer
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, encode_cursor
+from app.core.responses import page_body, raw_json_response
+from app.db.database import get_db
+from app.schemas.bootstrap import Bootstrap
+from app.services import category as category_service
+from app.services import question as question_service
+from fastapi import APIRouter, Depends, Query, Response
+from pydantic_core import to_json
+from sqlalchemy.orm import Session
+
+router = APIRouter()
+
+
+@router.get(
+    "",
+    response_model=Bootstrap,
+    dependencies=[Depends(conditional_get("categories", "questions"))],
+)
+def read_bootstrap(
+    db: Annotated[Session, Depends(get_db)],
+    response: Response,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+) -> Response:
+    """
+    Get everything the first paint needs in one response.
+
+    The ETag check and both reads share the request's session: one query for
+    the categories with their maintained question counts, one for the first
+    page of questions. Resume the question list with `questions.next_cursor`.
+    """
+    categories = category_service.get_category_stats(db)
+    questions, next_key = question_service.get_question_rows_page(db, limit=limit)
+    total = sum(category["question_count"] for category in categories)
+    with serialization_timer():
+        body = (
+            b'{"categories":'
+            + to_json(categories)
+            + b',"total_questions":'
+            + to_json(total)
+            + b',"questions":'
+            + page_body(to_json(questions), encode_cursor(*next_key) if next_key else None)
+            + b"}"
+        )
+    return raw_json_response(body, response)
@@ -1,32 +1,95 @@
 from typing import Annotated, Any
 
+from app.api.v1.batch import ids_query
+from app.api.v1.etag import conditional_get
+from app.core.config import settings
+from app.core.metrics import serialization_timer
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor, encode_cursor
+from app.core.responses import page_response
 from app.db.database import get_db
-from app.schemas.category import Category, CategoryCreate, CategoryDelete, CategoryUpdate
+from app.schemas.batch import IdBatch
+from app.schemas.category import (
+    Category,
+    CategoryBatch,
+    CategoryCreate,
+    CategoryDelete,
+    CategoryList,
+    CategoryPage,
+    CategoryStats,
+    CategoryStatsResult,
+    CategoryUpdate,
+)
 from app.services import category as category_service
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic_core import to_json
 from sqlalchemy.orm import Session
 
 router = APIRouter()
 
 
-@router.get("/")
+@router.get("/", response_model=CategoryPage, dependencies=[Depends(conditional_get("categories"))])
 def read_categories(
     db: Annotated[Session, Depends(get_db)],
-    skip: int = 0,
-    limit: int = 100,
-) -> list[Category]:
-    """Get categories."""
-    db_categories = category_service.get_categories(db, skip=skip, limit=limit)
-    return [Category.model_validate(db_cat) for db_cat in db_categories]
+    response: Response,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> Response:
+    """Get a page of categories ordered by ID."""
+    try:
+        after = decode_cursor(cursor, 1)[0] if cursor else None
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
 
+    if "categories.list" in settings.CORE_READ_ENDPOINTS:
+        rows, next_id = category_service.get_category_rows_page(db, limit=limit, after=after)
+        with serialization_timer():
+            items_json = to_json(rows)
+    else:
+        categories, next_id = category_service.get_categories_page(db, limit=limit, after=after)
+        with serialization_timer():
+            items = CategoryList.validate_python(categories, from_attributes=True)
+            items_json = CategoryList.dump_json(items)
+    return page_response(
+        items_json, encode_cursor(next_id) if next_id is not None else None, response
+    )
+
+
+@router.get("/stats", dependencies=[Depends(conditional_get("categories", "questions"))])
+def read_category_stats(db: Annotated[Session, Depends(get_db)]) -> CategoryStatsResult:
+    """Get every category with its question count, read from the maintained counters."""
+    items = [CategoryStats.model_validate(row) for row in category_service.get_category_stats(db)]
+    return CategoryStatsResult(
+        items=items, total_questions=sum(item.question_count for item in items)
+    )
+
+
+@router.get("/batch", dependencies=[Depends(conditional_get("categories"))])
+def read_categories_batch(
+    ids: Annotated[list[int], Depends(ids_query)], db: Annotated[Session, Depends(get_db)]
+) -> CategoryBatch:
+    """Get categories by ID in the requested order, listing the IDs that do not exist."""
+    items, missing = category_service.get_categories_cached(db, ids)
+    return CategoryBatch(items=items, missing=missing)
 
-@router.get("/{category_id}")
+
+@router.post("/batch")
+def read_categories_batch_post(
+    batch: IdBatch, db: Annotated[Session, Depends(get_db)]
+) -> CategoryBatch:
+    """Variant of `GET /batch` taking the IDs in the body, for lists too long for a URL."""
+    items, missing = category_service.get_categories_cached(db, batch.ids)
+    return CategoryBatch(items=items, missing=missing)
+
+
+@router.get("/{category_id}", dependencies=[Depends(conditional_get("categories"))])
 def read_category(category_id: int, db: Annotated[Session, Depends(get_db)]) -> Category:
     """Get category by ID."""
-    db_category = category_service.get_category(db, category_id=category_id)
-    if db_category is None:
+    category = category_service.get_category_cached(
+        db, category_id=category_id, core="categories.detail" in settings.CORE_READ_ENDPOINTS
+    )
+    if category is None:
         raise HTTPException(status_code=404, detail="Category not found")
-    return Category.model_validate(db_category)
+    return category
 
 
 @router.post("/", response_model=Category, status_code=201)
@@ -34,13 +97,14 @@ def create_category(
     category: CategoryCreate, db: Annotated[Session, Depends(get_db)]
 ) -> category_service.CategoryModel:
     """Create a new category."""
-    existing = category_service.get_category_by_name(db, category.name)
-    if existing:
+    db_category = category_service.create_category(db=db, category=category)
+    if db_category is None:
+        existing = category_service.get_category_by_name(db, category.name)
+        found = f" (found '{existing.name}')" if existing else ""
         raise HTTPException(
-            status_code=400,
-            detail=f"Category '{category.name}' already exists (found '{existing.name}')",
+            status_code=400, detail=f"Category '{category.name}' already exists{found}"
         )
-    return category_service.create_category(db=db, category=category)
+    return db_category
 
 
 @router.patch("/{category_id}", response_model=Category)
@@ -0,0 +1,122 @@
+from typing import Annotated, Any
+
+from app.api.v1.etag import conditional_get_async
+from app.core.config import settings
+from app.core.metrics import serialization_timer
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor, encode_cursor
+from app.core.responses import page_response
+from app.db.database import get_async_db
+from app.schemas.category import (
+    Category,
+    CategoryCreate,
+    CategoryDelete,
+    CategoryList,
+    CategoryPage,
+    CategoryUpdate,
+)
+from app.services import category_async as category_service
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession
+
+router = APIRouter()
+
+
+@router.get(
+    "/", response_model=CategoryPage, dependencies=[Depends(conditional_get_async("categories"))]
+)
+async def read_categories(
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    response: Response,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> Response:
+    """Get a page of categories ordered by ID."""
+    try:
+        after = decode_cursor(cursor, 1)[0] if cursor else None
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+    if "categories.list" in settings.CORE_READ_ENDPOINTS:
+        rows, next_id = await category_service.get_category_rows_page(db, limit=limit, after=after)
+        with serialization_timer():
+            items_json = to_json(rows)
+    else:
+        categories, next_id = await category_service.get_categories_page(
+            db, limit=limit, after=after
+        )
+        with serialization_timer():
+            items = CategoryList.validate_python(categories, from_attributes=True)
+            items_json = CategoryList.dump_json(items)
+    return page_response(
+        items_json, encode_cursor(next_id) if next_id is not None else None, response
+    )
+
+
+@router.get("/{category_id}", dependencies=[Depends(conditional_get_async("categories"))])
+async def read_category(
+    category_id: int, db: Annotated[AsyncSession, Depends(get_async_db)]
+) -> Category:
+    """Get category by ID."""
+    category = await category_service.get_category_cached(
+        db, category_id=category_id, core="categories.detail" in settings.CORE_READ_ENDPOINTS
+    )
+    if category is None:
+        raise HTTPException(status_code=404, detail="Category not found")
+    return category
+
+
+@router.post("/", response_model=Category, status_code=201)
+async def create_category(
+    category: CategoryCreate, db: Annotated[AsyncSession, Depends(get_async_db)]
+) -> category_service.CategoryModel:
+    """Create a new category."""
+    db_category = await category_service.create_category(db=db, category=category)
+    if db_category is None:
+        existing = await category_service.get_category_by_name(db, category.name)
+        found = f" (found '{existing.name}')" if existing else ""
+        raise HTTPException(
+            status_code=400, detail=f"Category '{category.name}' already exists{found}"
+        )
+    return db_category
+
+
+@router.patch("/{category_id}", response_model=Category)
+async def update_category(
+    category_id: int,
+    category: CategoryUpdate,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> category_service.CategoryModel:
+    """Partially updates the category by ID."""
+    existing_category = await category_service.get_category(db, category_id=category_id)
+    if not existing_category:
+        raise HTTPException(status_code=404, detail="Category not found")
+
+    if category.name and category.name.lower() != existing_category.name.lower():
+        category_with_same_name = await category_service.get_category_by_name(
+            db, name=category.name
+        )
+        if category_with_same_name:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Category with name '{category.name}' already exists",
+            )
+    updated_category = await category_service.update_category(
+        db=db, category_id=category_id, category=category
+    )
+
+    if not updated_category:
+        raise HTTPException(status_code=404, detail="Category not found during update")
+
+    return updated_category
+
+
+@router.delete("/{category_id}", response_model=CategoryDelete)
+async def delete_category(
+    category_id: int, db: Annotated[AsyncSession, Depends(get_async_db)]
+) -> dict[str, Any]:
+    """Delete a category by ID."""
+    deleted = await category_service.delete_category(db, category_id=category_id)
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Category not found")
+    return {"id": category_id, "deleted": True}
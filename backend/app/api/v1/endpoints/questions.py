@@ -1,36 +1,177 @@
+import secrets
 from typing import Annotated, Any
 
+from app.api.v1.batch import ids_query
+from app.api.v1.etag import conditional_get
+from app.core.config import settings
+from app.core.metrics import serialization_timer
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor, encode_cursor
+from app.core.responses import page_response
+from app.core.text import text_key
 from app.db.database import get_db
-from app.schemas.question import Question, QuestionCreate, QuestionDelete, QuestionUpdate
+from app.schemas.batch import IdBatch
+from app.schemas.question import (
+    BulkItemStatus,
+    CategoryFacet,
+    Question,
+    QuestionBatch,
+    QuestionBulkItemResult,
+    QuestionBulkResult,
+    QuestionCreate,
+    QuestionDelete,
+    QuestionList,
+    QuestionPage,
+    QuestionSample,
+    QuestionSearchHit,
+    QuestionSearchResult,
+    QuestionUpdate,
+)
 from app.services import question as question_service
-from fastapi import APIRouter, Depends, HTTPException
+from app.services.export import EXPORT_MEDIA_TYPES, ExportFormat, export_questions
+from app.services.question import DuplicateQuestionError
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
 from sqlalchemy.orm import Session
 
 router = APIRouter()
 
+MAX_BULK_ITEMS = 50_000
+MAX_SAMPLE_SIZE = 100
+SEED_BITS = 32
 
-@router.get("/")
+
+@router.get("/", response_model=QuestionPage, dependencies=[Depends(conditional_get("questions"))])
 def read_questions(
-    db: Annotated[Session, Depends(get_db)], category_id: int | None = None
-) -> list[Question]:
-    """Get questions by category ID."""
-    if category_id:
-        questions = question_service.get_questions_by_category(db=db, category_id=category_id)
-        if not questions:
-            return []
-        return [Question.model_validate(q) for q in questions]
+    db: Annotated[Session, Depends(get_db)],
+    response: Response,
+    category_id: int | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> Response:
+    """Get a page of questions ordered by category, optionally filtered by category ID."""
+    try:
+        after = decode_cursor(cursor, 2) if cursor else None
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+    if "questions.list" in settings.CORE_READ_ENDPOINTS:
+        rows, next_key = question_service.get_question_rows_page(
+            db=db, limit=limit, after=after, category_id=category_id
+        )
+        with serialization_timer():
+            items_json = to_json(rows)
+    else:
+        questions, next_key = question_service.get_questions_page(
+            db=db, limit=limit, after=after, category_id=category_id
+        )
+        with serialization_timer():
+            items = QuestionList.validate_python(questions, from_attributes=True)
+            items_json = QuestionList.dump_json(items)
+    return page_response(items_json, encode_cursor(*next_key) if next_key else None, response)
+
+
+@router.get("/random")
+def read_random_questions(
+    db: Annotated[Session, Depends(get_db)],
+    count: Annotated[int, Query(ge=1, le=MAX_SAMPLE_SIZE)] = 10,
+    category_id: int | None = None,
+    seed: Annotated[int | None, Query(ge=0)] = None,
+) -> QuestionSample:
+    """
+    Get a uniform random sample of questions, optionally from one category.
+
+    The response carries the seed; passing it back repeats the same quiz.
+    """
+    if seed is None:
+        seed = secrets.randbits(SEED_BITS)
+    rows = question_service.sample_questions(db=db, count=count, category_id=category_id, seed=seed)
+    return QuestionSample(items=QuestionList.validate_python(rows), seed=seed)
+
 
-    all_questions = question_service.get_all_questions(db=db)
-    return [Question.model_validate(q) for q in all_questions]
+@router.get("/search")
+def search_questions(
+    db: Annotated[Session, Depends(get_db)],
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    category_id: int | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> QuestionSearchResult:
+    """Full-text search over questions and answers, ranked by relevance."""
+    try:
+        offset = decode_cursor(cursor, 1)[0] if cursor else 0
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
 
+    hits, facets = question_service.search_questions(
+        db=db, query=q, limit=limit, offset=offset, category_id=category_id
+    )
+    total = facets.get(category_id, 0) if category_id is not None else sum(facets.values())
+    next_offset = offset + len(hits)
+
+    return QuestionSearchResult(
+        items=[
+            QuestionSearchHit(**Question.model_validate(question).model_dump(), rank=rank)
+            for question, rank in hits
+        ],
+        total=total,
+        facets=[
+            CategoryFacet(category_id=cat_id, count=count)
+            for cat_id, count in sorted(facets.items())
+        ],
+        next_cursor=encode_cursor(next_offset) if next_offset < total else None,
+    )
+
+
+@router.get("/export")
+def export_question_bank(
+    db: Annotated[Session, Depends(get_db)],
+    export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.NDJSON,
+    category_id: int | None = None,
+    *,
+    gzip: bool = False,
+) -> StreamingResponse:
+    """Stream the question bank as NDJSON or CSV, optionally gzip-compressed."""
+    filename = f"questions.{export_format}"
+    media_type = EXPORT_MEDIA_TYPES[export_format]
+    if gzip:
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        export_questions(db, export_format, category_id, compress=gzip),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
-@router.get("/{question_id}")
+
+@router.get("/batch", dependencies=[Depends(conditional_get("questions"))])
+def read_questions_batch(
+    ids: Annotated[list[int], Depends(ids_query)], db: Annotated[Session, Depends(get_db)]
+) -> QuestionBatch:
+    """Get questions by ID in the requested order, listing the IDs that do not exist."""
+    items, missing = question_service.get_questions_cached(db, ids)
+    return QuestionBatch(items=items, missing=missing)
+
+
+@router.post("/batch")
+def read_questions_batch_post(
+    batch: IdBatch, db: Annotated[Session, Depends(get_db)]
+) -> QuestionBatch:
+    """Variant of `GET /batch` taking the IDs in the body, for lists too long for a URL."""
+    items, missing = question_service.get_questions_cached(db, batch.ids)
+    return QuestionBatch(items=items, missing=missing)
+
+
+@router.get("/{question_id}", dependencies=[Depends(conditional_get("questions"))])
 def read_question(question_id: int, db: Annotated[Session, Depends(get_db)]) -> Question:
     """Get question by ID."""
-    db_question = question_service.get_question(db, question_id=question_id)
-    if db_question is None:
+    question = question_service.get_question_cached(
+        db, question_id=question_id, core="questions.detail" in settings.CORE_READ_ENDPOINTS
+    )
+    if question is None:
         raise HTTPException(status_code=404, detail="Question not found")
-    return Question.model_validate(db_question)
+    return question
 
 
 @router.post("/", status_code=201)
@@ -41,10 +182,35 @@ def create_question(question: QuestionCreate, db: Annotated[Session, Depends(get
         raise HTTPException(
             status_code=400, detail=f"Question already exists: '{existing.question_text}'"
         )
-    db_question = question_service.create_question(db=db, question=question)
+    try:
+        db_question = question_service.create_question(db=db, question=question)
+    except DuplicateQuestionError:
+        # Another request stored the same text after the check above.
+        raise HTTPException(
+            status_code=400, detail=f"Question already exists: '{question.question_text}'"
+        ) from None
     return Question.model_validate(db_question)
 
 
+@router.post("/bulk")
+def bulk_create_questions(
+    questions: Annotated[list[QuestionCreate], Body(min_length=1, max_length=MAX_BULK_ITEMS)],
+    db: Annotated[Session, Depends(get_db)],
+) -> QuestionBulkResult:
+    """Create many questions at once, reporting the outcome of every item."""
+    results = question_service.bulk_create_questions(db=db, questions=questions)
+    statuses = [status for status, _ in results]
+    return QuestionBulkResult(
+        created=statuses.count(BulkItemStatus.CREATED),
+        duplicates=statuses.count(BulkItemStatus.DUPLICATE),
+        invalid_category=statuses.count(BulkItemStatus.INVALID_CATEGORY),
+        items=[
+            QuestionBulkItemResult(index=index, status=status, id=new_id)
+            for index, (status, new_id) in enumerate(results)
+        ],
+    )
+
+
 @router.patch("/{question_id}", response_model=Question)
 def update_question(
     question_id: int, question: QuestionUpdate, db: Annotated[Session, Depends(get_db)]
@@ -54,10 +220,7 @@ def update_question(
     if not existing_question:
         raise HTTPException(status_code=404, detail="Question not found")
 
-    if (
-        question.question_text
-        and question.question_text.lower() != existing_question.question_text.lower()
-    ):
+    if question.question_text and text_key(question.question_text) != existing_question.text_key:
         existing_text = question_service.get_question_by_text_case_insensitive(
             db, question.question_text
         )
@@ -66,9 +229,14 @@ def update_question(
                 status_code=400, detail=f"Question already exists: '{existing_text.question_text}'"
             )
 
-    updated_question = question_service.update_question(
-        db=db, question_id=question_id, question=question
-    )
+    try:
+        updated_question = question_service.update_question(
+            db=db, question_id=question_id, question=question
+        )
+    except DuplicateQuestionError:
+        raise HTTPException(
+            status_code=400, detail=f"Question already exists: '{question.question_text}'"
+        ) from None
     if not updated_question:
         raise HTTPException(status_code=404, detail="Question not found")
     return updated_question
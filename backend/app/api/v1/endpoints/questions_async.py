@@ -0,0 +1,135 @@
+from typing import Annotated, Any
+
+from app.api.v1.etag import conditional_get_async
+from app.core.config import settings
+from app.core.metrics import serialization_timer
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor, encode_cursor
+from app.core.responses import page_response
+from app.core.text import text_key
+from app.db.database import get_async_db
+from app.schemas.question import (
+    Question,
+    QuestionCreate,
+    QuestionDelete,
+    QuestionList,
+    QuestionPage,
+    QuestionUpdate,
+)
+from app.services import question_async as question_service
+from app.services.question import DuplicateQuestionError
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import AsyncSession
+
+router = APIRouter()
+
+
+@router.get(
+    "/", response_model=QuestionPage, dependencies=[Depends(conditional_get_async("questions"))]
+)
+async def read_questions(
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    response: Response,
+    category_id: int | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> Response:
+    """Get a page of questions ordered by category, optionally filtered by category ID."""
+    try:
+        after = decode_cursor(cursor, 2) if cursor else None
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+    if "questions.list" in settings.CORE_READ_ENDPOINTS:
+        rows, next_key = await question_service.get_question_rows_page(
+            db=db, limit=limit, after=after, category_id=category_id
+        )
+        with serialization_timer():
+            items_json = to_json(rows)
+    else:
+        questions, next_key = await question_service.get_questions_page(
+            db=db, limit=limit, after=after, category_id=category_id
+        )
+        with serialization_timer():
+            items = QuestionList.validate_python(questions, from_attributes=True)
+            items_json = QuestionList.dump_json(items)
+    return page_response(items_json, encode_cursor(*next_key) if next_key else None, response)
+
+
+@router.get("/{question_id}", dependencies=[Depends(conditional_get_async("questions"))])
+async def read_question(
+    question_id: int, db: Annotated[AsyncSession, Depends(get_async_db)]
+) -> Question:
+    """Get question by ID."""
+    question = await question_service.get_question_cached(
+        db, question_id=question_id, core="questions.detail" in settings.CORE_READ_ENDPOINTS
+    )
+    if question is None:
+        raise HTTPException(status_code=404, detail="Question not found")
+    return question
+
+
+@router.post("/", status_code=201)
+async def create_question(
+    question: QuestionCreate, db: Annotated[AsyncSession, Depends(get_async_db)]
+) -> Question:
+    """Create a new question."""
+    existing = await question_service.get_question_by_text_case_insensitive(
+        db, question.question_text
+    )
+    if existing:
+        raise HTTPException(
+            status_code=400, detail=f"Question already exists: '{existing.question_text}'"
+        )
+    try:
+        db_question = await question_service.create_question(db=db, question=question)
+    except DuplicateQuestionError:
+        # Another request stored the same text after the check above.
+        raise HTTPException(
+            status_code=400, detail=f"Question already exists: '{question.question_text}'"
+        ) from None
+    return Question.model_validate(db_question)
+
+
+@router.patch("/{question_id}", response_model=Question)
+async def update_question(
+    question_id: int,
+    question: QuestionUpdate,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> question_service.QuestionModel:
+    """Update a question by ID."""
+    existing_question = await question_service.get_question(db, question_id=question_id)
+    if not existing_question:
+        raise HTTPException(status_code=404, detail="Question not found")
+
+    if question.question_text and text_key(question.question_text) != existing_question.text_key:
+        existing_text = await question_service.get_question_by_text_case_insensitive(
+            db, question.question_text
+        )
+        if existing_text:
+            raise HTTPException(
+                status_code=400, detail=f"Question already exists: '{existing_text.question_text}'"
+            )
+
+    try:
+        updated_question = await question_service.update_question(
+            db=db, question_id=question_id, question=question
+        )
+    except DuplicateQuestionError:
+        raise HTTPException(
+            status_code=400, detail=f"Question already exists: '{question.question_text}'"
+        ) from None
+    if not updated_question:
+        raise HTTPException(status_code=404, detail="Question not found")
+    return updated_question
+
+
+@router.delete("/{question_id}", response_model=QuestionDelete)
+async def delete_question(
+    question_id: int, db: Annotated[AsyncSession, Depends(get_async_db)]
+) -> dict[str, Any]:
+    """Delete a question by ID."""
+    deleted = await question_service.delete_question(db, question_id=question_id)
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Question not found")
+    return {"id": question_id, "deleted": True}
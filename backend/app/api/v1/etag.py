@@ -0,0 +1,57 @@
+from collections.abc import Awaitable, Callable
+from typing import Annotated
+
+from app.db.database import get_async_db, get_db
+from app.services.versions import get_versions, get_versions_async
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+
+def make_etag(versions: dict[str, int]) -> str:
+    """Build a strong ETag from table versions, e.g. `"v3.17"`."""
+    return '"v' + ".".join(str(versions[name]) for name in sorted(versions)) + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check `If-None-Match` against the current ETag, using weak comparison per RFC 9110."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _respond(request: Request, response: Response, versions: dict[str, int]) -> None:
+    # no-cache lets browsers keep the body but revalidate it on every use.
+    headers = {"ETag": make_etag(versions), "Cache-Control": "no-cache"}
+    if etag_matches(request, headers["ETag"]):
+        raise HTTPException(status_code=304, headers=headers)
+    response.headers.update(headers)
+
+
+def conditional_get(*tables: str) -> Callable[..., None]:
+    """
+    Dependency answering `304 Not Modified` while `tables` are unchanged.
+
+    The check costs one primary-key lookup in `table_versions` and runs before
+    the endpoint, so a matching request never reads or serializes any rows.
+    """
+
+    def dependency(
+        request: Request, response: Response, db: Annotated[Session, Depends(get_db)]
+    ) -> None:
+        _respond(request, response, get_versions(db, tables))
+
+    return dependency
+
+
+def conditional_get_async(*tables: str) -> Callable[..., Awaitable[None]]:
+    """Async variant of `conditional_get` for endpoints running on `AsyncSession`."""
+
+    async def dependency(
+        request: Request, response: Response, db: Annotated[AsyncSession, Depends(get_async_db)]
+    ) -> None:
+        _respond(request, response, await get_versions_async(db, tables))
+
+    return dependency
@@ -0,0 +1,126 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+
+from pydantic import BaseModel
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries also expire after a fixed time to live.
+
+    Values are response schemas rather than ORM instances, so cached entries
+    never hold on to a session or a connection. An entry may be tagged with the
+    table version it was read at; reading it under another version is a miss,
+    so writes of other processes retire it as soon as their version is seen.
+    """
+
+    def __init__(
+        self, maxsize: int, ttl: float, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Create an empty cache holding at most `maxsize` entries for `ttl` seconds each."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries: OrderedDict[int, tuple[float, int | None, BaseModel]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: int, version: int | None = None) -> BaseModel | None:
+        """Return the value cached at `version` and mark it recently used, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock() or entry[1] != version:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def set(self, key: int, value: BaseModel, version: int | None = None) -> None:
+        """Store a value read at `version`, evicting the least recently used entry when full."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: int) -> None:
+        """Drop a single entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[BaseModel], bool]) -> None:
+        """Drop every entry whose value matches the predicate."""
+        with self._lock:
+            for key in [key for key, (_, _, value) in self._entries.items() if predicate(value)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return entry count and hit/miss counters."""
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class VersionedIdIndex:
+    """
+    Thread-safe LRU map from a key to a sorted array of row IDs.
+
+    Each entry remembers the table version it was loaded at and is only served
+    while that version is current, so a committed write makes the next read
+    reload it instead of waiting for a time to live.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Create an empty index holding at most `maxsize` ID arrays."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[int | None, tuple[int, Sequence[int]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: int | None, version: int) -> Sequence[int] | None:
+        """Return the IDs loaded at `version`, or None on a miss or a stale entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: int | None, version: int, ids: Sequence[int]) -> None:
+        """Store the IDs read at `version`, evicting the least recently used entry when full."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (version, ids)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return entry count and hit/miss counters."""
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
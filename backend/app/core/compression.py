@@ -0,0 +1,153 @@
+import gzip
+from collections import OrderedDict
+from http import HTTPStatus
+from types import ModuleType
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+brotli: ModuleType | None
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "text/",
+)
+
+
+def parse_accept_encoding(header: str) -> dict[str, float]:
+    """Map each coding in an `Accept-Encoding` header to its quality, 1 when unspecified."""
+    qualities = {}
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        try:
+            quality = float(params.strip().removeprefix("q=")) if params else 1.0
+        except ValueError:
+            quality = 1.0
+        if coding:
+            qualities[coding.strip().lower()] = quality
+    return qualities
+
+
+def accepts(qualities: dict[str, float], coding: str) -> bool:
+    """
+    Check whether `coding` is acceptable under parsed `Accept-Encoding` qualities.
+
+    An explicit entry wins over `*`, so `gzip;q=0, *` refuses gzip.
+    """
+    return qualities.get(coding, qualities.get("*", 0.0)) > 0
+
+
+class CompressionMiddleware:
+    """
+    Compress whole response bodies with brotli or gzip, following `Accept-Encoding`.
+
+    Bodies smaller than `minimum_size`, streamed bodies and already encoded or
+    binary responses pass through untouched. For GET responses carrying an ETag
+    the compressed bytes are kept in a small LRU keyed by URL, ETag and coding,
+    so a hot list is compressed once per version rather than once per request.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        cache_entries: int = 0,
+    ) -> None:
+        """Wrap `app`; `cache_entries=0` disables the compressed-body cache."""
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.cache_entries = cache_entries
+        self._cache: OrderedDict[tuple[str, bytes, str, str], bytes] = OrderedDict()
+
+    def choose_encoding(self, scope: Scope) -> str | None:
+        """Pick the best coding the client accepts, preferring brotli when installed."""
+        qualities = parse_accept_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if brotli is not None and accepts(qualities, "br"):
+            return "br"
+        if accepts(qualities, "gzip"):
+            return "gzip"
+        return None
+
+    def should_compress(self, status: int, headers: Headers, body: bytes) -> bool:
+        """Check whether a complete response body is worth compressing."""
+        content_type = headers.get("content-type", "")
+        return (
+            status == HTTPStatus.OK
+            and len(body) >= self.minimum_size
+            and "content-encoding" not in headers
+            and content_type.startswith(COMPRESSIBLE_TYPES)
+        )
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        """Compress `body` with the chosen coding."""
+        if encoding == "br" and brotli is not None:
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+    def compress_cached(self, scope: Scope, headers: Headers, body: bytes, encoding: str) -> bytes:
+        """Compress `body`, reusing the bytes of an earlier GET with the same URL and ETag."""
+        etag = headers.get("etag")
+        if not self.cache_entries or scope["method"] != "GET" or etag is None:
+            return self.compress(body, encoding)
+
+        key = (scope["path"], scope["query_string"], etag, encoding)
+        compressed = self._cache.get(key)
+        if compressed is None:
+            compressed = self.compress(body, encoding)
+            self._cache[key] = compressed
+            while len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+        self._cache.move_to_end(key)
+        return compressed
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the wrapped app, compressing its response when possible."""
+        encoding = self.choose_encoding(scope) if scope["type"] == "http" else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message = {}
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start["headers"])
+            if message.get("more_body", False) or not self.should_compress(
+                start["status"], headers, body
+            ):
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            compressed = self.compress_cached(scope, headers, body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            etag = headers.get("etag")
+            if etag is not None and not etag.startswith("W/"):
+                # The encoded bytes differ from the identity body, so the tag weakens.
+                headers["ETag"] = f"W/{etag}"
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
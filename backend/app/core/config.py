@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -9,13 +11,88 @@ class Settings(BaseSettings):
         default="sqlite:///./interview_app.db", description="Database connection URL"
     )
     DEBUG: bool = Field(default=False, description="Debug mode")
+    DB_CREATE_ALL: bool = Field(
+        default=False, description="Development only: create missing tables at startup"
+    )
+    SCHEMA_CHECK: Literal["off", "warn", "refuse"] = Field(
+        default="warn", description="What to do when the DB is not at the Alembic head revision"
+    )
     SECRET_KEY: str = Field(
         default="your-secret-key-here", description="Secret key for authentication"
     )
     LOG_LEVEL: str = Field(default="INFO", description="Logging level")
     LOG_FILE: str = Field(default="logs/app.log", description="Log file path")
+    LOG_ROTATE_BYTES: int = Field(
+        default=10 * 1024 * 1024, description="Rotate the log file at this size, 0 disables"
+    )
+    LOG_ROTATE_WHEN: str = Field(
+        default="", description="Rotate by time instead, e.g. 'midnight' or 'H' (stdlib `when`)"
+    )
+    LOG_BACKUP_COUNT: int = Field(default=7, description="Rotated log segments kept")
+    LOG_COMPRESS: bool = Field(
+        default=True, description="Gzip rotated log segments on a background thread"
+    )
+    LOG_QUEUE_SIZE: int = Field(
+        default=10_000, description="Log records buffered for the writer thread before dropping"
+    )
+    LOG_JSON: bool = Field(default=False, description="Write logs as JSON lines with request IDs")
+    LOG_SAMPLE_RATES: dict[str, float] = Field(
+        default={}, description="Share of records below WARNING kept per logger name, 0-1"
+    )
     APP_NAME: str = Field(default="Interview Prep App", description="Application name")
     APP_VERSION: str = Field(default="0.1.0", description="Application version")
+    DB_POOL_SIZE: int = Field(default=5, ge=1, description="Connections kept open per engine pool")
+    DB_MAX_OVERFLOW: int = Field(
+        default=10, description="Extra connections a pool may open above DB_POOL_SIZE"
+    )
+    DB_POOL_TIMEOUT: float = Field(
+        default=30.0, description="Seconds a checkout waits for a free connection"
+    )
+    DB_POOL_RECYCLE: int = Field(
+        default=1800, description="Seconds after which a connection is replaced, -1 never"
+    )
+    DB_POOL_PRE_PING: bool = Field(
+        default=True, description="Test connections on checkout and replace dead ones"
+    )
+    DB_POOL_USE_LIFO: bool = Field(
+        default=True, description="Reuse the most recently returned connection first"
+    )
+    HEALTH_READY_TTL_SECONDS: float = Field(
+        default=2.0, description="Seconds the readiness probe reuses its database check"
+    )
+    SLOW_QUERY_MS: float = Field(
+        default=100.0, description="SQL statements at least this slow are logged, 0 disables"
+    )
+    SQL_STATEMENT_BUDGET: int = Field(
+        default=10, description="Requests running more SQL statements are logged, 0 disables"
+    )
+    CACHE_MAX_ENTRIES: int = Field(
+        default=1024, description="Entries kept per in-process entity cache, 0 disables it"
+    )
+    CACHE_TTL_SECONDS: float = Field(
+        default=60.0, description="Seconds an entity cache entry stays valid"
+    )
+    SAMPLE_INDEX_MAX_ENTRIES: int = Field(
+        default=256,
+        description="Per-category question ID arrays kept for random sampling, 0 disables it",
+    )
+    VERSIONS_TTL_SECONDS: float = Field(
+        default=1.0, description="Seconds table versions for ETags are reused before re-reading"
+    )
+    CORE_READ_ENDPOINTS: set[str] = Field(
+        default={"categories.list", "categories.detail", "questions.list", "questions.detail"},
+        description="Read endpoints served by the ORM-bypass Core query path",
+    )
+    COMPRESSION_MIN_SIZE: int = Field(
+        default=1024, description="Smallest response body in bytes that gets compressed"
+    )
+    COMPRESSION_GZIP_LEVEL: int = Field(default=6, description="gzip compression level, 1-9")
+    COMPRESSION_BROTLI_QUALITY: int = Field(
+        default=4, description="brotli quality, 0-11, used when the brotli package is installed"
+    )
+    COMPRESSION_CACHE_ENTRIES: int = Field(
+        default=64, description="Compressed GET bodies kept by URL and ETag, 0 disables caching"
+    )
 
     model_config = {
         "env_file": ".env",
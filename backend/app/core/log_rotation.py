@@ -0,0 +1,107 @@
+import gzip
+import logging
+import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from pathlib import Path
+from typing import NamedTuple
+
+COMPRESSED_SUFFIX = ".gz"
+
+
+class LogRotation(NamedTuple):
+    """How the log file is rotated: by size, or by time when `when` is set."""
+
+    max_bytes: int = 0
+    when: str = ""
+    backup_count: int = 7
+    compress: bool = True
+
+
+class GzipRotator:
+    """
+    Rotator for the stdlib rotating handlers that gzips segments in the background.
+
+    Rotation itself only renames the full segment, so the handler reopens its
+    file at once; compression runs on a single worker thread, one segment at a
+    time and in rotation order. After each segment the oldest archives beyond
+    `backup_count` are deleted.
+    """
+
+    def __init__(self, base_filename: str, backup_count: int) -> None:
+        """Rotate segments of `base_filename`, keeping `backup_count` archives."""
+        self.base = Path(base_filename)
+        self.backup_count = backup_count
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-gzip")
+        self._pending: Future[None] | None = None
+
+    def namer(self, default_name: str) -> str:
+        """
+        Name rotated segments after their compressed form.
+
+        A rollover asks for names before it shifts older archives, so waiting
+        here keeps a still-compressing segment from being overwritten.
+        """
+        self.wait()
+        return default_name + COMPRESSED_SUFFIX
+
+    def rotator(self, source: str, dest: str) -> None:
+        """Move the full segment aside and queue its compression into `dest`."""
+        self.wait()
+        staging = Path(dest.removesuffix(COMPRESSED_SUFFIX))
+        Path(source).rename(staging)
+        self._pending = self._executor.submit(self.compress, staging, Path(dest))
+
+    def compress(self, staging: Path, dest: Path) -> None:
+        """Gzip `staging` into `dest`, then apply retention."""
+        partial = dest.with_name(dest.name + ".part")
+        try:
+            with staging.open("rb") as source, gzip.open(partial, "wb") as target:
+                shutil.copyfileobj(source, target)
+            partial.replace(dest)
+            staging.unlink()
+        except OSError:
+            # Keep the uncompressed segment; losing log data is worse than disk use.
+            partial.unlink(missing_ok=True)
+        self.prune()
+
+    def archives(self) -> list[Path]:
+        """Return the compressed segments, newest first."""
+        pattern = f"{self.base.name}.*{COMPRESSED_SUFFIX}"
+        return sorted(
+            self.base.parent.glob(pattern), key=lambda path: path.stat().st_mtime, reverse=True
+        )
+
+    def prune(self) -> None:
+        """Delete the oldest archives beyond the retention limit."""
+        for path in self.archives()[self.backup_count :]:
+            path.unlink(missing_ok=True)
+
+    def wait(self) -> None:
+        """Block until the queued compression has finished."""
+        if self._pending is not None:
+            self._pending.result()
+
+
+def build_file_handler(log_file: str, rotation: LogRotation) -> logging.FileHandler:
+    """Create the log file handler, rotating by time, by size, or not at all."""
+    handler: logging.FileHandler
+    if rotation.when:
+        # With compression, retention is left to the rotator, which knows the archive names.
+        handler = TimedRotatingFileHandler(
+            log_file,
+            when=rotation.when,
+            backupCount=0 if rotation.compress else rotation.backup_count,
+        )
+    elif rotation.max_bytes:
+        handler = RotatingFileHandler(
+            log_file, maxBytes=rotation.max_bytes, backupCount=rotation.backup_count
+        )
+    else:
+        return logging.FileHandler(log_file)
+
+    if rotation.compress:
+        gzip_rotator = GzipRotator(handler.baseFilename, rotation.backup_count)
+        handler.namer = gzip_rotator.namer
+        handler.rotator = gzip_rotator.rotator
+    return handler
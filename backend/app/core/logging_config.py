@@ -1,36 +1,244 @@
+import atexit
+import json
 import logging
+import queue
 import sys
+import threading
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+from app.core.log_rotation import LogRotation, build_file_handler
+from app.core.request_id import request_id
 
-def setup_logging(log_level: str = "INFO", log_file: str = "app.log") -> None:
-    """Configuring logging for the FastAPI application."""
-    formatter = logging.Formatter(
-        "%(asctime)s [%(levelname)s] %(name)s:%(lineno)d - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-    )
+PROBE_PATHS = frozenset({"/health/live", "/health/ready"})
+# uvicorn access records carry (client, method, path, http_version, status) as args.
+ACCESS_PATH_ARG = 2
+# Seconds a WARNING or worse record may wait for room in a full queue before it is dropped.
+URGENT_PUT_TIMEOUT = 0.05
 
-    root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level.upper()))
 
-    root_logger.handlers.clear()
+class ProbeAccessFilter(logging.Filter):
+    """Drop uvicorn access log lines of health probes."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Keep every record except access lines for a probe path."""
+        args = record.args
+        return not (
+            isinstance(args, tuple)
+            and len(args) > ACCESS_PATH_ARG
+            and args[ACCESS_PATH_ARG] in PROBE_PATHS
+        )
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only a share of the records below WARNING for chosen loggers.
+
+    `rates` maps a logger name to the share of its records kept, e.g.
+    `{"uvicorn.access": 0.1}` keeps every tenth access line. The most specific
+    configured name applies to child loggers too. Sampling is deterministic, so
+    a steady stream is thinned evenly rather than at random.
+    """
+
+    def __init__(self, rates: Mapping[str, float]) -> None:
+        """Sample loggers according to `rates`."""
+        super().__init__()
+        self.rates = dict(rates)
+        self._credit: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def rate_for(self, name: str) -> float:
+        """Return the share of records kept for logger `name`."""
+        while name:
+            if name in self.rates:
+                return self.rates[name]
+            name = name.rpartition(".")[0]
+        return 1.0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Keep the record when its logger has earned a whole credit."""
+        rate = self.rate_for(record.name)
+        if record.levelno >= logging.WARNING or rate >= 1:
+            return True
+        with self._lock:
+            credit = self._credit.get(record.name, 0.0) + rate
+            keep = credit >= 1
+            self._credit[record.name] = credit - 1 if keep else credit
+        return keep
+
+
+class RequestIdFilter(logging.Filter):
+    """Stamp records with the ID of the request being served, `-` outside requests."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Attach `record.request_id`."""
+        record.request_id = request_id.get() or "-"
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Render the record with its timestamp, level, logger, request ID and message."""
+        entry = {
+            "time": datetime.fromtimestamp(record.created, UTC).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "line": record.lineno,
+            "request_id": getattr(record, "request_id", "-"),
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Queue handler that never blocks the caller for long on a full queue.
+
+    Records below WARNING are dropped at once; WARNING and worse wait briefly
+    for room. The number of dropped records is reported by the next record that
+    fits into the queue.
+    """
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        """Enqueue records into `log_queue`."""
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._unreported = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put the record into the queue, dropping it if there is no room."""
+        try:
+            if record.levelno >= logging.WARNING:
+                self.queue.put(record, timeout=URGENT_PUT_TIMEOUT)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            self._unreported += 1
+            return
+        if self._unreported:
+            notice = logging.makeLogRecord(
+                {
+                    "name": __name__,
+                    "levelno": logging.WARNING,
+                    "levelname": "WARNING",
+                    "msg": f"Log queue full, dropped {self._unreported} records",
+                }
+            )
+            try:
+                self.queue.put_nowait(notice)
+            except queue.Full:
+                return
+            self._unreported = 0
+
+
+class LoggingPipeline:
+    """The running queue handler and listener installed by `setup_logging`."""
+
+    def __init__(self) -> None:
+        """Start with nothing installed."""
+        self.handler: DroppingQueueHandler | None = None
+        self.listener: QueueListener | None = None
+
+    def install(self, handler: DroppingQueueHandler, listener: QueueListener) -> None:
+        """Replace the running pipeline with a new one and start it."""
+        self.stop()
+        self.handler, self.listener = handler, listener
+        listener.start()
+
+    def stop(self) -> None:
+        """Flush queued records and stop the listener thread."""
+        if self.listener is not None:
+            self.listener.stop()
+            for target in self.listener.handlers:
+                target.close()
+        self.handler = self.listener = None
+
+    def dropped(self) -> int:
+        """Return how many records were dropped because the queue was full."""
+        return self.handler.dropped if self.handler is not None else 0
+
+
+UVICORN_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+pipeline = LoggingPipeline()
+atexit.register(pipeline.stop)
+
+
+def setup_logging(
+    log_level: str = "INFO",
+    log_file: str = "app.log",
+    *,
+    rotation: LogRotation | None = None,
+    queue_size: int = 10_000,
+    json_format: bool = False,
+    sample_rates: Mapping[str, float] | None = None,
+) -> None:
+    """
+    Configuring logging for the FastAPI application.
+
+    Loggers only put records into a bounded queue; a listener thread writes
+    them to stdout and the log file, so slow disks never stall a request. The
+    file is rotated and its old segments compressed as `rotation` describes.
+    """
+    level = getattr(logging, log_level.upper())
+    formatter: logging.Formatter = (
+        JsonFormatter()
+        if json_format
+        else logging.Formatter(
+            "%(asctime)s [%(levelname)s] %(name)s:%(lineno)d - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+    )
 
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    console_handler.setLevel(getattr(logging, log_level.upper()))
-    root_logger.addHandler(console_handler)
+    console_handler.setLevel(level)
 
     log_path = Path(log_file)
     log_path.parent.mkdir(exist_ok=True)
 
-    file_handler = logging.FileHandler(log_path)
+    file_handler = build_file_handler(str(log_path), rotation or LogRotation())
     file_handler.setFormatter(formatter)
     file_handler.setLevel(logging.DEBUG)
-    root_logger.addHandler(file_handler)
+
+    queue_handler = DroppingQueueHandler(queue.Queue(maxsize=queue_size))
+    # Filters run on the logging thread, where the request ID context is still set.
+    queue_handler.addFilter(RequestIdFilter())
+    if sample_rates:
+        queue_handler.addFilter(SamplingFilter(sample_rates))
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    root_logger.handlers.clear()
+    root_logger.addHandler(queue_handler)
+    pipeline.install(
+        queue_handler,
+        QueueListener(
+            queue_handler.queue, console_handler, file_handler, respect_handler_level=True
+        ),
+    )
 
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.pool").setLevel(logging.WARNING)
 
-    logging.getLogger("uvicorn.access").setLevel(logging.INFO)
+    # uvicorn gives its loggers their own stream handlers and stops propagation; route
+    # them through the queue instead, so they are written off-thread and sampled too.
+    for name in UVICORN_LOGGERS:
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers.clear()
+        uvicorn_logger.propagate = True
+
+    access_logger = logging.getLogger("uvicorn.access")
+    access_logger.setLevel(logging.INFO)
+    if not any(isinstance(item, ProbeAccessFilter) for item in access_logger.filters):
+        access_logger.addFilter(ProbeAccessFilter())
 
 
 def get_logger(name: str) -> logging.Logger:
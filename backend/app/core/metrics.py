@@ -0,0 +1,319 @@
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from http import HTTPStatus
+from typing import TypeVar
+
+from app.core.logging_config import get_logger
+from starlette.routing import Route, replace_params
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = get_logger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55)
+UNMATCHED_ROUTE = "<unmatched>"
+
+Labels = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format_labels(names: Labels, values: Labels, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric:
+    """A named family of samples, one per combination of label values."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Labels = ()) -> None:
+        """Describe the metric; samples are created on first use."""
+        self.name = name
+        self.documentation = documentation
+        self.label_names = labels
+        self._lock = threading.Lock()
+
+    def samples(self) -> Iterator[str]:
+        """Yield the sample lines of the exposition format."""
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """Render the metric with its HELP and TYPE lines."""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """Monotonically increasing value."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Labels = ()) -> None:
+        """Create the counter."""
+        super().__init__(name, documentation, labels)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1.0) -> None:
+        """Add `amount` to the sample with `labels`."""
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, labels: Labels = ()) -> float:
+        """Return the sample with `labels`, 0 when it was never touched."""
+        with self._lock:
+            return self._values.get(labels, 0.0)
+
+    def samples(self) -> Iterator[str]:
+        """Yield one line per label combination."""
+        for labels, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.label_names, labels)} {value}"
+
+
+class Gauge(Counter):
+    """Value that goes up and down."""
+
+    kind = "gauge"
+
+    def set(self, labels: Labels, value: float) -> None:
+        """Replace the sample with `labels`."""
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(Metric):
+    """Observations counted into cumulative buckets, with their sum and count."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Labels = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        """Create the histogram with upper bounds `buckets`."""
+        super().__init__(name, documentation, labels)
+        self.buckets = buckets
+        self._values: dict[Labels, list[float]] = {}
+
+    def observe(self, labels: Labels, value: float) -> None:
+        """Count one observation of `value`."""
+        with self._lock:
+            # Per-bucket counts followed by the sum; cumulated when rendering.
+            counts = self._values.setdefault(labels, [0.0] * (len(self.buckets) + 2))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            else:
+                counts[len(self.buckets)] += 1
+            counts[-1] += value
+
+    def samples(self) -> Iterator[str]:
+        """Yield the bucket, sum and count lines of each label combination."""
+        for labels, counts in self._values.items():
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, "+Inf"), counts, strict=False):
+                cumulative += count
+                bucket = _format_labels(self.label_names, labels, f'le="{bound}"')
+                yield f"{self.name}_bucket{bucket} {cumulative}"
+            label_text = _format_labels(self.label_names, labels)
+            yield f"{self.name}_sum{label_text} {counts[-1]}"
+            yield f"{self.name}_count{label_text} {cumulative}"
+
+
+MetricT = TypeVar("MetricT", bound=Metric)
+
+
+class Registry:
+    """Metrics rendered together, plus collectors refreshing gauges at scrape time."""
+
+    def __init__(self) -> None:
+        """Create an empty registry."""
+        self._metrics: list[Metric] = []
+        self._collectors: list[Callable[[], None]] = []
+
+    def register(self, metric: MetricT) -> MetricT:
+        """Add `metric` and return it."""
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Run `collector` before every scrape."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        for collector in self._collectors:
+            collector()
+        return "\n".join(metric.render() for metric in self._metrics) + "\n"
+
+
+registry = Registry()
+
+REQUESTS_IN_FLIGHT = registry.register(
+    Gauge("http_requests_in_flight", "HTTP requests being served.", ("method",))
+)
+REQUEST_DURATION = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency by route template.",
+        ("method", "route", "status"),
+    )
+)
+DB_STATEMENTS = registry.register(
+    Counter("db_statements_total", "SQL statements executed, by route.", ("route",))
+)
+DB_STATEMENT_SECONDS = registry.register(
+    Counter("db_statement_seconds_total", "Time spent executing SQL, by route.", ("route",))
+)
+REQUEST_DB_DURATION = registry.register(
+    Histogram(
+        "http_request_db_seconds",
+        "Time a request spent executing SQL.",
+        ("route",),
+        FAST_BUCKETS,
+    )
+)
+REQUEST_DB_STATEMENTS = registry.register(
+    Histogram(
+        "http_request_db_statements",
+        "SQL statements executed by a request.",
+        ("route",),
+        STATEMENT_BUCKETS,
+    )
+)
+SERIALIZATION_DURATION = registry.register(
+    Histogram(
+        "http_response_serialization_seconds",
+        "Time a request spent encoding its response body.",
+        ("route",),
+        FAST_BUCKETS,
+    )
+)
+
+
+class RequestMetrics:
+    """Database and serialization time accumulated by the current request."""
+
+    __slots__ = ("scope", "serialization_seconds", "sql_seconds", "sql_statements")
+
+    def __init__(self, scope: Scope) -> None:
+        """Start with nothing recorded for the request described by `scope`."""
+        self.scope = scope
+        self.sql_statements = 0
+        self.sql_seconds = 0.0
+        self.serialization_seconds = 0.0
+
+
+current_request: ContextVar[RequestMetrics | None] = ContextVar("current_request", default=None)
+
+
+def current_route() -> str | None:
+    """Return the route template of the request being served, None outside requests."""
+    request = current_request.get()
+    return route_template(request.scope) if request is not None else None
+
+
+def record_statement(seconds: float) -> None:
+    """Attribute one SQL statement to the current request, if any."""
+    request = current_request.get()
+    if request is not None:
+        request.sql_statements += 1
+        request.sql_seconds += seconds
+
+
+@contextmanager
+def serialization_timer() -> Iterator[None]:
+    """Attribute the time spent in the block to response serialization."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        request = current_request.get()
+        if request is not None:
+            request.serialization_seconds += time.perf_counter() - start
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Return the path template of the matched route, keeping label values bounded.
+
+    Included routers keep their own routes, so the leaf route only knows its own
+    path; the router prefix is recovered by stripping the leaf's concrete path
+    from the request path.
+    """
+    route = scope.get("route")
+    if not isinstance(route, Route):
+        return UNMATCHED_ROUTE
+    concrete, _ = replace_params(
+        route.path_format, route.param_convertors, dict(scope.get("path_params", {}))
+    )
+    prefix = scope["path"].removesuffix(concrete) if scope["path"].endswith(concrete) else ""
+    return prefix + route.path_format
+
+
+class MetricsMiddleware:
+    """Record latency, in-flight requests, SQL and serialization time of each HTTP request."""
+
+    def __init__(self, app: ASGIApp, statement_budget: int = 0) -> None:
+        """Wrap `app`; requests running more than `statement_budget` statements are logged."""
+        self.app = app
+        self.statement_budget = statement_budget
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the wrapped app, measuring the request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = HTTPStatus.INTERNAL_SERVER_ERROR.value
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        request = RequestMetrics(scope)
+        token = current_request.set(request)
+        REQUESTS_IN_FLIGHT.inc((method,))
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - start
+            REQUESTS_IN_FLIGHT.inc((method,), -1)
+            current_request.reset(token)
+            route = route_template(scope)
+            REQUEST_DURATION.observe((method, route, str(status)), duration)
+            DB_STATEMENTS.inc((route,), request.sql_statements)
+            DB_STATEMENT_SECONDS.inc((route,), request.sql_seconds)
+            REQUEST_DB_DURATION.observe((route,), request.sql_seconds)
+            REQUEST_DB_STATEMENTS.observe((route,), request.sql_statements)
+            if self.statement_budget and request.sql_statements > self.statement_budget:
+                logger.warning(
+                    "%s %s ran %d SQL statements in %.1f ms, over the budget of %d",
+                    method,
+                    route,
+                    request.sql_statements,
+                    request.sql_seconds * 1000,
+                    self.statement_budget,
+                )
+            if request.serialization_seconds:
+                SERIALIZATION_DURATION.observe((route,), request.serialization_seconds)
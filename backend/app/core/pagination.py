@@ -0,0 +1,37 @@
+import base64
+import binascii
+import json
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(*key: int) -> str:
+    """Encode a keyset position into an opaque URL-safe cursor."""
+    raw = json.dumps(key, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, size: int) -> tuple[int, ...]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed or does not hold `size` integers.
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        msg = "Invalid cursor"
+        raise ValueError(msg) from exc
+
+    if (
+        not isinstance(key, list)
+        or len(key) != size
+        or not all(isinstance(value, int) and not isinstance(value, bool) for value in key)
+    ):
+        msg = "Invalid cursor"
+        raise ValueError(msg)
+
+    return tuple(key)
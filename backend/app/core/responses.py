@@ -0,0 +1,40 @@
+from http import HTTPStatus
+from typing import Any
+
+from app.core.metrics import serialization_timer
+from fastapi.responses import JSONResponse, Response
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered by pydantic-core in Rust instead of `json.dumps`."""
+
+    def render(self, content: Any) -> bytes:  # noqa: ANN401
+        """Encode `content` as compact UTF-8 JSON."""
+        with serialization_timer():
+            return to_json(content)
+
+
+def page_body(items_json: bytes, next_cursor: str | None) -> bytes:
+    """Wrap already serialized list items into a `{"items": ..., "next_cursor": ...}` page."""
+    return b'{"items":' + items_json + b',"next_cursor":' + to_json(next_cursor) + b"}"
+
+
+def raw_json_response(body: bytes, response: Response) -> Response:
+    """
+    Send an already serialized JSON body.
+
+    Returning a `Response` skips FastAPI's re-validation of the return value, so
+    headers set by dependencies on the injected `response` are copied explicitly.
+    """
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=dict(response.headers),
+        status_code=response.status_code or HTTPStatus.OK,
+    )
+
+
+def page_response(items_json: bytes, next_cursor: str | None, response: Response) -> Response:
+    """Send a page of already serialized list items, see `page_body`."""
+    return raw_json_response(page_body(items_json, next_cursor), response)
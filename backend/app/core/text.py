@@ -0,0 +1,16 @@
+import hashlib
+import re
+import unicodedata
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """NFKC-normalize, casefold and collapse whitespace runs to single spaces."""
+    normalized = unicodedata.normalize("NFKC", text).casefold()
+    return WHITESPACE_PATTERN.sub(" ", normalized).strip()
+
+
+def text_key(text: str) -> str:
+    """Fixed-width hash of the normalized text, used for indexed duplicate checks."""
+    return hashlib.sha256(normalize_text(text).encode()).hexdigest()
@@ -1,11 +1,26 @@
-from collections.abc import Generator
+import re
+import time
+from collections.abc import AsyncGenerator, Generator, Mapping, Sequence
+from functools import cache
 from typing import Any
 
 from app.core.config import settings
-from sqlalchemy import MetaData, create_engine
+from app.core.logging_config import get_logger
+from app.core.metrics import current_route, record_statement
+from app.db.pool import pool_options
+from sqlalchemy import Connection, MetaData, create_engine, event, make_url
+from sqlalchemy.engine import Engine, ExceptionContext, ExecutionContext
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 from sqlalchemy.orm.session import Session
 
+logger = get_logger(__name__)
+
 naming_convention = {
     "ix": "ix_%(column_0_label)s",
     "uq": "uq_%(table_name)s_%(column_0_name)s",
@@ -14,12 +29,133 @@ naming_convention = {
     "pk": "pk_%(table_name)s",
 }
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    **({"connect_args": {"check_same_thread": False}} if "sqlite" in settings.DATABASE_URL else {}),
-)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def is_async_url(url: str) -> bool:
+    """Check whether the URL selects an async driver (asyncpg, aiosqlite)."""
+    return make_url(url).get_dialect().is_async
+
+
+def sync_database_url(url: str) -> str:
+    """Return the URL with an async driver replaced by the dialect's default sync driver."""
+    parsed = make_url(url)
+    if not parsed.get_dialect().is_async:
+        return url
+    return parsed.set(drivername=parsed.get_backend_name()).render_as_string(hide_password=False)
+
+
+connect_args = {"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
+
+
+def engine_options(url: str) -> dict[str, Any]:
+    """Collect `create_engine` arguments for `url` from the settings."""
+    return {
+        **({"connect_args": connect_args} if connect_args else {}),
+        **pool_options(
+            url,
+            size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            timeout=settings.DB_POOL_TIMEOUT,
+            recycle=settings.DB_POOL_RECYCLE,
+            pre_ping=settings.DB_POOL_PRE_PING,
+            use_lifo=settings.DB_POOL_USE_LIFO,
+        ),
+    }
+
+
+SYNC_DATABASE_URL = sync_database_url(settings.DATABASE_URL)
+ASYNC_DB = is_async_url(settings.DATABASE_URL)
+
+
+@cache
+def get_engine() -> Engine:
+    """
+    Return the sync engine, creating it on first use.
+
+    Importing this module neither loads the DBAPI driver nor builds a pool, so
+    migrations and scripts that only need the models stay cheap to start.
+    """
+    return create_engine(SYNC_DATABASE_URL, **engine_options(SYNC_DATABASE_URL))
+
+
+@cache
+def get_async_engine() -> AsyncEngine | None:
+    """Return the async engine, created on first use; None without an async driver."""
+    if not ASYNC_DB:
+        return None
+    return create_async_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
+
+
+QUERY_START = "query_start"
+MAX_LOGGED_SQL = 1000
+
+_PLACEHOLDER = r"(?:\?|%\(\w+\)s|%s|\$\d+|:\w+)"
+_PLACEHOLDER_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})+\s*\)")
+_REPEATED_ROWS = re.compile(r"(\(\.\.\.\))(?:\s*,\s*\(\.\.\.\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Collapse a statement into a stable shape for logs.
+
+    Whitespace is squeezed, placeholder lists such as expanded `IN` lists and
+    multi-row `VALUES` become `(...)`, so the same query logs the same way
+    whatever its parameters.
+    """
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _PLACEHOLDER_LIST.sub("(...)", normalized)
+    normalized = _REPEATED_ROWS.sub(r"\1", normalized)
+    return normalized[:MAX_LOGGED_SQL]
+
+
+def parameter_count(parameters: Sequence[Any] | Mapping[str, Any], *, executemany: bool) -> int:
+    """Count the values bound to a statement, across all rows of an executemany."""
+    if executemany:
+        return sum(len(row) for row in parameters)
+    return len(parameters)
+
+
+def _start_statement(conn: Connection, *_args: Any) -> None:  # noqa: ANN401
+    """Remember when a statement was sent to the database."""
+    conn.info.setdefault(QUERY_START, []).append(time.perf_counter())
+
+
+def _end_statement(
+    conn: Connection,
+    _cursor: Any,  # noqa: ANN401
+    statement: str,
+    parameters: Sequence[Any] | Mapping[str, Any],
+    _context: ExecutionContext,
+    executemany: bool,  # noqa: FBT001
+) -> None:
+    """Attribute the statement's time to the current request and log it when slow."""
+    seconds = time.perf_counter() - conn.info[QUERY_START].pop()
+    record_statement(seconds)
+    if settings.SLOW_QUERY_MS and seconds * 1000 >= settings.SLOW_QUERY_MS:
+        logger.warning(
+            "Slow query %.1f ms route=%s params=%d: %s",
+            seconds * 1000,
+            current_route() or "-",
+            parameter_count(parameters, executemany=executemany),
+            normalize_sql(statement),
+        )
+
+
+def _discard_statement(context: ExceptionContext) -> None:
+    """Drop the start time of a statement that failed."""
+    if context.connection is not None and context.connection.info.get(QUERY_START):
+        context.connection.info[QUERY_START].pop()
+
+
+# Listening on the Engine class covers the async engine's sync core and test engines alike.
+event.listen(Engine, "before_cursor_execute", _start_statement)
+event.listen(Engine, "after_cursor_execute", _end_statement)
+event.listen(Engine, "handle_error", _discard_statement)
+
+# Sessions are bound to the engines when opened, so the engines are only built on demand.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
 
 metadata_obj = MetaData(naming_convention=naming_convention)
 
@@ -32,8 +168,14 @@ class Base(DeclarativeBase):
 
 def get_db() -> Generator[Session, Any]:
     """Dependency to get DB session."""
-    db = SessionLocal()
+    db = SessionLocal(bind=get_engine())
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, Any]:
+    """Dependency to get an async DB session when an async driver is configured."""
+    async with AsyncSessionLocal(bind=get_async_engine()) as db:
+        yield db
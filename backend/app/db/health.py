@@ -0,0 +1,74 @@
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from app.core.logging_config import get_logger
+from sqlalchemy import Connection, Engine, text
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
+
+logger = get_logger(__name__)
+
+# Schema statuses of `app.db.schema.schema_status` that leave a worker unready.
+UNREADY_SCHEMA = frozenset({"behind", "unversioned"})
+
+
+class ReadinessCheck:
+    """
+    `SELECT 1` against an engine, with the outcome reused for a short time to live.
+
+    Concurrent probes wait for the single check in flight instead of starting
+    their own, so any number of probes costs at most one query per TTL. With
+    `schema_status`, the same connection also reports the schema revision.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        ttl: float,
+        schema_status: Callable[[Connection], str] | None = None,
+    ) -> None:
+        """Check `engine`, reusing each outcome for `ttl` seconds."""
+        self.engine = engine
+        self.ttl = ttl
+        self.schema_status = schema_status
+        self._lock = threading.Lock()
+        self._expires_at = 0.0
+        self._result: dict[str, Any] = {}
+
+    def _ping(self) -> dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            with self.engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+                schema = self.schema_status(connection) if self.schema_status else None
+        except SQLAlchemyError as exc:
+            logger.warning("Readiness check failed: %s", exc)
+            return {"database": "unavailable", "error": type(exc).__name__}
+        latency_ms = round((time.perf_counter() - start) * 1000, 3)
+        return {"database": "ok", "latency_ms": latency_ms} | ({"schema": schema} if schema else {})
+
+    def _refresh(self) -> dict[str, Any]:
+        with self._lock:
+            if self._expires_at <= time.monotonic():
+                self._result = self._ping()
+                self._expires_at = time.monotonic() + self.ttl
+            return self._result
+
+    async def result(self) -> dict[str, Any]:
+        """Return the latest outcome, checking the database when it has expired."""
+        if self._expires_at > time.monotonic():
+            return self._result
+        return await run_in_threadpool(self._refresh)
+
+    @staticmethod
+    def is_ready(result: dict[str, Any], *, require_schema: bool = False) -> bool:
+        """Tell whether an outcome is ready; with `require_schema`, a missing migration is not."""
+        if result["database"] != "ok":
+            return False
+        return not (require_schema and result.get("schema") in UNREADY_SCHEMA)
+
+    def clear(self) -> None:
+        """Forget the cached outcome."""
+        self._expires_at = 0.0
@@ -1,12 +1,21 @@
 from typing import TYPE_CHECKING
 
 from app.db.database import Base
-from sqlalchemy import String
+from sqlalchemy import DDL, String, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
     from app.db.models.question import Question
 
+NAME_INDEX = "uq_categories_name_ci"
+
+POSTGRESQL_NAME_INDEX_DDL = (
+    f"CREATE UNIQUE INDEX IF NOT EXISTS {NAME_INDEX} ON categories (lower(name))"
+)
+SQLITE_NAME_INDEX_DDL = (
+    f"CREATE UNIQUE INDEX IF NOT EXISTS {NAME_INDEX} ON categories (name COLLATE NOCASE)"
+)
+
 
 class Category(Base):
     """Category model."""
@@ -15,7 +24,20 @@ class Category(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String, unique=True, index=True, nullable=False)
+    # Maintained by the question services in the writing transaction, see `adjust_question_counts`.
+    question_count: Mapped[int] = mapped_column(default=0, server_default="0", nullable=False)
 
     questions: Mapped[list["Question"]] = relationship(
         "Question", back_populates="category", cascade="all, delete", passive_deletes=True
     )
+
+
+# Case-insensitive uniqueness needs a dialect-specific index that the ORM cannot declare.
+event.listen(
+    Category.__table__,
+    "after_create",
+    DDL(POSTGRESQL_NAME_INDEX_DDL).execute_if(dialect="postgresql"),
+)
+event.listen(
+    Category.__table__, "after_create", DDL(SQLITE_NAME_INDEX_DDL).execute_if(dialect="sqlite")
+)
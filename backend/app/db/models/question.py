@@ -1,16 +1,29 @@
+from app.core.text import text_key
 from app.db.database import Base
-from sqlalchemy import ForeignKey, Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from app.db.search import register_search_index
+from sqlalchemy import ForeignKey, Index, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 
 class Question(Base):
     """Question model."""
 
     __tablename__ = "questions"
+    __table_args__ = (Index("ix_questions_category_id_id", "category_id", "id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     question_text: Mapped[str] = mapped_column(Text, nullable=False)
+    text_key: Mapped[str] = mapped_column(String(64), unique=True, index=True, nullable=False)
     answer_text: Mapped[str] = mapped_column(Text, nullable=False)
     category_id: Mapped[int] = mapped_column(ForeignKey("categories.id", ondelete="CASCADE"))
 
     category = relationship("Category", back_populates="questions")
+
+    @validates("question_text")
+    def _sync_text_key(self, _key: str, value: str) -> str:
+        """Keep the normalized duplicate key in step with the question text."""
+        self.text_key = text_key(value)
+        return value
+
+
+register_search_index(Question.__table__)
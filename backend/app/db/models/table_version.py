@@ -0,0 +1,24 @@
+from typing import Any
+
+from app.db.database import Base
+from sqlalchemy import BigInteger, Connection, String, Table, event
+from sqlalchemy.orm import Mapped, mapped_column
+
+VERSIONED_TABLES = ("categories", "questions")
+
+
+class TableVersion(Base):
+    """Change counter of a table, bumped by every transaction that writes to it."""
+
+    __tablename__ = "table_versions"
+
+    table_name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
+@event.listens_for(TableVersion.__table__, "after_create")
+def _seed_versions(target: Table, connection: Connection, **_kwargs: Any) -> None:  # noqa: ANN401
+    """Start every versioned table at version 0."""
+    connection.execute(
+        target.insert(), [{"table_name": name, "version": 0} for name in VERSIONED_TABLES]
+    )
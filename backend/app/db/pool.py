@@ -0,0 +1,142 @@
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import URL, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, PoolProxiedConnection, QueuePool
+
+
+class PoolMetrics:
+    """Counters for connection checkouts of one pool class, shared by its re-created pools."""
+
+    def __init__(self) -> None:
+        """Start with all counters at zero."""
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, seconds: float, *, timed_out: bool = False) -> None:
+        """Record one checkout that waited `seconds` for a connection."""
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def reset(self) -> None:
+        """Set all counters back to zero."""
+        with self._lock:
+            self.checkouts = self.timeouts = 0
+            self.wait_seconds_total = self.wait_seconds_max = 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """Return the counters."""
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_max": self.wait_seconds_max,
+            }
+
+
+class TimedQueuePool(QueuePool):
+    """
+    QueuePool that records how long each checkout waits for a connection.
+
+    The wait covers queueing for a free connection, opening a new one within
+    the overflow and the pre-ping, i.e. everything a request spends before it
+    can send its first statement.
+    """
+
+    metrics = PoolMetrics()
+
+    @property
+    def max_overflow(self) -> int:
+        """Connections the pool may open above its size."""
+        return self._max_overflow
+
+    def connect(self) -> PoolProxiedConnection:
+        """Check out a connection, timing the wait."""
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.metrics.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.metrics.record(time.perf_counter() - start)
+        return connection
+
+
+class TimedAsyncQueuePool(TimedQueuePool, AsyncAdaptedQueuePool):
+    """TimedQueuePool for async drivers."""
+
+    metrics = PoolMetrics()
+
+
+def pool_options(
+    url: str | URL,
+    *,
+    size: int,
+    max_overflow: int,
+    timeout: float,
+    recycle: int,
+    pre_ping: bool,
+    use_lifo: bool,
+) -> dict[str, Any]:
+    """
+    Build `create_engine` pool arguments for `url`.
+
+    Only URLs whose dialect defaults to a queue pool get the sizing options and
+    the timed pool; in-memory SQLite keeps its single-connection pool.
+    """
+    parsed = make_url(url)
+    default_pool = parsed.get_dialect().get_pool_class(parsed)
+    if not issubclass(default_pool, QueuePool):
+        return {"pool_pre_ping": pre_ping}
+    return {
+        "poolclass": (
+            TimedAsyncQueuePool
+            if issubclass(default_pool, AsyncAdaptedQueuePool)
+            else TimedQueuePool
+        ),
+        "pool_size": size,
+        "max_overflow": max_overflow,
+        "pool_timeout": timeout,
+        "pool_recycle": recycle,
+        "pool_pre_ping": pre_ping,
+        "pool_use_lifo": use_lifo,
+    }
+
+
+def pool_saturation(pool: Pool) -> float | None:
+    """
+    Return the share of the pool's capacity checked out, None for unbounded pools.
+
+    SQLAlchemy reads `pool_size=0` as no limit and `max_overflow=-1` as unlimited overflow.
+    """
+    if not isinstance(pool, TimedQueuePool) or pool.max_overflow < 0 or pool.size() == 0:
+        return None
+    return pool.checkedout() / (pool.size() + pool.max_overflow)
+
+
+def pool_stats(pool: Pool) -> dict[str, Any]:
+    """Return the live state of `pool` together with its checkout counters."""
+    stats: dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats |= {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "timeout": pool.timeout(),
+        }
+    if isinstance(pool, TimedQueuePool):
+        stats["max_overflow"] = pool.max_overflow
+        stats |= pool.metrics.stats()
+    return stats
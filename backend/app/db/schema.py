@@ -0,0 +1,148 @@
+from functools import cache
+from pathlib import Path
+from typing import Literal
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from app.core.logging_config import get_logger
+from app.db.database import Base
+from app.db.models.category import Category  # noqa: F401
+from app.db.models.question import Question  # noqa: F401
+from app.db.models.table_version import TableVersion  # noqa: F401
+from sqlalchemy import Connection, Engine, inspect, text
+from sqlalchemy.exc import DBAPIError
+
+logger = get_logger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "migrations"
+
+# The schema the code before the migration series created with `create_all`, unstamped.
+LEGACY_REVISION = "1ef649ed4eb1"
+
+# Any constant shared by all deployments; the lock only has to be the same for every runner.
+MIGRATION_LOCK_KEY = 0x1E7BC0DE
+
+SchemaCheckMode = Literal["off", "warn", "refuse"]
+SchemaStatus = Literal["current", "ahead", "behind", "unversioned"]
+
+
+class SchemaMismatchError(RuntimeError):
+    """The database is not at the Alembic head revision."""
+
+
+@cache
+def _script_directory(migrations_dir: Path) -> ScriptDirectory:
+    return ScriptDirectory(str(migrations_dir))
+
+
+def head_revisions(migrations_dir: Path = MIGRATIONS_DIR) -> set[str]:
+    """Read the head revisions from the migration scripts, without touching the database."""
+    return set(_script_directory(migrations_dir).get_heads())
+
+
+def stamped_revisions(connection: Connection) -> set[str]:
+    """Read the revisions stamped in `alembic_version` over an open connection."""
+    return set(connection.execute(text("SELECT version_num FROM alembic_version")).scalars())
+
+
+def current_revisions(engine: Engine) -> set[str]:
+    """Read the revisions stamped in `alembic_version`, empty when the table is missing."""
+    try:
+        with engine.connect() as connection:
+            return stamped_revisions(connection)
+    except DBAPIError:
+        return set()
+
+
+def schema_status(connection: Connection, migrations_dir: Path = MIGRATIONS_DIR) -> SchemaStatus:
+    """
+    Place the database revision relative to the migration head of this build.
+
+    `behind` means the database is at a revision these scripts know but not at
+    their head, so a migration is missing. `ahead` means it is stamped with a
+    revision these scripts do not know: a newer build migrated it, which the
+    old workers of a rolling update must tolerate until they are replaced.
+    """
+    try:
+        current = stamped_revisions(connection)
+    except DBAPIError:
+        current = set()
+    script = _script_directory(migrations_dir)
+    if current == set(script.get_heads()):
+        return "current"
+    known = {revision.revision for revision in script.walk_revisions()}
+    if current and not current <= known:
+        return "ahead"
+    return "behind" if current else "unversioned"
+
+
+def check_schema(engine: Engine, mode: SchemaCheckMode = "warn") -> None:
+    """
+    Compare the database revision with the migration head in a single query.
+
+    With `refuse`, a mismatch raises SchemaMismatchError so the worker does not
+    start against a schema it was not written for; with `warn` it is logged.
+    """
+    if mode == "off":
+        return
+    expected, current = head_revisions(), current_revisions(engine)
+    if current == expected:
+        logger.info("Database schema at revision %s", ", ".join(sorted(current)))
+        return
+
+    message = (
+        f"Database schema revision {sorted(current) or 'unversioned'} does not match "
+        f"migration head {sorted(expected)}; run `alembic upgrade head`"
+    )
+    if mode == "refuse":
+        raise SchemaMismatchError(message)
+    logger.warning(message)
+
+
+def lock_migrations(connection: Connection) -> None:
+    """
+    Serialize migration runs on PostgreSQL until the connection's transaction ends.
+
+    Pods of a rollout migrate at the same time: the first holds the lock, the
+    others then find the schema already at head.
+    """
+    if connection.dialect.name == "postgresql":
+        connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+
+
+def upgrade_schema(engine: Engine) -> None:
+    """
+    Run `alembic upgrade head` on `engine`, adopting databases created before migrations.
+
+    An unversioned database that already has the tables was built by the old
+    `create_all` start-up and matches LEGACY_REVISION, so it is stamped with
+    that revision first and then migrated like any other.
+    """
+    with engine.begin() as connection:
+        lock_migrations(connection)
+        config = Config()
+        config.set_main_option("script_location", str(MIGRATIONS_DIR))
+        config.attributes["connection"] = connection
+        unversioned = not MigrationContext.configure(connection).get_current_heads()
+        if unversioned and inspect(connection).has_table("categories"):
+            logger.warning("Adopting an unversioned database at revision %s", LEGACY_REVISION)
+            command.stamp(config, LEGACY_REVISION)
+        command.upgrade(config, "head")
+
+
+def create_schema(engine: Engine) -> None:
+    """
+    Create the schema of a development database.
+
+    An empty database gets every table from the models and is stamped with the
+    migration head. A database that already has tables is migrated instead,
+    since `create_all` never adds columns to existing tables.
+    """
+    if set(inspect(engine).get_table_names()).isdisjoint(Base.metadata.tables):
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as connection:
+            MigrationContext.configure(connection).stamp(_script_directory(MIGRATIONS_DIR), "heads")
+        return
+    upgrade_schema(engine)
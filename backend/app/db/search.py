@@ -0,0 +1,61 @@
+from sqlalchemy import DDL, FromClause, event
+
+FTS_TABLE = "questions_fts"
+SEARCH_REGCONFIG = "'simple'::regconfig"
+
+POSTGRESQL_SEARCH_DDL = (
+    (
+        "CREATE INDEX IF NOT EXISTS ix_questions_search ON questions USING gin "
+        "(to_tsvector('simple'::regconfig, question_text || ' ' || answer_text))"
+    ),
+)
+
+SQLITE_SEARCH_DDL = (
+    (
+        "CREATE VIRTUAL TABLE IF NOT EXISTS questions_fts USING fts5("
+        "question_text, answer_text, content='questions', content_rowid='id', "
+        "tokenize='unicode61 remove_diacritics 2')"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS questions_fts_ai AFTER INSERT ON questions BEGIN "
+        "INSERT INTO questions_fts(rowid, question_text, answer_text) "
+        "VALUES (new.id, new.question_text, new.answer_text); END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS questions_fts_ad AFTER DELETE ON questions BEGIN "
+        "INSERT INTO questions_fts(questions_fts, rowid, question_text, answer_text) "
+        "VALUES ('delete', old.id, old.question_text, old.answer_text); END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS questions_fts_au AFTER UPDATE ON questions BEGIN "
+        "INSERT INTO questions_fts(questions_fts, rowid, question_text, answer_text) "
+        "VALUES ('delete', old.id, old.question_text, old.answer_text); "
+        "INSERT INTO questions_fts(rowid, question_text, answer_text) "
+        "VALUES (new.id, new.question_text, new.answer_text); END"
+    ),
+)
+
+SQLITE_SEARCH_REBUILD = "INSERT INTO questions_fts(questions_fts) VALUES ('rebuild')"
+
+SQLITE_SEARCH_DROP_DDL = (
+    "DROP TRIGGER IF EXISTS questions_fts_au",
+    "DROP TRIGGER IF EXISTS questions_fts_ad",
+    "DROP TRIGGER IF EXISTS questions_fts_ai",
+    "DROP TABLE IF EXISTS questions_fts",
+)
+
+
+def register_search_index(table: FromClause) -> None:
+    """
+    Attach the full-text index DDL to the questions table.
+
+    PostgreSQL gets a GIN expression index over `to_tsvector`, SQLite gets an
+    external-content FTS5 table kept in sync by triggers. Both are maintained by
+    the database itself, so every write path stays indexed without service code.
+    """
+    for statement in POSTGRESQL_SEARCH_DDL:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+    for statement in SQLITE_SEARCH_DDL:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    for statement in SQLITE_SEARCH_DROP_DDL:
+        event.listen(table, "before_drop", DDL(statement).execute_if(dialect="sqlite"))
@@ -0,0 +1,27 @@
+"""
+Bring the database schema to the head revision of this image.
+
+Unlike a bare `alembic upgrade head`, a database created by `create_all`
+before the migration series is first stamped at the revision it matches, so
+existing deployments upgrade in place. Run it from the backend directory:
+
+    python -m app.jobs.migrate
+"""
+
+from app.core.config import settings
+from app.core.logging_config import get_logger, setup_logging
+from app.db.database import get_engine
+from app.db.schema import upgrade_schema
+
+logger = get_logger(__name__)
+
+
+def main() -> None:
+    """Upgrade the configured database to the head revision."""
+    setup_logging(settings.LOG_LEVEL, settings.LOG_FILE)
+    upgrade_schema(get_engine())
+    logger.info("Database schema is at the head revision")
+
+
+if __name__ == "__main__":
+    main()
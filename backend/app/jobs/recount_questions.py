@@ -0,0 +1,28 @@
+"""
+Recompute the per-category question counters from the questions table.
+
+The counters are kept in step by the question services; this job repairs
+them after writes that bypassed the services, e.g. manual SQL. Run it from
+the backend directory:
+
+    python -m app.jobs.recount_questions
+"""
+
+from app.core.config import settings
+from app.core.logging_config import get_logger, setup_logging
+from app.db.database import SessionLocal, get_engine
+from app.services.category import recount_questions
+
+logger = get_logger(__name__)
+
+
+def main() -> None:
+    """Recount the questions of every category and report the repairs."""
+    setup_logging(settings.LOG_LEVEL, settings.LOG_FILE)
+    with SessionLocal(bind=get_engine()) as db:
+        repaired = recount_questions(db)
+    logger.info("Question counts checked, %d categories repaired", repaired)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,44 @@
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from functools import cache
+from http import HTTPStatus
 from typing import Any
 
-from app.api.v1.api import api_router
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
-from app.core.logging_config import get_logger, setup_logging
-from app.db.database import Base, engine
-from fastapi import FastAPI
+from app.core.log_rotation import LogRotation
+from app.core.logging_config import get_logger, pipeline, setup_logging
+from app.core.metrics import CONTENT_TYPE, Gauge, MetricsMiddleware, registry
+from app.core.request_id import RequestIdMiddleware
+from app.db.database import get_async_engine, get_engine
+from app.db.health import ReadinessCheck
+from app.db.pool import pool_saturation, pool_stats
+from app.services.cache import cache_stats
+from fastapi import APIRouter, FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
-setup_logging(settings.LOG_LEVEL, settings.LOG_FILE)
 logger = get_logger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncGenerator[None, Any]:
     """Application lifecycle management."""
-    logger.info("Application startup initiated")
+    # Alembic is only needed once the server starts, not to import or build the app.
+    from app.db.schema import check_schema, create_schema  # noqa: PLC0415
 
-    try:
-        Base.metadata.create_all(bind=engine)
-        logger.info("Database tables created successfully")
-    except Exception:
-        logger.exception("Error creating database tables")
-        raise
+    logger.info("Application startup initiated")
+    engine = get_engine()
+
+    if settings.DB_CREATE_ALL:
+        try:
+            create_schema(engine)
+            logger.info("Database tables created successfully")
+        except Exception:
+            logger.exception("Error creating database tables")
+            raise
+    else:
+        check_schema(engine, settings.SCHEMA_CHECK)
 
     logger.info("Application startup completed")
 
@@ -34,29 +49,48 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, Any]:
     logger.info("Application shutdown completed")
 
 
-app = FastAPI(
-    title=settings.APP_NAME,
-    version=settings.APP_VERSION,
-    debug=settings.DEBUG,
-    lifespan=lifespan,
+POOL_GAUGE = registry.register(
+    Gauge("db_pool_connections", "Connection pool state by engine.", ("engine", "state"))
+)
+POOL_COUNTER_GAUGE = registry.register(
+    Gauge("db_pool_checkout", "Cumulative connection checkout counters.", ("engine", "counter"))
+)
+CACHE_GAUGE = registry.register(
+    Gauge("entity_cache", "Entity cache size and cumulative hits/misses.", ("cache", "stat"))
+)
+LOG_DROPPED_GAUGE = registry.register(
+    Gauge("log_records_dropped", "Log records dropped because the log queue was full.")
 )
 
-logger.info("Starting %s v%s", settings.APP_NAME, settings.APP_VERSION)
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-logger.info("CORS middleware configured")
+def collect_runtime_metrics() -> None:
+    """Copy pool, cache and log queue state into their gauges before a scrape."""
+    engines = {"sync": get_engine(), "async": get_async_engine()}
+    for name, current in engines.items():
+        if current is None:
+            continue
+        stats = pool_stats(current.pool)
+        for state in ("size", "checked_in", "checked_out", "overflow"):
+            if state in stats:
+                POOL_GAUGE.set((name, state), stats[state])
+        for counter in ("checkouts", "timeouts", "wait_seconds_total", "wait_seconds_max"):
+            if counter in stats:
+                POOL_COUNTER_GAUGE.set((name, counter), stats[counter])
+    for cache_name, stats in cache_stats().items():
+        for stat, value in stats.items():
+            CACHE_GAUGE.set((cache_name, stat), value)
+    LOG_DROPPED_GAUGE.set((), pipeline.dropped())
 
 
-@app.get("/health")
+registry.add_collector(collect_runtime_metrics)
+
+system_router = APIRouter()
+
+
+@system_router.get("/health")
 def health_check() -> dict[str, Any]:
     """Health check endpoint."""
-    logger.info("Health check requested")
+    logger.debug("Health check requested")
 
     masked_db_url = str(settings.DATABASE_URL)
     if "@" in masked_db_url:
@@ -70,5 +104,134 @@ def health_check() -> dict[str, Any]:
     }
 
 
-app.include_router(api_router, prefix="/api/v1")
-logger.info("API router included with prefix /api/v1")
+LIVE_RESPONSE = Response(b'{"status":"alive"}', media_type="application/json")
+
+
+@cache
+def readiness_check() -> ReadinessCheck:
+    """Return the readiness check of the sync engine, shared by all probe requests."""
+    from app.db.schema import schema_status  # noqa: PLC0415
+
+    return ReadinessCheck(
+        get_engine(),
+        settings.HEALTH_READY_TTL_SECONDS,
+        schema_status=None if settings.SCHEMA_CHECK == "off" else schema_status,
+    )
+
+
+@system_router.get("/health/live", include_in_schema=False)
+async def health_live() -> Response:
+    """Liveness probe: answers from the event loop with a prebuilt response, touching nothing."""
+    return LIVE_RESPONSE
+
+
+@system_router.get("/health/ready", include_in_schema=False)
+async def health_ready() -> JSONResponse:
+    """
+    Readiness probe: a cached `SELECT 1`, the schema revision and the pool saturation.
+
+    503 when the database is down, or with `SCHEMA_CHECK=refuse` when it lacks a migration.
+    """
+    result = await readiness_check().result()
+    async_engine = get_async_engine()
+    pools = {"sync": get_engine().pool} | ({"async": async_engine.pool} if async_engine else {})
+    saturation = {name: pool_saturation(pool) for name, pool in pools.items()}
+    ready = ReadinessCheck.is_ready(result, require_schema=settings.SCHEMA_CHECK == "refuse")
+    return JSONResponse(
+        {"status": "ready" if ready else "unavailable", **result, "pool_saturation": saturation},
+        status_code=HTTPStatus.OK if ready else HTTPStatus.SERVICE_UNAVAILABLE,
+    )
+
+
+@system_router.get("/health/pool")
+def pool_health() -> dict[str, Any]:
+    """Connection pool state and checkout wait counters of this worker."""
+    async_engine = get_async_engine()
+    return {
+        "sync": pool_stats(get_engine().pool),
+        "async": pool_stats(async_engine.pool) if async_engine is not None else None,
+    }
+
+
+@system_router.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    """Prometheus scrape endpoint."""
+    return Response(registry.render(), media_type=CONTENT_TYPE)
+
+
+def create_app() -> FastAPI:
+    """
+    Build the application: configure logging, then add the middleware and routers.
+
+    Importing this module has no side effects; the server calls this factory
+    through the `app` attribute, and the lifespan connects to the database.
+    """
+    setup_logging(
+        settings.LOG_LEVEL,
+        settings.LOG_FILE,
+        rotation=LogRotation(
+            max_bytes=settings.LOG_ROTATE_BYTES,
+            when=settings.LOG_ROTATE_WHEN,
+            backup_count=settings.LOG_BACKUP_COUNT,
+            compress=settings.LOG_COMPRESS,
+        ),
+        queue_size=settings.LOG_QUEUE_SIZE,
+        json_format=settings.LOG_JSON,
+        sample_rates=settings.LOG_SAMPLE_RATES,
+    )
+    # The routers pull in every endpoint, service and schema module.
+    from app.api.v1.api import api_router  # noqa: PLC0415
+
+    app = FastAPI(
+        title=settings.APP_NAME,
+        version=settings.APP_VERSION,
+        debug=settings.DEBUG,
+        lifespan=lifespan,
+    )
+
+    logger.info("Starting %s v%s", settings.APP_NAME, settings.APP_VERSION)
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    logger.info("CORS middleware configured")
+
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        cache_entries=settings.COMPRESSION_CACHE_ENTRIES,
+    )
+    logger.info("Compression middleware configured")
+
+    # Wraps compression and CORS, so its latency covers them.
+    app.add_middleware(MetricsMiddleware, statement_budget=settings.SQL_STATEMENT_BUDGET)
+    logger.info("Metrics middleware configured")
+
+    # Outermost: the statement budget warning logged by the metrics middleware needs the ID.
+    app.add_middleware(RequestIdMiddleware)
+    logger.info("Request ID middleware configured")
+
+    app.include_router(system_router)
+    app.include_router(api_router, prefix="/api/v1")
+    logger.info("API router included with prefix /api/v1")
+    return app
+
+
+@cache
+def get_app() -> FastAPI:
+    """Return the application of this process, building it on first use."""
+    return create_app()
+
+
+def __getattr__(name: str) -> FastAPI:
+    """Resolve `app.main:app` lazily, for uvicorn and the tests."""
+    if name == "app":
+        return get_app()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -0,0 +1,9 @@
+from pydantic import BaseModel, Field
+
+MAX_BATCH_IDS = 500
+
+
+class IdBatch(BaseModel):
+    """IDs to fetch in one request, in the order the results should come back."""
+
+    ids: list[int] = Field(min_length=1, max_length=MAX_BATCH_IDS)
@@ -0,0 +1,11 @@
+from app.schemas.category import CategoryStats
+from app.schemas.question import QuestionPage
+from pydantic import BaseModel
+
+
+class Bootstrap(BaseModel):
+    """Categories with their question counts and the first page of questions."""
+
+    categories: list[CategoryStats]
+    total_questions: int
+    questions: QuestionPage
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 class CategoryBase(BaseModel):
@@ -36,3 +36,33 @@ class CategoryDelete(BaseModel):
     deleted: bool
 
     model_config = ConfigDict(from_attributes=True)
+
+
+CategoryList = TypeAdapter(list[Category])
+
+
+class CategoryPage(BaseModel):
+    """Keyset-paginated list of categories."""
+
+    items: list[Category]
+    next_cursor: str | None = None
+
+
+class CategoryBatch(BaseModel):
+    """Categories fetched by ID, in request order, and the IDs that were not found."""
+
+    items: list[Category]
+    missing: list[int]
+
+
+class CategoryStats(Category):
+    """Category with the number of its questions."""
+
+    question_count: int
+
+
+class CategoryStatsResult(BaseModel):
+    """Question counts of every category."""
+
+    items: list[CategoryStats]
+    total_questions: int
@@ -1,4 +1,6 @@
-from pydantic import BaseModel, ConfigDict
+from enum import StrEnum
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 class QuestionBase(BaseModel):
@@ -40,3 +42,74 @@ class QuestionDelete(BaseModel):
     deleted: bool
 
     model_config = ConfigDict(from_attributes=True)
+
+
+QuestionList = TypeAdapter(list[Question])
+
+
+class QuestionPage(BaseModel):
+    """Keyset-paginated list of questions."""
+
+    items: list[Question]
+    next_cursor: str | None = None
+
+
+class QuestionBatch(BaseModel):
+    """Questions fetched by ID, in request order, and the IDs that were not found."""
+
+    items: list[Question]
+    missing: list[int]
+
+
+class QuestionSearchHit(Question):
+    """Question matched by full-text search with its relevance score."""
+
+    rank: float
+
+
+class CategoryFacet(BaseModel):
+    """Number of search matches in a category."""
+
+    category_id: int
+    count: int
+
+
+class QuestionSearchResult(BaseModel):
+    """Ranked page of search hits with per-category facet counts."""
+
+    items: list[QuestionSearchHit]
+    total: int
+    facets: list[CategoryFacet]
+    next_cursor: str | None = None
+
+
+class BulkItemStatus(StrEnum):
+    """Outcome of a single item in a bulk import."""
+
+    CREATED = "created"
+    DUPLICATE = "duplicate"
+    INVALID_CATEGORY = "invalid_category"
+
+
+class QuestionBulkItemResult(BaseModel):
+    """Result for one submitted question, matched by its position in the request."""
+
+    index: int
+    status: BulkItemStatus
+    id: int | None = None
+
+
+class QuestionBulkResult(BaseModel):
+    """Summary and per-item results of a bulk import."""
+
+    created: int
+    duplicates: int
+    invalid_category: int
+    items: list[QuestionBulkItemResult]
+
+
+class QuestionSample(BaseModel):
+    """Random sample of questions with the seed that reproduces it."""
+
+    items: list[Question]
+    seed: int
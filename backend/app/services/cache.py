@@ -0,0 +1,72 @@
+from app.core.cache import TTLCache, VersionedIdIndex
+from app.core.config import settings
+from app.db.models.category import Category as CategoryModel
+from app.db.models.question import Question as QuestionModel
+from sqlalchemy import Connection, event, inspect
+from sqlalchemy.orm import Mapper, Session
+
+category_cache = TTLCache(settings.CACHE_MAX_ENTRIES, settings.CACHE_TTL_SECONDS)
+question_cache = TTLCache(settings.CACHE_MAX_ENTRIES, settings.CACHE_TTL_SECONDS)
+# Question IDs per category (None for all questions), for random sampling.
+question_ids = VersionedIdIndex(settings.SAMPLE_INDEX_MAX_ENTRIES)
+
+PENDING_INVALIDATIONS = "cache_invalidations"
+
+
+def _pending(session: Session) -> set[tuple[str, int]]:
+    return session.info.setdefault(PENDING_INVALIDATIONS, set())
+
+
+def _mark_category(_mapper: Mapper, _connection: Connection, target: CategoryModel) -> None:
+    """Queue a category for invalidation once the flushing transaction commits."""
+    session = inspect(target).session
+    if session is not None:
+        _pending(session).add(("category", target.id))
+
+
+def _mark_question(_mapper: Mapper, _connection: Connection, target: QuestionModel) -> None:
+    """Queue a question for invalidation once the flushing transaction commits."""
+    session = inspect(target).session
+    if session is not None:
+        _pending(session).add(("question", target.id))
+
+
+def _apply_invalidations(session: Session) -> None:
+    """Drop cached entries changed by the committed transaction."""
+    for kind, entity_id in session.info.pop(PENDING_INVALIDATIONS, ()):
+        if kind == "category":
+            category_cache.invalidate(entity_id)
+            # Questions go with their category through ON DELETE CASCADE, unseen by the ORM.
+            question_cache.invalidate_where(
+                lambda question, category_id=entity_id: question.category_id == category_id
+            )
+        else:
+            question_cache.invalidate(entity_id)
+
+
+def _discard_invalidations(session: Session) -> None:
+    """Forget queued invalidations of a transaction that was rolled back."""
+    session.info.pop(PENDING_INVALIDATIONS, None)
+
+
+for event_name in ("after_update", "after_delete"):
+    event.listen(CategoryModel, event_name, _mark_category)
+    event.listen(QuestionModel, event_name, _mark_question)
+event.listen(Session, "after_commit", _apply_invalidations)
+event.listen(Session, "after_rollback", _discard_invalidations)
+
+
+def clear_caches() -> None:
+    """Empty every entity cache, e.g. after the database was recreated."""
+    category_cache.clear()
+    question_cache.clear()
+    question_ids.clear()
+
+
+def cache_stats() -> dict[str, dict[str, int]]:
+    """Return hit/miss counters and sizes of the entity caches."""
+    return {
+        "categories": category_cache.stats(),
+        "questions": question_cache.stats(),
+        "question_ids": question_ids.stats(),
+    }
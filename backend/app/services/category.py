@@ -1,32 +1,240 @@
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from app.core.logging_config import get_logger
 from app.db.models.category import Category as CategoryModel
-from app.schemas.category import CategoryCreate, CategoryUpdate
-from sqlalchemy import func
+from app.db.models.question import Question as QuestionModel
+from app.schemas.category import Category, CategoryCreate, CategoryUpdate
+from app.services.cache import category_cache
+from app.services.versions import SKIP_VERSION_BUMP, bump_versions, get_versions
+from sqlalchemy import ColumnElement, Insert, Select, Update, func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
+logger = get_logger(__name__)
+
+categories_table = CategoryModel.__table__
+
+# Table columns in `Category` field order, so encoded rows match the schema's JSON byte for byte.
+CATEGORY_COLUMNS = tuple(CategoryModel.__table__.c[name] for name in Category.model_fields)
+
+
+def name_matches(dialect: str, name: str) -> ColumnElement[bool]:
+    """Case-insensitive name comparison written to hit the dialect's unique name index."""
+    if dialect == "sqlite":
+        return CategoryModel.name.collate("NOCASE") == name
+    return func.lower(CategoryModel.name) == func.lower(name)
+
+
+def insert_category_statement(dialect: str, name: str) -> Insert:
+    """
+    Build a single-statement create that skips names already taken.
+
+    Any unique violation, including the case-insensitive name index, makes the
+    INSERT a no-op, so RETURNING yields no row instead of raising. The caller
+    bumps the categories version only when a row comes back.
+    """
+    insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+    return (
+        insert(CategoryModel)
+        .values(name=name)
+        .on_conflict_do_nothing()
+        .returning(CategoryModel)
+        .execution_options(**{SKIP_VERSION_BUMP: True})
+    )
+
+
+def question_count_updates(deltas: Mapping[int | None, int]) -> list[Update]:
+    """
+    Build one counter UPDATE per category whose question count changes.
+
+    Categories are updated in ID order, and every writer runs these updates
+    before anything bumps `table_versions`: the single-question writes bump it
+    at flush, bulk imports adjust the counters before their INSERT. Concurrent
+    writers therefore take their row locks in the same order.
+    """
+    return [
+        update(categories_table)
+        .where(categories_table.c.id == category_id)
+        .values(question_count=categories_table.c.question_count + delta)
+        for category_id, delta in sorted(
+            (key, value) for key, value in deltas.items() if key is not None and value
+        )
+    ]
+
+
+def adjust_question_counts(db: Session, deltas: Mapping[int | None, int]) -> None:
+    """
+    Add `deltas` to the question counts of their categories in the current transaction.
+
+    The statements run on the session's connection rather than through the ORM,
+    so the counters do not bump the `categories` version and invalidate
+    category ETags; the `questions` write that goes with them bumps its own.
+    """
+    connection = db.connection()
+    for statement in question_count_updates(deltas):
+        connection.execute(statement)
+
+
+def recount_questions_statement() -> Update:
+    """Build the UPDATE that resets every drifted question count from the `questions` table."""
+    actual = (
+        select(func.count())
+        .where(QuestionModel.category_id == categories_table.c.id)
+        .scalar_subquery()
+    )
+    return (
+        update(categories_table)
+        .where(categories_table.c.question_count != actual)
+        .values(question_count=actual)
+    )
+
+
+def recount_questions(db: Session) -> int:
+    """
+    Repair the question counters with one set-based recount.
+
+    Meant for a maintenance job, not a request: it counts every question.
+    Returns the number of categories whose count had drifted.
+    """
+    repaired = db.connection().execute(recount_questions_statement()).rowcount
+    db.commit()
+    if repaired:
+        logger.warning("Repaired question counts of %d categories", repaired)
+    return repaired
+
+
+def get_category_stats(db: Session) -> list[dict[str, Any]]:
+    """Get every category with its question count, ordered by ID, without counting questions."""
+    statement = select(*CATEGORY_COLUMNS, categories_table.c.question_count).order_by(
+        categories_table.c.id
+    )
+    return [dict(row) for row in db.execute(statement).mappings()]
+
 
 def get_categories(db: Session, skip: int = 0, limit: int = 100) -> list[CategoryModel]:
     """Get categories."""
     return db.query(CategoryModel).offset(skip).limit(limit).all()
 
 
+def get_categories_page(
+    db: Session, limit: int, after: int | None = None
+) -> tuple[list[CategoryModel], int | None]:
+    """
+    Get a page of categories ordered by ID.
+
+    Returns the page and the ID to resume after, or None when this is the last page.
+    """
+    query = db.query(CategoryModel)
+    if after is not None:
+        query = query.filter(CategoryModel.id > after)
+
+    categories = query.order_by(CategoryModel.id).limit(limit + 1).all()
+    if len(categories) <= limit:
+        return categories, None
+
+    return categories[:limit], categories[limit - 1].id
+
+
+def category_rows_page_statement(limit: int, after: int | None = None) -> Select:
+    """Build the Core query behind `get_category_rows_page`, fetching one extra row."""
+    statement = select(*CATEGORY_COLUMNS).order_by(CategoryModel.id).limit(limit + 1)
+    if after is not None:
+        statement = statement.where(CategoryModel.id > after)
+    return statement
+
+
+def split_category_rows_page(
+    rows: list[dict[str, Any]], limit: int
+) -> tuple[list[dict[str, Any]], int | None]:
+    """Trim the extra row of a page and derive the ID to resume after."""
+    if len(rows) <= limit:
+        return rows, None
+    return rows[:limit], rows[limit - 1]["id"]
+
+
+def get_category_rows_page(
+    db: Session, limit: int, after: int | None = None
+) -> tuple[list[dict[str, Any]], int | None]:
+    """Read-only variant of `get_categories_page` returning dicts in `Category` field order."""
+    statement = category_rows_page_statement(limit, after)
+    rows = [dict(row) for row in db.execute(statement).mappings()]
+    return split_category_rows_page(rows, limit)
+
+
 def get_category(db: Session, category_id: int) -> CategoryModel | None:
     """Get category by ID."""
     return db.query(CategoryModel).filter(CategoryModel.id == category_id).first()
 
 
-def get_category_by_name(db: Session, name: str) -> CategoryModel | None:
-    """Get category by name."""
+def get_category_row(db: Session, category_id: int) -> dict[str, Any] | None:
+    """Read-only variant of `get_category` returning a plain dict in `Category` field order."""
+    statement = select(*CATEGORY_COLUMNS).where(CategoryModel.id == category_id)
+    row = db.execute(statement).mappings().first()
+    return dict(row) if row is not None else None
+
+
+def get_category_cached(db: Session, category_id: int, *, core: bool = False) -> Category | None:
+    """
+    Get category by ID through the in-process cache; misses read from the database.
+
+    With `core` set, misses are read by `get_category_row` instead of the ORM.
+    Entries are only served while the `categories` version they were read at is current.
+    """
+    version = get_versions(db, ("categories",))["categories"]
+    cached = category_cache.get(category_id, version)
+    if cached is not None:
+        return cached
+    source = get_category_row(db, category_id) if core else get_category(db, category_id)
+    if source is None:
+        return None
+    category = Category.model_validate(source)
+    category_cache.set(category_id, category, version)
+    return category
+
+
+def get_categories_cached(db: Session, ids: Sequence[int]) -> tuple[list[Category], list[int]]:
+    """
+    Get categories by ID through the in-process cache, reading all misses in one IN query.
+
+    Returns the categories in the order of `ids`, without repeats, and the IDs
+    that do not exist.
+    """
+    version = get_versions(db, ("categories",))["categories"]
+    wanted = list(dict.fromkeys(ids))
+    found = {
+        category_id: cached
+        for category_id in wanted
+        if (cached := category_cache.get(category_id, version)) is not None
+    }
+    misses = [category_id for category_id in wanted if category_id not in found]
+    if misses:
+        statement = select(*CATEGORY_COLUMNS).where(CategoryModel.id.in_(misses))
+        for row in db.execute(statement).mappings():
+            category = Category.model_validate(row)
+            category_cache.set(category.id, category, version)
+            found[category.id] = category
     return (
-        db.query(CategoryModel).filter(func.lower(CategoryModel.name) == func.lower(name)).first()
+        [found[category_id] for category_id in wanted if category_id in found],
+        [category_id for category_id in wanted if category_id not in found],
     )
 
 
-def create_category(db: Session, category: CategoryCreate) -> CategoryModel:
-    """Create a new category."""
-    db_category = CategoryModel(name=category.name)
-    db.add(db_category)
+def get_category_by_name(db: Session, name: str) -> CategoryModel | None:
+    """Get category by name."""
+    dialect = db.get_bind().dialect.name
+    return db.query(CategoryModel).filter(name_matches(dialect, name)).first()
+
+
+def create_category(db: Session, category: CategoryCreate) -> CategoryModel | None:
+    """Create a new category, or return None if the name is already taken."""
+    dialect = db.get_bind().dialect.name
+    db_category = db.scalar(insert_category_statement(dialect, category.name))
+    if db_category is not None:
+        bump_versions(db, ["categories"])
+        # Detach so the commit does not expire the RETURNING values and force a reload.
+        db.expunge(db_category)
     db.commit()
-    db.refresh(db_category)
     return db_category
 
 
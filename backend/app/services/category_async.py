@@ -0,0 +1,131 @@
+from collections.abc import Mapping
+from typing import Any
+
+from app.db.models.category import Category as CategoryModel
+from app.schemas.category import Category, CategoryCreate, CategoryUpdate
+from app.services.cache import category_cache
+from app.services.category import (
+    CATEGORY_COLUMNS,
+    category_rows_page_statement,
+    insert_category_statement,
+    name_matches,
+    question_count_updates,
+    split_category_rows_page,
+)
+from app.services.versions import bump_versions, get_versions_async
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def get_categories_page(
+    db: AsyncSession, limit: int, after: int | None = None
+) -> tuple[list[CategoryModel], int | None]:
+    """
+    Get a page of categories ordered by ID.
+
+    Returns the page and the ID to resume after, or None when this is the last page.
+    """
+    statement = select(CategoryModel).order_by(CategoryModel.id).limit(limit + 1)
+    if after is not None:
+        statement = statement.where(CategoryModel.id > after)
+
+    categories = list(await db.scalars(statement))
+    if len(categories) <= limit:
+        return categories, None
+
+    return categories[:limit], categories[limit - 1].id
+
+
+async def get_category_rows_page(
+    db: AsyncSession, limit: int, after: int | None = None
+) -> tuple[list[dict[str, Any]], int | None]:
+    """Read-only variant of `get_categories_page` returning dicts in `Category` field order."""
+    statement = category_rows_page_statement(limit, after)
+    rows = [dict(row) for row in (await db.execute(statement)).mappings()]
+    return split_category_rows_page(rows, limit)
+
+
+async def get_category(db: AsyncSession, category_id: int) -> CategoryModel | None:
+    """Get category by ID."""
+    return await db.get(CategoryModel, category_id)
+
+
+async def get_category_row(db: AsyncSession, category_id: int) -> dict[str, Any] | None:
+    """Read-only variant of `get_category` returning a plain dict in `Category` field order."""
+    statement = select(*CATEGORY_COLUMNS).where(CategoryModel.id == category_id)
+    row = (await db.execute(statement)).mappings().first()
+    return dict(row) if row is not None else None
+
+
+async def get_category_cached(
+    db: AsyncSession, category_id: int, *, core: bool = False
+) -> Category | None:
+    """
+    Get category by ID through the in-process cache; misses read from the database.
+
+    With `core` set, misses are read by `get_category_row` instead of the ORM.
+    Entries are only served while the `categories` version they were read at is current.
+    """
+    version = (await get_versions_async(db, ("categories",)))["categories"]
+    cached = category_cache.get(category_id, version)
+    if cached is not None:
+        return cached
+    source = (
+        await get_category_row(db, category_id) if core else await get_category(db, category_id)
+    )
+    if source is None:
+        return None
+    category = Category.model_validate(source)
+    category_cache.set(category_id, category, version)
+    return category
+
+
+async def get_category_by_name(db: AsyncSession, name: str) -> CategoryModel | None:
+    """Get category by name."""
+    dialect = db.get_bind().dialect.name
+    return await db.scalar(select(CategoryModel).where(name_matches(dialect, name)).limit(1))
+
+
+async def create_category(db: AsyncSession, category: CategoryCreate) -> CategoryModel | None:
+    """Create a new category, or return None if the name is already taken."""
+    dialect = db.get_bind().dialect.name
+    db_category = await db.scalar(insert_category_statement(dialect, category.name))
+    if db_category is not None:
+        await db.run_sync(bump_versions, ["categories"])
+    await db.commit()
+    return db_category
+
+
+async def update_category(
+    db: AsyncSession, category_id: int, category: CategoryUpdate
+) -> CategoryModel | None:
+    """Partially updates the category by ID, changing only the passed fields."""
+    db_category = await db.get(CategoryModel, category_id)
+    if not db_category:
+        return None
+
+    update_data = category.model_dump(exclude_unset=True)
+
+    if update_data:
+        for key, value in update_data.items():
+            setattr(db_category, key, value)
+
+        await db.commit()
+
+    return db_category
+
+
+async def delete_category(db: AsyncSession, category_id: int) -> CategoryModel | None:
+    """Delete a category by ID."""
+    db_category = await db.get(CategoryModel, category_id)
+    if db_category:
+        await db.delete(db_category)
+        await db.commit()
+    return db_category
+
+
+async def adjust_question_counts(db: AsyncSession, deltas: Mapping[int | None, int]) -> None:
+    """Async variant of `category.adjust_question_counts`."""
+    connection = await db.connection()
+    for statement in question_count_updates(deltas):
+        await connection.execute(statement)
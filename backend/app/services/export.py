@@ -0,0 +1,75 @@
+import csv
+import io
+import json
+import zlib
+from collections.abc import Iterator
+from enum import StrEnum
+
+from app.services import question as question_service
+from sqlalchemy.orm import Session
+
+EXPORT_BATCH_SIZE = 1000
+EXPORT_FIELDS = ("id", "question_text", "answer_text", "category_id")
+
+
+class ExportFormat(StrEnum):
+    """Supported question export formats."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+def _ndjson_chunks(db: Session, category_id: int | None) -> Iterator[bytes]:
+    """Encode question batches as newline-delimited JSON."""
+    for batch in question_service.iter_question_batches(db, category_id, EXPORT_BATCH_SIZE):
+        yield "".join(
+            json.dumps(dict(zip(EXPORT_FIELDS, row, strict=True)), ensure_ascii=False) + "\n"
+            for row in batch
+        ).encode()
+
+
+def _csv_chunks(db: Session, category_id: int | None) -> Iterator[bytes]:
+    """Encode question batches as CSV with a header row."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+
+    for batch in question_service.iter_question_batches(db, category_id, EXPORT_BATCH_SIZE):
+        writer.writerows(batch)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _gzip_chunks(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Compress a byte stream into a single gzip member incrementally."""
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def export_questions(
+    db: Session,
+    export_format: ExportFormat,
+    category_id: int | None = None,
+    *,
+    compress: bool = False,
+) -> Iterator[bytes]:
+    """Yield the question bank in `export_format`, one encoded batch at a time."""
+    if export_format is ExportFormat.CSV:
+        chunks = _csv_chunks(db, category_id)
+    else:
+        chunks = _ndjson_chunks(db, category_id)
+    return _gzip_chunks(chunks) if compress else chunks
@@ -1,46 +1,477 @@
+import random
+import re
+from array import array
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+from app.core.text import text_key
+from app.db.models.category import Category as CategoryModel
 from app.db.models.question import Question as QuestionModel
-from app.schemas.question import QuestionCreate, QuestionUpdate
-from sqlalchemy import func
+from app.db.search import FTS_TABLE, SEARCH_REGCONFIG
+from app.schemas.question import BulkItemStatus, Question, QuestionCreate, QuestionUpdate
+from app.services.cache import question_cache, question_ids
+from app.services.category import adjust_question_counts
+from app.services.versions import get_versions
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    func,
+    insert,
+    literal_column,
+    select,
+    text,
+    tuple_,
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+SEARCH_TOKEN_PATTERN = re.compile(r"\w+")
+MAX_SEARCH_TOKENS = 16
+BULK_CHUNK_SIZE = 1000
+# Tries of a bulk chunk whose insert lost a race with a concurrent write.
+BULK_CHUNK_ATTEMPTS = 3
+
+
+class DuplicateQuestionError(ValueError):
+    """Another question already uses the same normalized text."""
+
+
+# Table columns in `Question` field order, so encoded rows match the schema's JSON byte for byte.
+QUESTION_COLUMNS = tuple(QuestionModel.__table__.c[name] for name in Question.model_fields)
+
 
 def get_all_questions(db: Session) -> list[QuestionModel]:
     """Get all questions."""
     return db.query(QuestionModel).all()
 
 
+def after_key_clause(after: tuple[int, ...], category_id: int | None) -> ColumnElement[bool]:
+    """
+    Filter for rows past a (category_id, id) keyset position.
+
+    Inside a single category the position reduces to `id > ?`, which the
+    (category_id, id) index serves as a range scan instead of a row-value filter.
+    """
+    if category_id is not None and after[0] == category_id:
+        return QuestionModel.id > after[1]
+    return tuple_(QuestionModel.category_id, QuestionModel.id) > tuple_(*after)
+
+
+def get_questions_page(
+    db: Session,
+    limit: int,
+    after: tuple[int, ...] | None = None,
+    category_id: int | None = None,
+) -> tuple[list[QuestionModel], tuple[int, int] | None]:
+    """
+    Get a page of questions ordered by (category_id, id).
+
+    Returns the page and the key to resume after, or None when this is the last page.
+    """
+    query = db.query(QuestionModel)
+    if category_id is not None:
+        query = query.filter(QuestionModel.category_id == category_id)
+    if after is not None:
+        query = query.filter(after_key_clause(after, category_id))
+
+    questions = query.order_by(QuestionModel.category_id, QuestionModel.id).limit(limit + 1).all()
+    if len(questions) <= limit:
+        return questions, None
+
+    last = questions[limit - 1]
+    return questions[:limit], (last.category_id, last.id)
+
+
+def question_rows_page_statement(
+    limit: int, after: tuple[int, ...] | None = None, category_id: int | None = None
+) -> Select:
+    """Build the Core query behind `get_question_rows_page`, fetching one extra row."""
+    statement = (
+        select(*QUESTION_COLUMNS)
+        .order_by(QuestionModel.category_id, QuestionModel.id)
+        .limit(limit + 1)
+    )
+    if category_id is not None:
+        statement = statement.where(QuestionModel.category_id == category_id)
+    if after is not None:
+        statement = statement.where(after_key_clause(after, category_id))
+    return statement
+
+
+def split_question_rows_page(
+    rows: list[dict[str, Any]], limit: int
+) -> tuple[list[dict[str, Any]], tuple[int, int] | None]:
+    """Trim the extra row of a page and derive the key to resume after."""
+    if len(rows) <= limit:
+        return rows, None
+    last = rows[limit - 1]
+    return rows[:limit], (last["category_id"], last["id"])
+
+
+def get_question_rows_page(
+    db: Session,
+    limit: int,
+    after: tuple[int, ...] | None = None,
+    category_id: int | None = None,
+) -> tuple[list[dict[str, Any]], tuple[int, int] | None]:
+    """
+    Read-only variant of `get_questions_page` that bypasses the ORM.
+
+    Rows come back as plain dicts in `Question` field order, without identity-map
+    or relationship bookkeeping, ready to be encoded with `to_json`.
+    """
+    statement = question_rows_page_statement(limit, after, category_id)
+    rows = [dict(row) for row in db.execute(statement).mappings()]
+    return split_question_rows_page(rows, limit)
+
+
+def iter_question_batches(
+    db: Session, category_id: int | None = None, batch_size: int = 1000
+) -> Iterator[Sequence[Row[tuple[int, str, str, int]]]]:
+    """
+    Stream question rows in batches ordered by (category_id, id).
+
+    Uses `yield_per`, so the driver fetches through a server-side cursor where
+    supported and only one batch of plain rows is held in memory at a time.
+    """
+    statement = (
+        select(
+            QuestionModel.id,
+            QuestionModel.question_text,
+            QuestionModel.answer_text,
+            QuestionModel.category_id,
+        )
+        .order_by(QuestionModel.category_id, QuestionModel.id)
+        .execution_options(yield_per=batch_size)
+    )
+    if category_id is not None:
+        statement = statement.where(QuestionModel.category_id == category_id)
+
+    yield from db.execute(statement).partitions()
+
+
+def _search_tokens(query: str) -> list[str]:
+    """Split a free-text query into lowercase word tokens safe for any match syntax."""
+    return SEARCH_TOKEN_PATTERN.findall(query.lower())[:MAX_SEARCH_TOKENS]
+
+
+def _search_match(db: Session, tokens: list[str]) -> tuple[ColumnElement[bool], ColumnElement]:
+    """
+    Build the dialect-specific match condition and relevance score.
+
+    All tokens must match; the last one is matched as a prefix so partially
+    typed words still find results.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        regconfig = literal_column(SEARCH_REGCONFIG)
+        document = func.to_tsvector(
+            regconfig,
+            QuestionModel.question_text + literal_column("' '") + QuestionModel.answer_text,
+        )
+        tsquery = func.to_tsquery(regconfig, " & ".join([*tokens[:-1], f"{tokens[-1]}:*"]))
+        return document.op("@@")(tsquery), func.ts_rank(document, tsquery)
+
+    expression = " ".join([*(f'"{token}"' for token in tokens[:-1]), f'"{tokens[-1]}"*'])
+    fts = (
+        select(
+            literal_column("rowid").label("id"),
+            (-func.bm25(literal_column(FTS_TABLE))).label("rank"),
+        )
+        .select_from(text(FTS_TABLE))
+        .where(text(f"{FTS_TABLE} MATCH :expression").bindparams(expression=expression))
+        .subquery()
+    )
+    return QuestionModel.id == fts.c.id, fts.c.rank
+
+
+def search_questions(
+    db: Session,
+    query: str,
+    limit: int,
+    offset: int = 0,
+    category_id: int | None = None,
+) -> tuple[list[tuple[QuestionModel, float]], dict[int, int]]:
+    """
+    Full-text search over question and answer text.
+
+    Returns the requested page of (question, rank) hits, best first, and the
+    number of matches per category. Facets ignore `category_id` so clients can
+    show counts for every category while one of them is selected.
+    """
+    tokens = _search_tokens(query)
+    if not tokens:
+        return [], {}
+
+    condition, rank = _search_match(db, tokens)
+
+    facets_query = (
+        db.query(QuestionModel.category_id, func.count())
+        .filter(condition)
+        .group_by(QuestionModel.category_id)
+    )
+    facets: dict[int, int] = dict(facets_query.all())
+
+    hits_query = db.query(QuestionModel, rank).filter(condition)
+    if category_id is not None:
+        hits_query = hits_query.filter(QuestionModel.category_id == category_id)
+    hits = hits_query.order_by(rank.desc(), QuestionModel.id).offset(offset).limit(limit).all()
+
+    return [(question, float(score)) for question, score in hits], facets
+
+
 def get_question(db: Session, question_id: int) -> QuestionModel | None:
     """Get question by ID."""
     return db.query(QuestionModel).filter(QuestionModel.id == question_id).first()
 
 
+def get_question_row(db: Session, question_id: int) -> dict[str, Any] | None:
+    """Read-only variant of `get_question` returning a plain dict in `Question` field order."""
+    statement = select(*QUESTION_COLUMNS).where(QuestionModel.id == question_id)
+    row = db.execute(statement).mappings().first()
+    return dict(row) if row is not None else None
+
+
+def get_question_cached(db: Session, question_id: int, *, core: bool = False) -> Question | None:
+    """
+    Get question by ID through the in-process cache; misses read from the database.
+
+    With `core` set, misses are read by `get_question_row` instead of the ORM.
+    Entries are only served while the `questions` version they were read at is current.
+    """
+    version = get_versions(db, ("questions",))["questions"]
+    cached = question_cache.get(question_id, version)
+    if cached is not None:
+        return cached
+    source = get_question_row(db, question_id) if core else get_question(db, question_id)
+    if source is None:
+        return None
+    question = Question.model_validate(source)
+    question_cache.set(question_id, question, version)
+    return question
+
+
+def get_questions_cached(db: Session, ids: Sequence[int]) -> tuple[list[Question], list[int]]:
+    """
+    Get questions by ID through the in-process cache, reading all misses in one IN query.
+
+    Returns the questions in the order of `ids`, without repeats, and the IDs
+    that do not exist.
+    """
+    version = get_versions(db, ("questions",))["questions"]
+    wanted = list(dict.fromkeys(ids))
+    found = {
+        question_id: cached
+        for question_id in wanted
+        if (cached := question_cache.get(question_id, version)) is not None
+    }
+    misses = [question_id for question_id in wanted if question_id not in found]
+    if misses:
+        statement = select(*QUESTION_COLUMNS).where(QuestionModel.id.in_(misses))
+        for row in db.execute(statement).mappings():
+            question = Question.model_validate(row)
+            question_cache.set(question.id, question, version)
+            found[question.id] = question
+    return (
+        [found[question_id] for question_id in wanted if question_id in found],
+        [question_id for question_id in wanted if question_id not in found],
+    )
+
+
 def get_question_by_text_case_insensitive(db: Session, question_text: str) -> QuestionModel | None:
-    """Get question by text (case insensitive)."""
+    """Get question by text, ignoring case, Unicode form and whitespace differences."""
+    return db.query(QuestionModel).filter(QuestionModel.text_key == text_key(question_text)).first()
+
+
+def get_questions_by_category(db: Session, category_id: int) -> list[QuestionModel]:
+    """Get questions by category, ordered by ID along the (category_id, id) index."""
     return (
         db.query(QuestionModel)
-        .filter(func.lower(QuestionModel.question_text) == func.lower(question_text))
-        .first()
+        .filter(QuestionModel.category_id == category_id)
+        .order_by(QuestionModel.id)
+        .all()
     )
 
 
-def get_questions_by_category(db: Session, category_id: int) -> list[QuestionModel]:
-    """Get questions by category."""
-    return db.query(QuestionModel).filter(QuestionModel.category_id == category_id).all()
+def get_question_ids(db: Session, category_id: int | None) -> Sequence[int]:
+    """
+    Get the sorted IDs of the questions in a category, or of all questions.
+
+    The array is kept in memory until the questions table version changes, so
+    only the first read after a write scans the `(category_id, id)` index.
+    """
+    version = get_versions(db, ("questions",))["questions"]
+    ids = question_ids.get(category_id, version)
+    if ids is None:
+        statement = select(QuestionModel.id).order_by(QuestionModel.id)
+        if category_id is not None:
+            statement = statement.where(QuestionModel.category_id == category_id)
+        ids = array("q", db.scalars(statement))
+        question_ids.set(category_id, version, ids)
+    return ids
+
+
+def sample_questions(
+    db: Session, count: int, category_id: int | None, seed: int
+) -> list[dict[str, Any]]:
+    """
+    Draw up to `count` distinct questions uniformly at random, in draw order.
+
+    IDs are sampled from the in-memory ID array and the rows read with one IN
+    query, so the cost depends on `count` rather than on the category size. The
+    same seed draws the same questions while the category is unchanged.
+    """
+    ids = get_question_ids(db, category_id)
+    drawn = random.Random(seed).sample(ids, min(count, len(ids)))  # noqa: S311
+    if not drawn:
+        return []
+    rows = db.execute(select(*QUESTION_COLUMNS).where(QuestionModel.id.in_(drawn))).mappings()
+    by_id = {row["id"]: dict(row) for row in rows}
+    # A question deleted by another worker since the IDs were read is skipped.
+    return [by_id[question_id] for question_id in drawn if question_id in by_id]
+
+
+def text_key_taken_statement(key: str, exclude_id: int | None = None) -> Select[tuple[int]]:
+    """Select the ID of a question using `key`, other than `exclude_id`."""
+    statement = select(QuestionModel.id).where(QuestionModel.text_key == key).limit(1)
+    if exclude_id is not None:
+        statement = statement.where(QuestionModel.id != exclude_id)
+    return statement
+
+
+def _commit_question(db: Session, key: str, question_id: int | None = None) -> None:
+    """
+    Commit a question write, raising DuplicateQuestionError if its text key was taken.
+
+    The endpoints look for duplicates before writing, but a concurrent request
+    can insert the same text in between; the unique index then rejects the
+    commit. Other integrity errors, such as a missing category, propagate.
+    """
+    try:
+        db.commit()
+    except IntegrityError as exc:
+        db.rollback()
+        if db.scalar(text_key_taken_statement(key, question_id)) is not None:
+            raise DuplicateQuestionError(key) from exc
+        raise
 
 
 def create_question(db: Session, question: QuestionCreate) -> QuestionModel:
-    """Create a new question."""
+    """Create a new question, raising DuplicateQuestionError if its text is taken."""
     db_question = QuestionModel(**question.model_dump())
     db.add(db_question)
-    db.commit()
+    adjust_question_counts(db, {question.category_id: 1})
+    _commit_question(db, db_question.text_key)
     db.refresh(db_question)
     return db_question
 
 
+def _existing_text_keys(db: Session, keys: list[str]) -> set[str]:
+    """Return the keys among `keys` already used by stored questions, in one indexed query."""
+    return set(db.scalars(select(QuestionModel.text_key).where(QuestionModel.text_key.in_(keys))))
+
+
+def _bulk_create_chunk(
+    db: Session, chunk: list[tuple[int, QuestionCreate]], seen: set[str]
+) -> list[tuple[int, BulkItemStatus, int | None]]:
+    """Validate and insert one chunk of a bulk import in a single transaction."""
+    category_ids = {q.category_id for _, q in chunk if q.category_id is not None}
+    valid_categories = set(
+        db.scalars(select(CategoryModel.id).where(CategoryModel.id.in_(category_ids)))
+    )
+    keys = [text_key(q.question_text) for _, q in chunk]
+    existing = _existing_text_keys(db, keys)
+
+    results: list[tuple[int, BulkItemStatus, int | None]] = []
+    pending: list[tuple[int, QuestionCreate, str]] = []
+    for (index, question), key in zip(chunk, keys, strict=True):
+        if question.category_id not in valid_categories:
+            results.append((index, BulkItemStatus.INVALID_CATEGORY, None))
+        elif key in existing or key in seen:
+            results.append((index, BulkItemStatus.DUPLICATE, None))
+        else:
+            seen.add(key)
+            pending.append((index, question, key))
+
+    if pending:
+        # Counters first: the ORM INSERT bumps table_versions, which every writer locks last.
+        adjust_question_counts(db, Counter(question.category_id for _, question, _ in pending))
+        new_ids = db.scalars(
+            insert(QuestionModel).returning(QuestionModel.id, sort_by_parameter_order=True),
+            [{**question.model_dump(), "text_key": key} for _, question, key in pending],
+        ).all()
+        results.extend(
+            (index, BulkItemStatus.CREATED, new_id)
+            for (index, _, _), new_id in zip(pending, new_ids, strict=True)
+        )
+    db.commit()
+
+    return results
+
+
+def _create_chunk(
+    db: Session, chunk: list[tuple[int, QuestionCreate]], seen: set[str]
+) -> list[tuple[int, BulkItemStatus, int | None]]:
+    """
+    Insert one chunk, validating it again when a concurrent write breaks a constraint.
+
+    Between the lookups and the INSERT another request may add one of the
+    texts or delete a category. The chunk is then rolled back and redone, and
+    the fresh lookups report those items as duplicates or invalid categories.
+    """
+    for _ in range(BULK_CHUNK_ATTEMPTS - 1):
+        claimed = set(seen)
+        try:
+            results = _bulk_create_chunk(db, chunk, claimed)
+        except IntegrityError:
+            db.rollback()
+            continue
+        seen |= claimed
+        return results
+    return _bulk_create_chunk(db, chunk, seen)
+
+
+def bulk_create_questions(
+    db: Session, questions: list[QuestionCreate], chunk_size: int = BULK_CHUNK_SIZE
+) -> list[tuple[BulkItemStatus, int | None]]:
+    """
+    Create many questions with batched, set-based statements.
+
+    Each chunk costs one category lookup, one duplicate lookup and one
+    multi-row INSERT ... RETURNING, committed as its own transaction. Duplicates
+    are detected by normalized text key against the table and earlier items of
+    the same request. Returns a (status, new ID) pair for every input, in order.
+    """
+    seen: set[str] = set()
+    results: list[tuple[BulkItemStatus, int | None]] = [(BulkItemStatus.DUPLICATE, None)] * len(
+        questions
+    )
+
+    indexed = list(enumerate(questions))
+    for start in range(0, len(indexed), chunk_size):
+        for index, status, new_id in _create_chunk(db, indexed[start : start + chunk_size], seen):
+            results[index] = (status, new_id)
+
+    return results
+
+
+def category_move(current: int | None, update_data: dict[str, Any]) -> dict[int | None, int]:
+    """Return the question count changes of an update that may move the question."""
+    target = update_data.get("category_id", current)
+    if target == current:
+        return {}
+    return {current: -1, target: 1}
+
+
 def update_question(
     db: Session, question_id: int, question: QuestionUpdate
 ) -> QuestionModel | None:
-    """Updates the question using only the passed fields."""
+    """
+    Updates the question using only the passed fields.
+
+    Raises DuplicateQuestionError if the new text is taken by another question.
+    """
     db_question = db.get(QuestionModel, question_id)
     if not db_question:
         return None
@@ -48,10 +479,11 @@ def update_question(
     update_data = question.model_dump(exclude_unset=True)
 
     if update_data:
+        adjust_question_counts(db, category_move(db_question.category_id, update_data))
         for key, value in update_data.items():
             setattr(db_question, key, value)
 
-        db.commit()
+        _commit_question(db, db_question.text_key, question_id)
         db.refresh(db_question)
 
     return db_question
@@ -62,5 +494,6 @@ def delete_question(db: Session, question_id: int) -> QuestionModel | None:
     db_question = db.query(QuestionModel).filter(QuestionModel.id == question_id).first()
     if db_question:
         db.delete(db_question)
+        adjust_question_counts(db, {db_question.category_id: -1})
         db.commit()
     return db_question
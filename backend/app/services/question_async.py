@@ -0,0 +1,157 @@
+from typing import Any
+
+from app.core.text import text_key
+from app.db.models.question import Question as QuestionModel
+from app.schemas.question import Question, QuestionCreate, QuestionUpdate
+from app.services.cache import question_cache
+from app.services.category_async import adjust_question_counts
+from app.services.question import (
+    QUESTION_COLUMNS,
+    DuplicateQuestionError,
+    after_key_clause,
+    category_move,
+    question_rows_page_statement,
+    split_question_rows_page,
+    text_key_taken_statement,
+)
+from app.services.versions import get_versions_async
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def get_questions_page(
+    db: AsyncSession,
+    limit: int,
+    after: tuple[int, ...] | None = None,
+    category_id: int | None = None,
+) -> tuple[list[QuestionModel], tuple[int, int] | None]:
+    """
+    Get a page of questions ordered by (category_id, id).
+
+    Returns the page and the key to resume after, or None when this is the last page.
+    """
+    statement = (
+        select(QuestionModel).order_by(QuestionModel.category_id, QuestionModel.id).limit(limit + 1)
+    )
+    if category_id is not None:
+        statement = statement.where(QuestionModel.category_id == category_id)
+    if after is not None:
+        statement = statement.where(after_key_clause(after, category_id))
+
+    questions = list(await db.scalars(statement))
+    if len(questions) <= limit:
+        return questions, None
+
+    last = questions[limit - 1]
+    return questions[:limit], (last.category_id, last.id)
+
+
+async def get_question_rows_page(
+    db: AsyncSession,
+    limit: int,
+    after: tuple[int, ...] | None = None,
+    category_id: int | None = None,
+) -> tuple[list[dict[str, Any]], tuple[int, int] | None]:
+    """Read-only variant of `get_questions_page` returning dicts in `Question` field order."""
+    statement = question_rows_page_statement(limit, after, category_id)
+    rows = [dict(row) for row in (await db.execute(statement)).mappings()]
+    return split_question_rows_page(rows, limit)
+
+
+async def get_question(db: AsyncSession, question_id: int) -> QuestionModel | None:
+    """Get question by ID."""
+    return await db.get(QuestionModel, question_id)
+
+
+async def get_question_row(db: AsyncSession, question_id: int) -> dict[str, Any] | None:
+    """Read-only variant of `get_question` returning a plain dict in `Question` field order."""
+    statement = select(*QUESTION_COLUMNS).where(QuestionModel.id == question_id)
+    row = (await db.execute(statement)).mappings().first()
+    return dict(row) if row is not None else None
+
+
+async def get_question_cached(
+    db: AsyncSession, question_id: int, *, core: bool = False
+) -> Question | None:
+    """
+    Get question by ID through the in-process cache; misses read from the database.
+
+    With `core` set, misses are read by `get_question_row` instead of the ORM.
+    Entries are only served while the `questions` version they were read at is current.
+    """
+    version = (await get_versions_async(db, ("questions",)))["questions"]
+    cached = question_cache.get(question_id, version)
+    if cached is not None:
+        return cached
+    source = (
+        await get_question_row(db, question_id) if core else await get_question(db, question_id)
+    )
+    if source is None:
+        return None
+    question = Question.model_validate(source)
+    question_cache.set(question_id, question, version)
+    return question
+
+
+async def get_question_by_text_case_insensitive(
+    db: AsyncSession, question_text: str
+) -> QuestionModel | None:
+    """Get question by text, ignoring case, Unicode form and whitespace differences."""
+    return await db.scalar(
+        select(QuestionModel).where(QuestionModel.text_key == text_key(question_text)).limit(1)
+    )
+
+
+async def _commit_question(db: AsyncSession, key: str, question_id: int | None = None) -> None:
+    """Commit a question write, raising DuplicateQuestionError if its text key was taken."""
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        if await db.scalar(text_key_taken_statement(key, question_id)) is not None:
+            raise DuplicateQuestionError(key) from exc
+        raise
+
+
+async def create_question(db: AsyncSession, question: QuestionCreate) -> QuestionModel:
+    """Create a new question, raising DuplicateQuestionError if its text is taken."""
+    db_question = QuestionModel(**question.model_dump())
+    db.add(db_question)
+    await adjust_question_counts(db, {question.category_id: 1})
+    await _commit_question(db, db_question.text_key)
+    return db_question
+
+
+async def update_question(
+    db: AsyncSession, question_id: int, question: QuestionUpdate
+) -> QuestionModel | None:
+    """
+    Updates the question using only the passed fields.
+
+    Raises DuplicateQuestionError if the new text is taken by another question.
+    """
+    db_question = await db.get(QuestionModel, question_id)
+    if not db_question:
+        return None
+
+    update_data = question.model_dump(exclude_unset=True)
+
+    if update_data:
+        await adjust_question_counts(db, category_move(db_question.category_id, update_data))
+        for key, value in update_data.items():
+            setattr(db_question, key, value)
+
+        await _commit_question(db, db_question.text_key, question_id)
+
+    return db_question
+
+
+async def delete_question(db: AsyncSession, question_id: int) -> QuestionModel | None:
+    """Delete a question by ID."""
+    db_question = await db.get(QuestionModel, question_id)
+    if db_question:
+        await db.delete(db_question)
+        await adjust_question_counts(db, {db_question.category_id: -1})
+        await db.commit()
+    return db_question
@@ -0,0 +1,123 @@
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from app.core.config import settings
+from app.db.models.category import Category as CategoryModel
+from app.db.models.table_version import VERSIONED_TABLES, TableVersion
+from sqlalchemy import Table, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+BUMPED_TABLES = "bumped_tables"
+# Execution option for statements whose caller bumps the version itself, only if it wrote.
+SKIP_VERSION_BUMP = "skip_version_bump"
+
+versions_table = TableVersion.__table__
+
+
+class VersionSnapshot:
+    """Process-wide copy of the version rows, reused for a short time to live."""
+
+    def __init__(self) -> None:
+        """Create an empty snapshot."""
+        self._expires_at = 0.0
+        self._versions: dict[str, int] | None = None
+
+    def get(self) -> dict[str, int] | None:
+        """Return the versions while the snapshot is fresh, otherwise None."""
+        if self._versions is None or self._expires_at <= time.monotonic():
+            return None
+        return self._versions
+
+    def store(self, rows: Iterable[tuple[str, int]]) -> dict[str, int]:
+        """Replace the snapshot with freshly read rows and return the versions."""
+        versions = dict.fromkeys(VERSIONED_TABLES, 0) | dict(rows)
+        self._expires_at = time.monotonic() + settings.VERSIONS_TTL_SECONDS
+        self._versions = versions
+        return versions
+
+    def clear(self) -> None:
+        """Drop the snapshot so the next read goes to the database."""
+        self._versions = None
+
+
+snapshot = VersionSnapshot()
+
+
+def bump_versions(session: Session, tables: Iterable[str]) -> None:
+    """Increment the version of each table once per transaction, on the writing connection."""
+    bumped: set[str] = session.info.setdefault(BUMPED_TABLES, set())
+    pending = set(tables) - bumped - {versions_table.name}
+    if not pending:
+        return
+    session.connection().execute(
+        versions_table.update()
+        .where(versions_table.c.table_name.in_(sorted(pending)))
+        .values(version=versions_table.c.version + 1)
+    )
+    bumped.update(pending)
+
+
+def _bump_flushed(session: Session, _flush_context: Any) -> None:  # noqa: ANN401
+    """Bump the tables of objects written by a unit-of-work flush."""
+    tables = set()
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        tables.add(instance.__table__.name)
+    # Questions of a deleted category go through ON DELETE CASCADE, unseen by the ORM.
+    if any(isinstance(instance, CategoryModel) for instance in session.deleted):
+        tables.add("questions")
+    bump_versions(session, tables)
+
+
+def _bump_executed(orm_execute_state: ORMExecuteState) -> None:
+    """Bump the target table of INSERT/UPDATE/DELETE statements run through the session."""
+    if orm_execute_state.execution_options.get(SKIP_VERSION_BUMP):
+        return
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = orm_execute_state.statement.table
+        if isinstance(table, Table):
+            bump_versions(orm_execute_state.session, [table.name])
+
+
+def _reset_bumped(session: Session, *_args: Any) -> None:  # noqa: ANN401
+    """Start the next transaction with no tables bumped."""
+    session.info.pop(BUMPED_TABLES, None)
+
+
+def _commit_bumped(session: Session) -> None:
+    """Forget the version snapshot once a local write is committed."""
+    if session.info.pop(BUMPED_TABLES, None):
+        snapshot.clear()
+
+
+event.listen(Session, "after_flush", _bump_flushed)
+event.listen(Session, "do_orm_execute", _bump_executed)
+event.listen(Session, "after_commit", _commit_bumped)
+event.listen(Session, "after_rollback", _reset_bumped)
+
+VERSIONS_QUERY = select(TableVersion.table_name, TableVersion.version).where(
+    TableVersion.table_name.in_(VERSIONED_TABLES)
+)
+
+
+def get_versions(db: Session, tables: Iterable[str]) -> dict[str, int]:
+    """
+    Get the current version of each table.
+
+    Versions are re-read at most every VERSIONS_TTL_SECONDS; writes committed by
+    this process drop the snapshot at once, writes of other workers show up
+    within the TTL.
+    """
+    versions = snapshot.get()
+    if versions is None:
+        versions = snapshot.store(db.execute(VERSIONS_QUERY).all())
+    return {name: versions[name] for name in tables}
+
+
+async def get_versions_async(db: AsyncSession, tables: Iterable[str]) -> dict[str, int]:
+    """Async variant of `get_versions`."""
+    versions = snapshot.get()
+    if versions is None:
+        versions = snapshot.store((await db.execute(VERSIONS_QUERY)).all())
+    return {name: versions[name] for name in tables}
@@ -8,7 +8,7 @@ from typing import Any
 from alembic import context
 from alembic.runtime.migration import MigrationContext
 from app.core.logging_config import get_logger
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import Connection, engine_from_config, pool
 
 logger = get_logger(__name__)
 
@@ -17,9 +17,11 @@ sys.path.append(str(root_path))
 
 try:
     from app.core.config import settings
-    from app.db.database import Base
+    from app.db.database import Base, sync_database_url
     from app.db.models.category import Category  # noqa: F401
     from app.db.models.question import Question  # noqa: F401
+    from app.db.models.table_version import TableVersion  # noqa: F401
+    from app.db.schema import lock_migrations
 
     logger.info("Models have been successfully imported.")
 except ImportError:
@@ -28,7 +30,7 @@ except ImportError:
 
 config = context.config
 
-database_url = str(settings.DATABASE_URL)
+database_url = sync_database_url(str(settings.DATABASE_URL))
 config.set_main_option("sqlalchemy.url", database_url)
 logger.info("Connecting to the database: %s", database_url)
 
@@ -69,16 +71,7 @@ def run_migrations_online() -> None:
                 directives[:] = []
                 logger.info("No changes were found in the scheme.")
 
-    configuration = config.get_section(config.config_ini_section, {})
-    configuration["sqlalchemy.url"] = database_url
-
-    connectable = engine_from_config(
-        configuration,
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
-
-    with connectable.connect() as connection:
+    def run(connection: Connection) -> None:
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
@@ -90,8 +83,27 @@ def run_migrations_online() -> None:
         )
 
         with context.begin_transaction():
+            lock_migrations(connection)
             context.run_migrations()
 
+    # `app.db.schema.upgrade_schema` passes the connection it already holds the lock on.
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        run(connection)
+        return
+
+    configuration = config.get_section(config.config_ini_section, {})
+    configuration["sqlalchemy.url"] = database_url
+
+    connectable = engine_from_config(
+        configuration,
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+
+    with connectable.connect() as connection:
+        run(connection)
+
 
 def include_object(
     _obj: object,
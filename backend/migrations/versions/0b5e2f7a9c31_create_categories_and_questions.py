@@ -0,0 +1,62 @@
+# pylint: disable=no-member
+"""Create categories and questions.
+
+Revision ID: 0b5e2f7a9c31
+Revises:
+Create Date: 2025-09-01 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0b5e2f7a9c31"
+down_revision: str | Sequence[str] | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Raises:
+        RuntimeError: If the tables already exist, i.e. the database was created
+            by `create_all` before the migration series and was never stamped.
+    """
+    if sa.inspect(op.get_bind()).has_table("categories"):
+        msg = (
+            "The database predates the migrations: run `python -m app.jobs.migrate`, "
+            "or `alembic stamp 1ef649ed4eb1` before `alembic upgrade head`."
+        )
+        raise RuntimeError(msg)
+
+    op.create_table(
+        "categories",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_categories")),
+    )
+    with op.batch_alter_table("categories", schema=None) as batch_op:
+        batch_op.create_index(batch_op.f("ix_categories_id"), ["id"], unique=False)
+        batch_op.create_index(batch_op.f("ix_categories_name"), ["name"], unique=True)
+
+    # The foreign key to categories is added with ON DELETE CASCADE by 1ef649ed4eb1.
+    op.create_table(
+        "questions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("question_text", sa.Text(), nullable=False),
+        sa.Column("answer_text", sa.Text(), nullable=False),
+        sa.Column("category_id", sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_questions")),
+    )
+    with op.batch_alter_table("questions", schema=None) as batch_op:
+        batch_op.create_index(batch_op.f("ix_questions_id"), ["id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("questions")
+    op.drop_table("categories")
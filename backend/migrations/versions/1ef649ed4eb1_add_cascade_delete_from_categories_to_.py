@@ -2,7 +2,7 @@
 """Add cascade delete from categories to questions.
 
 Revision ID: 1ef649ed4eb1
-Revises:
+Revises: 0b5e2f7a9c31
 Create Date: 2025-09-08 03:06:44.910122
 
 """
@@ -14,7 +14,7 @@ from alembic import op
 
 # revision identifiers, used by Alembic.
 revision: str = "1ef649ed4eb1"
-down_revision: str | Sequence[str] | None = None
+down_revision: str | Sequence[str] | None = "0b5e2f7a9c31"
 branch_labels: str | Sequence[str] | None = None
 depends_on: str | Sequence[str] | None = None
 
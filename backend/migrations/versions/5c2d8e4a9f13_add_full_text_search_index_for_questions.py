@@ -0,0 +1,83 @@
+# pylint: disable=no-member
+"""Add full-text search index for questions.
+
+Revision ID: 5c2d8e4a9f13
+Revises: 1ef649ed4eb1
+Create Date: 2026-10-18 09:12:31.482311
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c2d8e4a9f13"
+down_revision: str | Sequence[str] | None = "1ef649ed4eb1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# The search DDL of app.db.search as of this revision, copied so that later changes
+# to the application cannot change what this migration creates.
+POSTGRESQL_SEARCH_DDL = (
+    (
+        "CREATE INDEX IF NOT EXISTS ix_questions_search ON questions USING gin "
+        "(to_tsvector('simple'::regconfig, question_text || ' ' || answer_text))"
+    ),
+)
+
+SQLITE_SEARCH_DDL = (
+    (
+        "CREATE VIRTUAL TABLE IF NOT EXISTS questions_fts USING fts5("
+        "question_text, answer_text, content='questions', content_rowid='id', "
+        "tokenize='unicode61 remove_diacritics 2')"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS questions_fts_ai AFTER INSERT ON questions BEGIN "
+        "INSERT INTO questions_fts(rowid, question_text, answer_text) "
+        "VALUES (new.id, new.question_text, new.answer_text); END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS questions_fts_ad AFTER DELETE ON questions BEGIN "
+        "INSERT INTO questions_fts(questions_fts, rowid, question_text, answer_text) "
+        "VALUES ('delete', old.id, old.question_text, old.answer_text); END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS questions_fts_au AFTER UPDATE ON questions BEGIN "
+        "INSERT INTO questions_fts(questions_fts, rowid, question_text, answer_text) "
+        "VALUES ('delete', old.id, old.question_text, old.answer_text); "
+        "INSERT INTO questions_fts(rowid, question_text, answer_text) "
+        "VALUES (new.id, new.question_text, new.answer_text); END"
+    ),
+)
+
+SQLITE_SEARCH_REBUILD = "INSERT INTO questions_fts(questions_fts) VALUES ('rebuild')"
+
+SQLITE_SEARCH_DROP_DDL = (
+    "DROP TRIGGER IF EXISTS questions_fts_au",
+    "DROP TRIGGER IF EXISTS questions_fts_ad",
+    "DROP TRIGGER IF EXISTS questions_fts_ai",
+    "DROP TABLE IF EXISTS questions_fts",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        for statement in POSTGRESQL_SEARCH_DDL:
+            op.execute(statement)
+    elif dialect == "sqlite":
+        for statement in SQLITE_SEARCH_DDL:
+            op.execute(statement)
+        op.execute(SQLITE_SEARCH_REBUILD)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.drop_index("ix_questions_search", table_name="questions", if_exists=True)
+    elif dialect == "sqlite":
+        for statement in SQLITE_SEARCH_DROP_DDL:
+            op.execute(statement)
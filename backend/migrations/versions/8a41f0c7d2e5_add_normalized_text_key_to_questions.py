@@ -0,0 +1,122 @@
+# pylint: disable=no-member
+"""Add normalized text key to questions.
+
+Revision ID: 8a41f0c7d2e5
+Revises: 5c2d8e4a9f13
+Create Date: 2026-10-18 11:40:02.913574
+
+"""
+
+import hashlib
+import logging
+import re
+import unicodedata
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8a41f0c7d2e5"
+down_revision: str | Sequence[str] | None = "5c2d8e4a9f13"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+# Copies of app.core.text and app.db.search as of this revision, so later changes there
+# cannot alter what this migration writes.
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+SQLITE_FTS_TRIGGERS = (
+    (
+        "CREATE TRIGGER IF NOT EXISTS questions_fts_ai AFTER INSERT ON questions BEGIN "
+        "INSERT INTO questions_fts(rowid, question_text, answer_text) "
+        "VALUES (new.id, new.question_text, new.answer_text); END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS questions_fts_ad AFTER DELETE ON questions BEGIN "
+        "INSERT INTO questions_fts(questions_fts, rowid, question_text, answer_text) "
+        "VALUES ('delete', old.id, old.question_text, old.answer_text); END"
+    ),
+    (
+        "CREATE TRIGGER IF NOT EXISTS questions_fts_au AFTER UPDATE ON questions BEGIN "
+        "INSERT INTO questions_fts(questions_fts, rowid, question_text, answer_text) "
+        "VALUES ('delete', old.id, old.question_text, old.answer_text); "
+        "INSERT INTO questions_fts(rowid, question_text, answer_text) "
+        "VALUES (new.id, new.question_text, new.answer_text); END"
+    ),
+)
+
+questions = sa.table(
+    "questions",
+    sa.column("id", sa.Integer),
+    sa.column("question_text", sa.Text),
+    sa.column("text_key", sa.String(64)),
+)
+
+
+def _text_key(text: str) -> str:
+    """Hash of the NFKC-normalized, casefolded text with whitespace runs collapsed."""
+    normalized = WHITESPACE_PATTERN.sub(" ", unicodedata.normalize("NFKC", text).casefold())
+    return hashlib.sha256(normalized.strip().encode()).hexdigest()
+
+
+def _backfill_text_keys() -> None:
+    """Fill `text_key` in id-ordered batches, suffixing keys of legacy near-duplicates."""
+    bind = op.get_bind()
+    seen: set[str] = set()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(questions.c.id, questions.c.question_text)
+            .where(questions.c.id > last_id)
+            .order_by(questions.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+
+        updates = []
+        for row in rows:
+            key = _text_key(row.question_text)
+            if key in seen:
+                logger.warning("Question %s duplicates an earlier question text", row.id)
+                key = _text_key(f"{row.question_text}\x00{row.id}")
+            seen.add(key)
+            updates.append({"row_id": row.id, "key": key})
+
+        bind.execute(
+            questions.update()
+            .where(questions.c.id == sa.bindparam("row_id"))
+            .values(text_key=sa.bindparam("key")),
+            updates,
+        )
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("questions", sa.Column("text_key", sa.String(length=64), nullable=True))
+    _backfill_text_keys()
+    with op.batch_alter_table("questions", schema=None) as batch_op:
+        batch_op.alter_column("text_key", existing_type=sa.String(length=64), nullable=False)
+        batch_op.create_index(batch_op.f("ix_questions_text_key"), ["text_key"], unique=True)
+
+    # SQLite batch mode recreates the table, which drops the full-text triggers.
+    if op.get_bind().dialect.name == "sqlite":
+        for statement in SQLITE_FTS_TRIGGERS:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("questions", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_questions_text_key"))
+        batch_op.drop_column("text_key")
+
+    if op.get_bind().dialect.name == "sqlite":
+        for statement in SQLITE_FTS_TRIGGERS:
+            op.execute(statement)
@@ -0,0 +1,54 @@
+# pylint: disable=no-member
+"""Add case-insensitive unique index on category names.
+
+Revision ID: b3e97d1c5a60
+Revises: 8a41f0c7d2e5
+Create Date: 2026-10-18 19:05:47.206118
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3e97d1c5a60"
+down_revision: str | Sequence[str] | None = "8a41f0c7d2e5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Copied from app.db.models.category as of this revision; the model may change later.
+NAME_INDEX = "uq_categories_name_ci"
+POSTGRESQL_NAME_INDEX_DDL = (
+    f"CREATE UNIQUE INDEX IF NOT EXISTS {NAME_INDEX} ON categories (lower(name))"
+)
+SQLITE_NAME_INDEX_DDL = (
+    f"CREATE UNIQUE INDEX IF NOT EXISTS {NAME_INDEX} ON categories (name COLLATE NOCASE)"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    duplicates = (
+        op.get_bind()
+        .execute(
+            sa.text("SELECT lower(name) FROM categories GROUP BY lower(name) HAVING count(*) > 1")
+        )
+        .scalars()
+        .all()
+    )
+    if duplicates:
+        msg = f"Rename categories differing only by case before upgrading: {duplicates}"
+        raise RuntimeError(msg)
+
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute(POSTGRESQL_NAME_INDEX_DDL)
+    elif dialect == "sqlite":
+        op.execute(SQLITE_NAME_INDEX_DDL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(NAME_INDEX, table_name="categories", if_exists=True)
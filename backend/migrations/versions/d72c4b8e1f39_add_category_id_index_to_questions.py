@@ -0,0 +1,28 @@
+# pylint: disable=no-member
+"""Add (category_id, id) index to questions.
+
+Revision ID: d72c4b8e1f39
+Revises: b3e97d1c5a60
+Create Date: 2026-10-18 19:21:08.645730
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d72c4b8e1f39"
+down_revision: str | Sequence[str] | None = "b3e97d1c5a60"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_questions_category_id_id", "questions", ["category_id", "id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_questions_category_id_id", table_name="questions")
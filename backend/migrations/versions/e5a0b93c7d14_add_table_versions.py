@@ -0,0 +1,40 @@
+# pylint: disable=no-member
+"""Add table_versions change counters.
+
+Revision ID: e5a0b93c7d14
+Revises: d72c4b8e1f39
+Create Date: 2026-10-18 20:02:15.337904
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a0b93c7d14"
+down_revision: str | Sequence[str] | None = "d72c4b8e1f39"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# The tables versioned at this revision, as listed in app.db.models.table_version.
+VERSIONED_TABLES = ("categories", "questions")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    table_versions = op.create_table(
+        "table_versions",
+        sa.Column("table_name", sa.String(length=64), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("table_name", name=op.f("pk_table_versions")),
+    )
+    op.bulk_insert(
+        table_versions, [{"table_name": name, "version": 0} for name in VERSIONED_TABLES]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("table_versions")
@@ -0,0 +1,44 @@
+# pylint: disable=no-member
+"""Add question_count counters to categories.
+
+Revision ID: f3b6c1d8a274
+Revises: e5a0b93c7d14
+Create Date: 2026-10-18 21:14:52.604187
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3b6c1d8a274"
+down_revision: str | Sequence[str] | None = "e5a0b93c7d14"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+categories = sa.table(
+    "categories", sa.column("id", sa.Integer), sa.column("question_count", sa.Integer)
+)
+questions = sa.table("questions", sa.column("category_id", sa.Integer))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "categories",
+        sa.Column("question_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.execute(
+        categories.update().values(
+            question_count=sa.select(sa.func.count())
+            .where(questions.c.category_id == categories.c.id)
+            .scalar_subquery()
+        )
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("categories", "question_count")
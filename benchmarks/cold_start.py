@@ -0,0 +1,76 @@
+"""
+Measure the cold start of the backend: import time and time to first request.
+
+Run from the repository root:
+
+    PYTHONPATH=backend python benchmarks/cold_start.py [runs]
+
+Every stage runs in a fresh interpreter, so nothing is cached between runs.
+`config` and `database` are what migrations and scripts pay; `main` is the
+bare import of the web module; `create_app` adds the app factory; `first
+request` adds the lifespan (schema creation and the schema check) and one
+category list request. The database is a throwaway SQLite file and the log
+goes to a temporary directory. Medians in milliseconds are printed.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+DEFAULT_RUNS = 5
+BACKEND_DIR = Path(__file__).resolve().parents[1] / "backend"
+
+TIMER = "import time\nstart = time.perf_counter()\n"
+REPORT = "\nprint(time.perf_counter() - start)\n"
+
+STAGES = {
+    "config": "import app.core.config",
+    "database": "import app.db.database",
+    "main": "import app.main",
+    "create_app": "import app.main\napp.main.create_app()",
+    "first request": (
+        "from fastapi.testclient import TestClient\n"
+        "import app.main\n"
+        "with TestClient(app.main.create_app()) as client:\n"
+        "    client.get('/api/v1/categories/').raise_for_status()"
+    ),
+}
+# Imported before the timer starts: the HTTP client is not part of the server's start.
+PRELUDE = {"first request": "import httpx\n"}
+
+
+def run_stage(name: str, env: dict[str, str]) -> float:
+    """Run one stage in a new interpreter and return its duration in seconds."""
+    code = PRELUDE.get(name, "") + TIMER + STAGES[name] + REPORT
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """Time every stage and print the median of the runs."""
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RUNS
+    with tempfile.TemporaryDirectory() as workdir:
+        env = os.environ | {
+            "PYTHONPATH": str(BACKEND_DIR),
+            "DATABASE_URL": f"sqlite:///{workdir}/cold_start.db",
+            "DB_CREATE_ALL": "true",
+            "LOG_FILE": f"{workdir}/logs/app.log",
+            "LOG_LEVEL": "WARNING",
+        }
+        for name in STAGES:
+            durations = [run_stage(name, env) for _ in range(runs)]
+            median = statistics.median(durations)
+            sys.stdout.write(f"{name:>14}: {median * 1e3:7.1f} ms (median of {runs})\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Compare the ORM and Core read paths for a large page of questions.
+
+Run from the repository root:
+
+    PYTHONPATH=backend python benchmarks/read_path.py [rows]
+
+Both paths read the same page from an in-memory SQLite database and encode it
+to JSON. `orm` hydrates identity-mapped Question instances and validates them
+through `TypeAdapter(list[Question])`; `core` selects the columns and encodes
+the row dicts with `to_json`. The script checks both produce identical bytes.
+"""
+
+import sys
+import timeit
+
+from app.db.database import Base
+from app.db.models.category import Category as CategoryModel
+from app.db.models.question import Question as QuestionModel
+from app.schemas.question import QuestionList
+from app.services import question as question_service
+from pydantic_core import to_json
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+DEFAULT_ROWS = 10_000
+REPEAT = 5
+
+
+def seed(db: Session, count: int) -> None:
+    """Insert `count` questions spread over a few categories."""
+    db.execute(insert(CategoryModel), [{"name": f"Category {i}"} for i in range(1, 21)])
+    db.execute(
+        insert(QuestionModel),
+        [
+            {
+                "question_text": f"What is the difference between process and thread #{i}?",
+                "text_key": f"{i:064x}",
+                "answer_text": "A process owns its memory; threads share the memory. " * 4,
+                "category_id": i % 20 + 1,
+            }
+            for i in range(count)
+        ],
+    )
+    db.commit()
+
+
+def orm(db: Session, count: int) -> bytes:
+    """Read and encode through ORM instances."""
+    questions, _ = question_service.get_questions_page(db, limit=count)
+    encoded = QuestionList.dump_json(QuestionList.validate_python(questions, from_attributes=True))
+    db.expunge_all()
+    return encoded
+
+
+def core(db: Session, count: int) -> bytes:
+    """Read and encode through Core row mappings."""
+    rows, _ = question_service.get_question_rows_page(db, limit=count)
+    return to_json(rows)
+
+
+def main() -> None:
+    """Time both paths and print microseconds per row."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        seed(db, count)
+        if orm(db, count) != core(db, count):
+            sys.exit("Encoded pages differ")
+
+        for name, function in (("orm", orm), ("core", core)):
+            best = min(timeit.repeat(lambda f=function: f(db, count), number=1, repeat=REPEAT))
+            sys.stdout.write(f"{name:>4}: {best * 1e6 / count:6.2f} us/row ({best * 1e3:.1f} ms)\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Compare per-row cost of serializing a question list page.
+
+Run from the repository root:
+
+    PYTHONPATH=backend python benchmarks/serialization.py [rows]
+
+`before` reproduces the former handler: one `model_validate` per ORM row, a
+page model returned to FastAPI, re-validated against the response model and
+encoded through `jsonable_encoder` and `json.dumps`. `after` is the current
+path: one `TypeAdapter(list[Question])` validation and a single `dump_json`.
+"""
+
+import json
+import sys
+import timeit
+
+from app.core.responses import page_response
+from app.db.models.category import Category as CategoryModel  # noqa: F401
+from app.db.models.question import Question as QuestionModel
+from app.schemas.question import Question, QuestionList, QuestionPage
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+
+DEFAULT_ROWS = 10_000
+REPEAT = 5
+
+
+def make_rows(count: int) -> list[QuestionModel]:
+    """Build ORM instances shaped like a typical page of questions."""
+    return [
+        QuestionModel(
+            id=i,
+            question_text=f"What is the difference between process and thread #{i}?",
+            answer_text="A process owns its memory; threads share the memory of one process. " * 4,
+            category_id=i % 20 + 1,
+        )
+        for i in range(count)
+    ]
+
+
+def before(rows: list[QuestionModel]) -> bytes:
+    """Serialize the way the handler and FastAPI did before."""
+    page = QuestionPage(items=[Question.model_validate(q) for q in rows], next_cursor="abc")
+    revalidated = QuestionPage.model_validate(page, from_attributes=True)
+    content = jsonable_encoder(revalidated)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def after(rows: list[QuestionModel]) -> bytes:
+    """Serialize through the list adapter once."""
+    items = QuestionList.validate_python(rows, from_attributes=True)
+    return page_response(QuestionList.dump_json(items), "abc", Response()).body
+
+
+def main() -> None:
+    """Time both paths and print microseconds per row."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    rows = make_rows(count)
+    if json.loads(before(rows)) != json.loads(after(rows)):
+        sys.exit("Serialized pages differ")
+
+    for name, function in (("before", before), ("after", after)):
+        best = min(timeit.repeat(lambda f=function: f(rows), number=1, repeat=REPEAT))
+        sys.stdout.write(f"{name:>6}: {best * 1e6 / count:6.2f} us/row ({best * 1e3:.1f} ms)\n")
+
+
+if __name__ == "__main__":
+    main()
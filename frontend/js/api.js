@@ -1,14 +1,39 @@
+// Fetch every page of a cursor-paginated list endpoint, optionally resuming at a cursor
+async function fetchAllPages(path, cursor = null) {
+    const items = [];
+
+    do {
+        const params = new URLSearchParams({ limit: CONFIG.apiPageSize });
+        if (cursor) params.set('cursor', cursor);
+
+        const response = await fetch(`${API_BASE}${path}?${params}`);
+        if (!response.ok) {
+            throw new Error('Ошибка сервера');
+        }
+
+        const page = await response.json();
+        items.push(...page.items);
+        cursor = page.next_cursor;
+    } while (cursor);
+
+    return items;
+}
+
 // Load data from API
 async function loadData() {
     try {
         showLoading();
-        const [categoriesResponse, questionsResponse] = await Promise.all([
-            fetch(`${API_BASE}/categories/`),
-            fetch(`${API_BASE}/questions/`)
-        ]);
-
-        appState.categories = await categoriesResponse.json();
-        appState.questions = await questionsResponse.json();
+        // Categories, their question counts and the first page arrive in one request
+        const params = new URLSearchParams({ limit: CONFIG.apiPageSize });
+        const response = await fetch(`${API_BASE}/bootstrap?${params}`);
+        if (!response.ok) {
+            throw new Error('Ошибка сервера');
+        }
+        const bootstrap = await response.json();
+
+        appState.categories = bootstrap.categories;
+        appState.questions = bootstrap.questions.items;
+        appState.totalQuestions = bootstrap.total_questions;
 
         // Sort categories alphabetically
         appState.categories.sort((a, b) => a.name.localeCompare(b.name, 'ru'));
@@ -20,12 +45,37 @@ async function loadData() {
         updateStats();
         populateSelects();
 
+        // The remaining questions load after the first paint
+        if (bootstrap.questions.next_cursor) {
+            const rest = await fetchAllPages('/questions/', bootstrap.questions.next_cursor);
+            appState.questions.push(...rest);
+            // Keep any category filter or search applied while the pages were loading
+            await filterQuestions();
+            renderCategories();
+            renderQuestions();
+            renderManagement();
+            updateStats();
+        }
+
     } catch (error) {
         showNotification('Ошибка загрузки данных', 'error');
         console.error('Load error:', error);
     }
 }
 
+// Full-text search on the server
+async function searchQuestionsAPI(query, categoryId) {
+    const params = new URLSearchParams({ q: query, limit: CONFIG.apiPageSize });
+    if (categoryId) params.set('category_id', categoryId);
+
+    const response = await fetch(`${API_BASE}/questions/search?${params}`);
+    if (!response.ok) {
+        throw new Error('Ошибка сервера');
+    }
+
+    return response.json();
+}
+
 // Add category
 async function addCategoryAPI(name) {
     const response = await fetch(`${API_BASE}/categories/`, {
@@ -2,6 +2,7 @@
 let appState = {
     categories: [],
     questions: [],
+    totalQuestions: 0,
     filteredQuestions: [],
     selectedCategory: null,
     searchQuery: '',
@@ -42,36 +43,46 @@ function setupEventListeners() {
 }
 
 // Select category filter
-function selectCategory(categoryId) {
+async function selectCategory(categoryId) {
     appState.selectedCategory = appState.selectedCategory === categoryId ? null : categoryId;
     appState.currentPage = 1;
-    filterQuestions();
+    await filterQuestions();
     renderCategories();
     renderQuestions();
     updateStats();
 }
 
-// Handle search
+// Handle search (debounced, the server does the matching)
+let searchTimer = null;
 function handleSearch(event) {
-    appState.searchQuery = event.target.value.toLowerCase();
-    appState.currentPage = 1;
-    filterQuestions();
-    renderQuestions();
-    updateStats();
+    clearTimeout(searchTimer);
+    searchTimer = setTimeout(async () => {
+        appState.searchQuery = event.target.value.trim();
+        appState.currentPage = 1;
+        await filterQuestions();
+        renderQuestions();
+        updateStats();
+    }, CONFIG.searchDebounceMs);
 }
 
 // Filter questions based on search and category
-function filterQuestions() {
-    appState.filteredQuestions = appState.questions.filter(question => {
-        const matchesSearch = !appState.searchQuery ||
-            question.question_text.toLowerCase().includes(appState.searchQuery) ||
-            question.answer_text.toLowerCase().includes(appState.searchQuery);
-
-        const matchesCategory = !appState.selectedCategory ||
-            question.category_id === appState.selectedCategory;
+async function filterQuestions() {
+    if (appState.searchQuery) {
+        try {
+            const query = appState.searchQuery;
+            const result = await searchQuestionsAPI(query, appState.selectedCategory);
+            if (query === appState.searchQuery) {
+                appState.filteredQuestions = result.items;
+            }
+        } catch (error) {
+            showNotification('Ошибка поиска', 'error');
+        }
+        return;
+    }
 
-        return matchesSearch && matchesCategory;
-    });
+    appState.filteredQuestions = appState.questions.filter(question =>
+        !appState.selectedCategory || question.category_id === appState.selectedCategory
+    );
 }
 
 // Go to specific page
@@ -282,12 +293,12 @@ function toggleCategoryQuestions(categoryId) {
 }
 
 // Show all questions (clear filters)
-function showAllQuestions() {
+async function showAllQuestions() {
     appState.selectedCategory = null;
     appState.searchQuery = '';
     document.getElementById('search-input').value = '';
     appState.currentPage = 1;
-    filterQuestions();
+    await filterQuestions();
     renderCategories();
     renderQuestions();
     updateStats();
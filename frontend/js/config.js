@@ -9,6 +9,8 @@ const API_BASE = getApiBaseUrl();
 
 const CONFIG = {
     questionsPerPage: 12,
+    apiPageSize: 500,
+    searchDebounceMs: 250,
     notificationDuration: 3000,
     maxVisiblePages: 5,
     geometricShapesCount: 20
@@ -50,7 +50,8 @@ function renderCategories() {
     }
 
     container.innerHTML = appState.categories.map(category => {
-        const questionsCount = appState.questions.filter(q => q.category_id === category.id).length;
+        const questionsCount = category.question_count
+            ?? appState.questions.filter(q => q.category_id === category.id).length;
         const isSelected = appState.selectedCategory === category.id;
 
         return `
@@ -199,7 +200,8 @@ function renderManagement() {
     let html = '';
 
     appState.categories.forEach(category => {
-        const questionsCount = appState.questions.filter(q => q.category_id === category.id).length;
+        const questionsCount = category.question_count
+            ?? appState.questions.filter(q => q.category_id === category.id).length;
         const isExpanded = appState.expandedCategories.has(category.id);
 
         // Category header
@@ -248,7 +250,7 @@ function renderManagement() {
 // Update stats
 function updateStats() {
     document.getElementById('categories-count').textContent = appState.categories.length;
-    document.getElementById('questions-count').textContent = appState.questions.length;
+    document.getElementById('questions-count').textContent = appState.totalQuestions;
 
     // Calculate how many questions are currently shown on this page
     const startIndex = (appState.currentPage - 1) * appState.questionsPerPage;
@@ -75,8 +75,8 @@ class TestQuestionsAPI:
 
         with allure.step("Verifying response"):
             assert response.ok, f"Failed to get all questions. Status: {response.status}"
-            questions = response.json()
-            assert isinstance(questions, list), "Response should be a list"
+            questions = response.json()["items"]
+            assert isinstance(questions, list), "Response items should be a list"
 
             question_ids = [q["id"] for q in questions]
             assert managed_question in question_ids, (
@@ -123,6 +123,6 @@ class TestQuestionsAPI:
 
         with allure.step("Verifying empty list response"):
             assert response.ok
-            questions = response.json()
+            questions = response.json()["items"]
             assert isinstance(questions, list)
             assert len(questions) == 0, f"Expected empty list, got {len(questions)} questions"
@@ -7,6 +7,8 @@ import pytest
 from app.core.logging_config import get_logger
 from app.db.database import Base, get_db
 from app.main import app
+from app.services.cache import clear_caches
+from app.services.versions import snapshot
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
@@ -55,6 +57,8 @@ app.dependency_overrides[get_db] = override_get_db
 def db_session() -> Generator[Session]:
     """Create a database session for testing."""
     Base.metadata.create_all(bind=test_engine)
+    clear_caches()
+    snapshot.clear()
     session = TestingSessionLocal()
     try:
         yield session
@@ -63,10 +67,22 @@ def db_session() -> Generator[Session]:
         Base.metadata.drop_all(bind=test_engine)
 
 
+@pytest.fixture
+def other_session() -> Generator[Session]:
+    """A second session on the test database, standing in for a concurrent request."""
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
 @pytest.fixture
 def client() -> Generator[TestClient]:
     """Provide FastAPI TestClient for integration tests."""
     Base.metadata.create_all(bind=test_engine)
+    clear_caches()
+    snapshot.clear()
     with TestClient(app) as test_client:
         yield test_client
     Base.metadata.drop_all(bind=test_engine)
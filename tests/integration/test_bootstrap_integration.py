@@ -0,0 +1,62 @@
+from http import HTTPStatus
+
+import allure
+from fastapi.testclient import TestClient
+
+PAGE_SIZE = 3
+
+
+@allure.feature("Bootstrap Integration")
+class TestBootstrapIntegration:
+    """Integration tests for the first-paint bootstrap endpoint."""
+
+    @allure.story("Bootstrap")
+    @allure.title("Test categories, counts and the first question page in one response")
+    def test_bootstrap(self, client: TestClient, sample_category: dict) -> None:
+        """Test the bootstrap payload, its continuation cursor, ETag and compression."""
+        with allure.step("Create five questions"):
+            client.post(
+                "/api/v1/questions/bulk",
+                json=[
+                    {
+                        "question_text": f"Bootstrap question {i}?",
+                        "answer_text": "An answer long enough to be worth compressing. " * 10,
+                        "category_id": sample_category["id"],
+                    }
+                    for i in range(5)
+                ],
+            )
+
+        with allure.step("Request the bootstrap payload accepting gzip"):
+            response = client.get(
+                "/api/v1/bootstrap",
+                params={"limit": PAGE_SIZE},
+                headers={"Accept-Encoding": "gzip"},
+            )
+
+        with allure.step("Verify the categories, counts and first page"):
+            assert response.status_code == HTTPStatus.OK, "Expected 200 OK for bootstrap."
+            assert response.headers["Content-Encoding"] == "gzip", "Expected a gzipped payload."
+            data = response.json()
+            expected_total = 5
+            assert data["categories"] == [{**sample_category, "question_count": expected_total}], (
+                "Categories should carry their question counts."
+            )
+            assert data["total_questions"] == expected_total, "Unexpected question total."
+            assert len(data["questions"]["items"]) == PAGE_SIZE, "Expected one page of questions."
+
+        with allure.step("Resume the question list with the returned cursor"):
+            rest = client.get(
+                "/api/v1/questions/",
+                params={"limit": PAGE_SIZE, "cursor": data["questions"]["next_cursor"]},
+            ).json()
+            ids = [item["id"] for item in data["questions"]["items"] + rest["items"]]
+            assert len(set(ids)) == expected_total, "The cursor should continue the first page."
+
+        with allure.step("Revalidate with the ETag, then after a write"):
+            etag = response.headers["ETag"]
+            unchanged = client.get("/api/v1/bootstrap", headers={"If-None-Match": etag})
+            client.delete(f"/api/v1/questions/{ids[0]}")
+            changed = client.get("/api/v1/bootstrap", headers={"If-None-Match": etag})
+            assert unchanged.status_code == HTTPStatus.NOT_MODIFIED, "Expected 304 while unchanged."
+            assert changed.status_code == HTTPStatus.OK, "A question write should change the ETag."
@@ -195,3 +195,60 @@ class TestCategoriesIntegration:
             assert question_get_response.status_code == HTTPStatus.NOT_FOUND, (
                 "The question was not deleted as part of the cascade delete."
             )
+
+    @allure.story("Category Stats")
+    @allure.title("Test question counts per category")
+    def test_category_stats(self, client: TestClient, sample_category: dict) -> None:
+        """Test the stats follow question writes and revalidate with the ETag."""
+        other = client.post("/api/v1/categories/", json={"name": "Empty"}).json()
+
+        with allure.step("Create two questions and read the stats"):
+            for i in range(2):
+                client.post(
+                    "/api/v1/questions/",
+                    json={
+                        "question_text": f"Counted Q{i}?",
+                        "answer_text": "A",
+                        "category_id": sample_category["id"],
+                    },
+                )
+            response = client.get("/api/v1/categories/stats")
+
+        with allure.step("Verify the counts and the total"):
+            assert response.status_code == HTTPStatus.OK, "Expected 200 OK for the stats."
+            stats = response.json()
+            counts = {item["id"]: item["question_count"] for item in stats["items"]}
+            assert counts == {sample_category["id"]: 2, other["id"]: 0}, "Unexpected counts."
+            assert stats["total_questions"] == sum(counts.values()), "Total should add up."
+
+        with allure.step("Revalidate, then delete a question and read again"):
+            etag = response.headers["ETag"]
+            unchanged = client.get("/api/v1/categories/stats", headers={"If-None-Match": etag})
+            question_id = client.get("/api/v1/questions/").json()["items"][0]["id"]
+            client.delete(f"/api/v1/questions/{question_id}")
+            changed = client.get("/api/v1/categories/stats", headers={"If-None-Match": etag})
+
+        with allure.step("Verify the ETag follows question writes"):
+            assert unchanged.status_code == HTTPStatus.NOT_MODIFIED, "Unchanged stats should 304."
+            assert changed.status_code == HTTPStatus.OK, "A question delete should change the ETag."
+            assert changed.json()["total_questions"] == 1, "The delete should be counted."
+
+    @allure.story("Batch Categories")
+    @allure.title("Test fetching categories by ID in one request")
+    def test_categories_batch(self, client: TestClient, sample_category: dict) -> None:
+        """Test GET and POST batches keep the order and report missing IDs."""
+        other = client.post("/api/v1/categories/", json={"name": "Other"}).json()
+        requested = [other["id"], 999, sample_category["id"]]
+
+        with allure.step("Fetch the categories with the query string and with a body"):
+            by_query = client.get(
+                "/api/v1/categories/batch", params={"ids": ",".join(map(str, requested))}
+            )
+            by_body = client.post("/api/v1/categories/batch", json={"ids": requested})
+
+        with allure.step("Verify the results"):
+            assert by_query.status_code == HTTPStatus.OK, "Expected 200 OK for a batch."
+            assert by_query.json() == {"items": [other, sample_category], "missing": [999]}, (
+                "Items should follow the requested order and list the missing ID."
+            )
+            assert by_body.json() == by_query.json(), "GET and POST should agree."
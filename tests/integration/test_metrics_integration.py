@@ -0,0 +1,93 @@
+from http import HTTPStatus
+
+import allure
+from app.core.metrics import DB_STATEMENTS, REQUEST_DURATION, MetricsMiddleware
+from app.core.request_id import RequestIdMiddleware
+from app.main import get_app
+from fastapi.testclient import TestClient
+
+CATEGORY_ROUTE = "/api/v1/categories/{category_id}"
+
+
+@allure.feature("Metrics Integration")
+class TestMetricsIntegration:
+    """Integration tests for metrics, health probes, request IDs and pool stats."""
+
+    @allure.story("Prometheus Metrics")
+    @allure.title("Test requests are measured by route template")
+    def test_metrics_by_route_template(self, client: TestClient, sample_category: dict) -> None:
+        """Test latency and SQL statements are labeled with the route, not the URL."""
+        statements_before = DB_STATEMENTS.value((CATEGORY_ROUTE,))
+
+        with allure.step("Read the category and scrape the metrics"):
+            client.get(f"/api/v1/categories/{sample_category['id']}")
+            response = client.get("/metrics")
+
+        with allure.step("Verify the exposition"):
+            assert response.status_code == HTTPStatus.OK, "The scrape should succeed."
+            assert response.headers["content-type"].startswith("text/plain"), (
+                "Prometheus expects the text exposition format."
+            )
+            text = response.text
+            assert f'route="{CATEGORY_ROUTE}",status="200"' in text, (
+                "Latency should be labeled by the route template and status."
+            )
+            assert f"/api/v1/categories/{sample_category['id']}" not in text, (
+                "Concrete URLs must not become label values."
+            )
+            assert "# TYPE http_request_duration_seconds histogram" in text, (
+                "The latency histogram should be exposed."
+            )
+            assert 'db_pool_connections{engine="sync"' in text, "Pool gauges should be exposed."
+            assert DB_STATEMENTS.value((CATEGORY_ROUTE,)) > statements_before, (
+                "The SQL statements of the read should be attributed to its route."
+            )
+            assert REQUEST_DURATION.name in text, "The latency metric should be rendered."
+
+    @allure.story("Health Probes")
+    @allure.title("Test the liveness and readiness probes")
+    def test_health_probes(self, client: TestClient) -> None:
+        """Test liveness answers without checks and readiness reports the database."""
+        with allure.step("Call both probes"):
+            live = client.get("/health/live")
+            ready = client.get("/health/ready")
+
+        with allure.step("Verify the probe responses"):
+            assert live.status_code == HTTPStatus.OK, "The liveness probe should succeed."
+            assert live.json() == {"status": "alive"}, "The liveness body is fixed."
+            assert ready.status_code == HTTPStatus.OK, "The readiness probe should succeed."
+            body = ready.json()
+            assert body["database"] == "ok", "The database check should pass."
+            assert "sync" in body["pool_saturation"], "Pool saturation should be reported."
+
+    @allure.story("Request ID")
+    @allure.title("Test request IDs are kept or generated and echoed")
+    def test_request_id_header(self, client: TestClient) -> None:
+        """Test a valid incoming request ID is echoed and a missing one generated."""
+        with allure.step("Send requests with and without an ID"):
+            given = client.get("/health/live", headers={"X-Request-ID": "req-42"})
+            generated = client.get("/health/live")
+
+        with allure.step("Verify the echoed IDs"):
+            assert given.headers["X-Request-ID"] == "req-42", "A valid ID should be kept."
+            assert generated.headers["X-Request-ID"], "A missing ID should be generated."
+
+        with allure.step("Verify the request ID is set around the metrics middleware"):
+            outermost = [middleware.cls for middleware in get_app().user_middleware[:2]]
+            assert outermost == [RequestIdMiddleware, MetricsMiddleware], (
+                "Warnings logged by the metrics middleware should carry the request ID."
+            )
+
+    @allure.story("Pool Stats")
+    @allure.title("Test the pool stats endpoint")
+    def test_pool_stats(self, client: TestClient) -> None:
+        """Test the pool endpoint reports the sync engine's pool."""
+        with allure.step("Request the pool stats"):
+            response = client.get("/health/pool")
+
+        with allure.step("Verify the reported pool"):
+            assert response.status_code == HTTPStatus.OK, "The pool stats should be served."
+            stats = response.json()["sync"]
+            assert {"pool", "checked_out", "overflow"} <= stats.keys(), (
+                "The stats should report the pool class, checked-out count and overflow."
+            )
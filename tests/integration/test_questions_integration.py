@@ -1,7 +1,15 @@
+import csv
+import gzip
+import io
+import json
 from http import HTTPStatus
 
 import allure
+import pytest
+from app.schemas.question import QuestionCreate
+from app.services import question as question_service
 from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
 
 
 @allure.feature("Questions Integration")
@@ -63,6 +71,42 @@ class TestQuestionsIntegration:
                 "Error message did not indicate a duplicate."
             )
 
+    @allure.story("Create Question")
+    @allure.title("Test a duplicate stored between the check and the insert")
+    def test_create_duplicate_question_race(
+        self,
+        client: TestClient,
+        sample_category: dict,
+        other_session: Session,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test the unique index rejection of a concurrent duplicate becomes a 400."""
+        question_data = {
+            "question_text": "What is a race condition?",
+            "answer_text": "Outcomes depending on the timing of concurrent operations.",
+            "category_id": sample_category["id"],
+        }
+        lookup = question_service.get_question_by_text_case_insensitive
+
+        def racing_lookup(db: Session, question_text: str) -> question_service.QuestionModel | None:
+            found = lookup(db, question_text)
+            question_service.create_question(other_session, QuestionCreate(**question_data))
+            return found
+
+        with allure.step("Create the question while another session inserts it after the check"):
+            monkeypatch.setattr(
+                question_service, "get_question_by_text_case_insensitive", racing_lookup
+            )
+            response = client.post("/api/v1/questions/", json=question_data)
+            monkeypatch.undo()
+
+        with allure.step("Verify the duplicate is reported and nothing is half written"):
+            assert response.status_code == HTTPStatus.BAD_REQUEST, "Expected 400 for the duplicate."
+            assert "already exists" in response.json()["detail"], "Expected a duplicate message."
+            stats = client.get("/api/v1/categories/stats").json()
+            assert stats["total_questions"] == 1, "Only the concurrent insert should be stored."
+            assert stats["items"][0]["question_count"] == 1, "The counter should be rolled back."
+
     @allure.story("Get Questions")
     @allure.title("Test getting a list of all questions")
     def test_get_all_questions(self, client: TestClient, sample_category: dict) -> None:
@@ -83,7 +127,7 @@ class TestQuestionsIntegration:
             assert response.status_code == HTTPStatus.OK, (
                 "Expected 200 OK when fetching all questions."
             )
-            data = response.json()
+            data = response.json()["items"]
             length_questions = 3
             assert len(data) >= length_questions, (
                 "The number of returned questions is less than expected."
@@ -112,12 +156,303 @@ class TestQuestionsIntegration:
 
         with allure.step("Verify the response contains only questions from the specified category"):
             assert response.status_code == HTTPStatus.OK, "Expected 200 OK for filtered questions."
-            data = response.json()
+            data = response.json()["items"]
             assert len(data) == 1, "Expected exactly one question in the filtered response."
             assert data[0]["category_id"] == cat1_id, (
                 "The question's category ID does not match the filter."
             )
 
+    @allure.story("Get Questions")
+    @allure.title("Test cursor pagination of questions")
+    def test_get_questions_cursor_pagination(
+        self, client: TestClient, sample_category: dict
+    ) -> None:
+        """Test walking the question list with next_cursor."""
+        with allure.step("Create five questions"):
+            for i in range(5):
+                client.post(
+                    "/api/v1/questions/",
+                    json={
+                        "question_text": f"Paged Q{i}?",
+                        "answer_text": "A",
+                        "category_id": sample_category["id"],
+                    },
+                )
+
+        with allure.step("Follow next_cursor until exhausted"):
+            ids = []
+            params: dict = {"limit": 2}
+            while True:
+                response = client.get("/api/v1/questions/", params=params)
+                assert response.status_code == HTTPStatus.OK, "Expected 200 OK for a page."
+                page = response.json()
+                assert len(page["items"]) <= params["limit"], "Page exceeds the requested limit."
+                ids.extend(q["id"] for q in page["items"])
+                if page["next_cursor"] is None:
+                    break
+                params["cursor"] = page["next_cursor"]
+
+        with allure.step("Verify every question was returned once and in order"):
+            expected_count = 5
+            assert len(ids) == expected_count, "Pagination lost or duplicated questions."
+            assert ids == sorted(ids), "Questions of one category must be ordered by ID."
+
+    @allure.story("Get Questions")
+    @allure.title("Test rejecting a malformed cursor")
+    def test_get_questions_invalid_cursor(self, client: TestClient) -> None:
+        """Test that a malformed cursor returns 400."""
+        with allure.step("Request questions with a garbage cursor"):
+            response = client.get("/api/v1/questions/", params={"cursor": "not-a-cursor"})
+
+        with allure.step("Verify the server returns 400 Bad Request"):
+            assert response.status_code == HTTPStatus.BAD_REQUEST, (
+                "Expected 400 BAD_REQUEST for a malformed cursor."
+            )
+            assert response.json()["detail"] == "Invalid cursor", "Unexpected error message."
+
+    @allure.story("Random Questions")
+    @allure.title("Test seeded random sampling of a category")
+    def test_random_questions(self, client: TestClient, sample_category: dict) -> None:
+        """Test a sample is distinct, reproducible by seed and refreshed after writes."""
+        total, count = 6, 4
+        with allure.step("Create six questions"):
+            for i in range(total):
+                client.post(
+                    "/api/v1/questions/",
+                    json={
+                        "question_text": f"Random Q{i}?",
+                        "answer_text": "A",
+                        "category_id": sample_category["id"],
+                    },
+                )
+
+        with allure.step("Draw samples with and without a seed"):
+            params = {"count": count, "category_id": sample_category["id"]}
+            first = client.get("/api/v1/questions/random", params=params).json()
+            again = client.get(
+                "/api/v1/questions/random", params={**params, "seed": first["seed"]}
+            ).json()
+            everything = client.get(
+                "/api/v1/questions/random", params={**params, "count": total + 1}
+            ).json()
+
+        with allure.step("Verify the samples"):
+            ids = [question["id"] for question in first["items"]]
+            assert len(set(ids)) == count, "A sample should hold distinct questions."
+            assert again == first, "The same seed should draw the same questions in order."
+            assert len(everything["items"]) == total, "Oversized samples return every question."
+
+        with allure.step("Delete a drawn question and draw with the same seed"):
+            client.delete(f"/api/v1/questions/{ids[0]}")
+            after_delete = client.get(
+                "/api/v1/questions/random", params={**params, "seed": first["seed"]}
+            ).json()
+
+        with allure.step("Verify the deleted question is no longer drawn"):
+            assert len(after_delete["items"]) == count, "The sample should still be full."
+            assert ids[0] not in [question["id"] for question in after_delete["items"]], (
+                "A deleted question should not be sampled."
+            )
+
+    @allure.story("Batch Questions")
+    @allure.title("Test fetching questions by ID in one request")
+    def test_questions_batch(self, client: TestClient, sample_category: dict) -> None:
+        """Test GET and POST batches keep the order and report missing IDs."""
+        with allure.step("Create three questions"):
+            ids = [
+                client.post(
+                    "/api/v1/questions/",
+                    json={
+                        "question_text": f"Batch Q{i}?",
+                        "answer_text": "A",
+                        "category_id": sample_category["id"],
+                    },
+                ).json()["id"]
+                for i in range(3)
+            ]
+            requested = [ids[2], 999, ids[0]]
+
+        with allure.step("Fetch them with the query string and with a body"):
+            by_query = client.get(
+                "/api/v1/questions/batch", params={"ids": ",".join(map(str, requested))}
+            )
+            by_body = client.post("/api/v1/questions/batch", json={"ids": requested})
+            invalid = client.get("/api/v1/questions/batch", params={"ids": "1,x"})
+
+        with allure.step("Verify the results"):
+            assert by_query.status_code == HTTPStatus.OK, "Expected 200 OK for a batch."
+            assert [item["id"] for item in by_query.json()["items"]] == [ids[2], ids[0]], (
+                "Items should follow the requested order."
+            )
+            assert by_query.json()["missing"] == [999], "The unknown ID should be reported."
+            assert by_body.json() == by_query.json(), "GET and POST should agree."
+            assert invalid.status_code == HTTPStatus.BAD_REQUEST, "Malformed IDs should be 400."
+
+    @allure.story("Search Questions")
+    @allure.title("Test paginated full-text search with facets")
+    def test_search_questions(self, client: TestClient, sample_category: dict) -> None:
+        """Test the search endpoint returns ranked pages and facet counts."""
+        with allure.step("Create three matching questions and one unrelated"):
+            for i in range(3):
+                client.post(
+                    "/api/v1/questions/",
+                    json={
+                        "question_text": f"Explain closures, part {i}?",
+                        "answer_text": "A closure captures variables.",
+                        "category_id": sample_category["id"],
+                    },
+                )
+            client.post(
+                "/api/v1/questions/",
+                json={
+                    "question_text": "What is REST?",
+                    "answer_text": "An architectural style.",
+                    "category_id": sample_category["id"],
+                },
+            )
+
+        with allure.step("Search with a page size of two"):
+            response = client.get("/api/v1/questions/search", params={"q": "closure", "limit": 2})
+
+        with allure.step("Verify the first page, total and facets"):
+            assert response.status_code == HTTPStatus.OK, "Expected 200 OK for search."
+            data = response.json()
+            expected_total = 3
+            page_size = 2
+            assert data["total"] == expected_total, "Total should count all matching questions."
+            assert data["facets"] == [
+                {"category_id": sample_category["id"], "count": expected_total}
+            ], "Facets should report the matches per category."
+            assert len(data["items"]) == page_size, "Expected a full first page."
+            assert "rank" in data["items"][0], "Search hits should carry a rank."
+            assert data["next_cursor"] is not None, "A second page should be available."
+
+        with allure.step("Fetch the second page"):
+            response = client.get(
+                "/api/v1/questions/search",
+                params={"q": "closure", "limit": 2, "cursor": data["next_cursor"]},
+            )
+            page2 = response.json()
+            assert len(page2["items"]) == 1, "The second page should hold the remaining hit."
+            assert page2["next_cursor"] is None, "The last page must not have a cursor."
+
+    @allure.story("Export Questions")
+    @allure.title("Test streaming NDJSON export filtered by category")
+    def test_export_questions_ndjson(self, client: TestClient, sample_question: dict) -> None:
+        """Test NDJSON export returns one JSON object per question."""
+        with allure.step("Create a question in another category"):
+            other = client.post("/api/v1/categories/", json={"name": "Other"}).json()
+            client.post(
+                "/api/v1/questions/",
+                json={"question_text": "Other?", "answer_text": "A", "category_id": other["id"]},
+            )
+
+        with allure.step("Export questions of the sample category"):
+            response = client.get(
+                "/api/v1/questions/export",
+                params={"format": "ndjson", "category_id": sample_question["category_id"]},
+            )
+
+        with allure.step("Verify the exported rows"):
+            assert response.status_code == HTTPStatus.OK, "Expected 200 OK for export."
+            assert response.headers["content-type"] == "application/x-ndjson"
+            rows = [json.loads(line) for line in response.text.splitlines()]
+            assert rows == [sample_question], "Export should contain only the filtered question."
+
+    @allure.story("Export Questions")
+    @allure.title("Test gzip-compressed CSV export")
+    def test_export_questions_csv_gzip(self, client: TestClient, sample_question: dict) -> None:
+        """Test CSV export with gzip compression."""
+        with allure.step("Export all questions as gzipped CSV"):
+            response = client.get(
+                "/api/v1/questions/export", params={"format": "csv", "gzip": True}
+            )
+
+        with allure.step("Decompress and parse the CSV"):
+            assert response.status_code == HTTPStatus.OK, "Expected 200 OK for export."
+            assert response.headers["content-type"] == "application/gzip"
+            assert "questions.csv.gz" in response.headers["content-disposition"]
+            rows = list(csv.DictReader(io.StringIO(gzip.decompress(response.content).decode())))
+            assert len(rows) == 1, "Expected exactly one exported question."
+            assert rows[0]["question_text"] == sample_question["question_text"]
+            assert int(rows[0]["id"]) == sample_question["id"]
+
+    @allure.story("Bulk Create Questions")
+    @allure.title("Test bulk import endpoint reports per-item results")
+    def test_bulk_create_questions(self, client: TestClient, sample_question: dict) -> None:
+        """Test bulk import of new, duplicate and invalid-category questions."""
+        payload = [
+            {
+                "question_text": "Bulk 1?",
+                "answer_text": "A",
+                "category_id": sample_question["category_id"],
+            },
+            {
+                "question_text": sample_question["question_text"].upper(),
+                "answer_text": "A",
+                "category_id": sample_question["category_id"],
+            },
+            {"question_text": "Bulk 2?", "answer_text": "A", "category_id": 99999},
+        ]
+
+        with allure.step("Send the bulk import request"):
+            response = client.post("/api/v1/questions/bulk", json=payload)
+
+        with allure.step("Verify the summary and per-item results"):
+            assert response.status_code == HTTPStatus.OK, "Expected 200 OK for bulk import."
+            data = response.json()
+            assert (data["created"], data["duplicates"], data["invalid_category"]) == (1, 1, 1)
+            statuses = [item["status"] for item in data["items"]]
+            assert statuses == ["created", "duplicate", "invalid_category"]
+
+        with allure.step("Verify the created question is retrievable"):
+            new_id = data["items"][0]["id"]
+            get_response = client.get(f"/api/v1/questions/{new_id}")
+            assert get_response.status_code == HTTPStatus.OK, "The imported question must exist."
+            assert get_response.json()["question_text"] == "Bulk 1?"
+
+    @allure.story("Bulk Create Questions")
+    @allure.title("Test a bulk item stored concurrently after the duplicate lookup")
+    def test_bulk_create_questions_race(
+        self,
+        client: TestClient,
+        sample_category: dict,
+        other_session: Session,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a chunk losing the race is redone and reports the item as a duplicate."""
+        payload = [
+            {
+                "question_text": f"Racing bulk {i}?",
+                "answer_text": "A",
+                "category_id": sample_category["id"],
+            }
+            for i in range(2)
+        ]
+        existing_text_keys = question_service._existing_text_keys  # noqa: SLF001
+        raced: list[bool] = []
+
+        def racing_keys(db: Session, keys: list[str]) -> set[str]:
+            found = existing_text_keys(db, keys)
+            if not raced:
+                raced.append(True)
+                question_service.create_question(other_session, QuestionCreate(**payload[0]))
+            return found
+
+        with allure.step("Import while another session inserts the first item after the lookup"):
+            monkeypatch.setattr(question_service, "_existing_text_keys", racing_keys)
+            response = client.post("/api/v1/questions/bulk", json=payload)
+            monkeypatch.undo()
+
+        with allure.step("Verify the first item is a duplicate and the second is created"):
+            assert response.status_code == HTTPStatus.OK, "Expected 200 OK for bulk import."
+            statuses = [item["status"] for item in response.json()["items"]]
+            assert statuses == ["duplicate", "created"], "Unexpected bulk item statuses."
+            stats = client.get("/api/v1/categories/stats").json()
+            assert stats["items"][0]["question_count"] == len(payload), (
+                "Both questions should be counted once."
+            )
+
     @allure.story("Get Question")
     @allure.title("Test getting a single question by its ID")
     def test_get_question_by_id(self, client: TestClient, sample_question: dict) -> None:
@@ -134,6 +469,67 @@ class TestQuestionsIntegration:
                 "Returned question text does not match."
             )
 
+    @allure.story("Get Question")
+    @allure.title("Test conditional GET with ETag and If-None-Match")
+    def test_conditional_get_questions(self, client: TestClient, sample_question: dict) -> None:
+        """Test unchanged questions answer 304 and a write changes the ETag."""
+        detail_url = f"/api/v1/questions/{sample_question['id']}"
+        with allure.step("Fetch the list and the detail to obtain ETags"):
+            list_etag = client.get("/api/v1/questions/").headers["ETag"]
+            detail_etag = client.get(detail_url).headers["ETag"]
+
+        with allure.step("Repeat both requests with If-None-Match"):
+            not_modified_list = client.get(
+                "/api/v1/questions/", headers={"If-None-Match": list_etag}
+            )
+            not_modified_detail = client.get(detail_url, headers={"If-None-Match": detail_etag})
+            for response in (not_modified_list, not_modified_detail):
+                assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+                    "Expected 304 NOT_MODIFIED while questions are unchanged."
+                )
+                assert response.content == b"", "A 304 response must not carry a body."
+
+        with allure.step("Update the question and repeat the list request"):
+            client.patch(detail_url, json={"answer_text": "Updated answer."})
+            response = client.get("/api/v1/questions/", headers={"If-None-Match": list_etag})
+
+        with allure.step("Verify the list is sent again with a new ETag"):
+            assert response.status_code == HTTPStatus.OK, "Expected 200 OK after a write."
+            assert response.headers["ETag"] != list_etag, "The ETag must change after a write."
+
+    @allure.story("Get Questions")
+    @allure.title("Test list responses are compressed according to Accept-Encoding")
+    def test_list_questions_compressed(self, client: TestClient, sample_category: dict) -> None:
+        """Test large lists are gzipped for clients that accept it and sent plain otherwise."""
+        with allure.step("Create enough questions to exceed the compression threshold"):
+            items = [
+                {
+                    "question_text": f"Compressible question {i}?",
+                    "answer_text": "A fairly long answer that repeats itself. " * 10,
+                    "category_id": sample_category["id"],
+                }
+                for i in range(10)
+            ]
+            client.post("/api/v1/questions/bulk", json=items)
+
+        with allure.step("Request the list accepting gzip, twice"):
+            first = client.get("/api/v1/questions/", headers={"Accept-Encoding": "gzip"})
+            second = client.get("/api/v1/questions/", headers={"Accept-Encoding": "gzip"})
+
+        with allure.step("Verify the list was gzipped and decodes to the same items"):
+            assert first.headers["Content-Encoding"] == "gzip", "Expected a gzip-encoded list."
+            assert "Accept-Encoding" in first.headers["Vary"], "Vary must list Accept-Encoding."
+            assert first.headers["ETag"].startswith("W/"), "An encoded ETag must be weak."
+            assert first.json() == second.json(), "Repeated responses must decode identically."
+            assert len(first.json()["items"]) == len(items), "All questions must be listed."
+
+        with allure.step("Request the list without accepting any encoding"):
+            plain = client.get("/api/v1/questions/", headers={"Accept-Encoding": "identity"})
+
+        with allure.step("Verify the list is sent uncompressed"):
+            assert "Content-Encoding" not in plain.headers, "Expected an unencoded response."
+            assert plain.json() == first.json(), "Plain and compressed lists must match."
+
     @allure.story("Get Question")
     @allure.title("Test getting a non-existent question")
     def test_get_nonexistent_question(self, client: TestClient) -> None:
@@ -1,10 +1,13 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 import pytest
 from app.db.database import Base
 from app.schemas.category import CategoryCreate
 from app.services import category as category_service
+from app.services.cache import clear_caches
+from app.services.versions import snapshot
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
@@ -16,6 +19,8 @@ TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_
 def db_session() -> Generator[Session]:
     """Create a database session for unit testing."""
     Base.metadata.create_all(bind=test_engine)
+    clear_caches()
+    snapshot.clear()
     session = TestingSessionLocal()
     try:
         yield session
@@ -29,3 +34,19 @@ def sample_category(db_session: Session) -> category_service.CategoryModel:
     """Create a sample category for questions."""
     category_data = CategoryCreate(name="Test Category")
     return category_service.create_category(db_session, category_data)
+
+
+@pytest.fixture
+async def async_db_session() -> AsyncGenerator[AsyncSession]:
+    """Create an async database session backed by aiosqlite."""
+    pytest.importorskip("aiosqlite")
+    async_engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with async_engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    clear_caches()
+    session = async_sessionmaker(bind=async_engine, expire_on_commit=False)()
+    try:
+        yield session
+    finally:
+        await session.close()
+        await async_engine.dispose()
@@ -0,0 +1,66 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import allure
+
+BACKEND_DIR = Path(__file__).resolve().parents[2] / "backend"
+
+# Runs in a fresh interpreter: in this process the app and engines already exist.
+PROBE = """
+import json
+import sys
+
+import app.main
+from app.db.database import get_engine
+
+def state():
+    return {
+        "engines": get_engine.cache_info().currsize,
+        "apps": app.main.get_app.cache_info().currsize,
+        "alembic": "alembic" in sys.modules,
+    }
+
+imported = state()
+app.main.app
+print(json.dumps({"imported": imported, "accessed": state()}))
+"""
+
+
+@allure.feature("App Factory Unit Tests")
+class TestAppFactory:
+    """Unit tests for the lazy app factory and engines."""
+
+    @allure.story("Cold Start")
+    @allure.title("Test importing app.main builds neither an engine nor the app")
+    def test_import_is_lazy(self, tmp_path: Path) -> None:
+        """Test the app is built on first access to `app.main.app` and no engine is created."""
+        env = os.environ | {
+            "PYTHONPATH": str(BACKEND_DIR),
+            "DATABASE_URL": f"sqlite:///{tmp_path / 'app.db'}",
+            "LOG_FILE": str(tmp_path / "logs" / "app.log"),
+        }
+
+        with allure.step("Import app.main in a new interpreter, then access the app"):
+            result = subprocess.run(  # noqa: S603
+                [sys.executable, "-c", PROBE],
+                env=env,
+                cwd=tmp_path,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            state = json.loads(result.stdout.strip().splitlines()[-1])
+
+        with allure.step("Verify the import built nothing"):
+            assert state["imported"] == {"engines": 0, "apps": 0, "alembic": False}, (
+                f"Importing app.main should not build the app or an engine, got {state}."
+            )
+
+        with allure.step("Verify accessing the app built it without an engine"):
+            assert state["accessed"]["apps"] == 1, "Accessing app.main.app should build the app."
+            assert state["accessed"]["engines"] == 0, (
+                "Building the app should leave the engine to the first request."
+            )
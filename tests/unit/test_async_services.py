@@ -0,0 +1,109 @@
+import allure
+from app.api.v1.api import with_route_overrides
+from app.api.v1.endpoints import questions, questions_async
+from app.db.database import is_async_url, sync_database_url
+from app.schemas.category import CategoryCreate, CategoryUpdate
+from app.schemas.question import QuestionCreate, QuestionUpdate
+from app.services import category_async, question_async
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@allure.feature("Async Service Unit Tests")
+class TestAsyncServices:
+    """Unit tests for the async database path."""
+
+    @allure.story("Driver Selection")
+    @allure.title("Test async driver detection and sync URL derivation")
+    def test_async_url_helpers(self) -> None:
+        """Test that async drivers are detected and mapped to sync drivers."""
+        with allure.step("Detect async drivers"):
+            assert is_async_url("sqlite+aiosqlite:///./app.db"), "aiosqlite must be async."
+            assert is_async_url("postgresql+asyncpg://u:p@db/app"), "asyncpg must be async."
+            assert not is_async_url("sqlite:///./app.db"), "pysqlite must be sync."
+
+        with allure.step("Derive sync URLs"):
+            assert sync_database_url("sqlite+aiosqlite:///./app.db") == "sqlite:///./app.db"
+            assert sync_database_url("postgresql+asyncpg://u:p@db/app") == (
+                "postgresql://u:p@db/app"
+            ), "The password must survive the driver swap."
+            assert sync_database_url("sqlite:///./app.db") == "sqlite:///./app.db"
+
+    @allure.story("Driver Selection")
+    @allure.title("Test async routes replace sync routes in place")
+    def test_with_route_overrides(self) -> None:
+        """Test that async handlers replace sync ones without reordering routes."""
+        router = with_route_overrides(questions.router, questions_async.router)
+        routes = [route for route in router.routes if isinstance(route, APIRoute)]
+
+        with allure.step("Verify route order is preserved"):
+            base_paths = [r.path for r in questions.router.routes if isinstance(r, APIRoute)]
+            assert [route.path for route in routes] == base_paths, "Route order changed."
+
+        with allure.step("Verify CRUD handlers come from the async module"):
+            by_name = {route.name: route.endpoint.__module__ for route in routes}
+            assert by_name["read_question"] == questions_async.__name__
+            assert by_name["search_questions"] == questions.__name__
+
+    @allure.story("Category CRUD")
+    @allure.title("Test async category create, read, update and delete")
+    async def test_category_crud(self, async_db_session: AsyncSession) -> None:
+        """Test the async category service round trip."""
+        with allure.step("Create and read back a category"):
+            created = await category_async.create_category(
+                async_db_session, CategoryCreate(name="Async")
+            )
+            found = await category_async.get_category_by_name(async_db_session, "async")
+            assert found is not None, "Case-insensitive lookup should find the category."
+            assert found.id == created.id, "The wrong category was returned."
+
+        with allure.step("Update the category"):
+            updated = await category_async.update_category(
+                async_db_session, created.id, CategoryUpdate(name="Renamed")
+            )
+            assert updated is not None, "update_category should return the category."
+            assert updated.name == "Renamed", "The category name was not updated."
+
+        with allure.step("Page and delete the category"):
+            page, after = await category_async.get_categories_page(async_db_session, limit=10)
+            assert [c.id for c in page] == [created.id], "The page should hold one category."
+            assert after is None, "A single page must not return a resume key."
+            assert await category_async.delete_category(async_db_session, created.id)
+            assert await category_async.get_category(async_db_session, created.id) is None
+
+    @allure.story("Question CRUD")
+    @allure.title("Test async question create, read, update and delete")
+    async def test_question_crud(self, async_db_session: AsyncSession) -> None:
+        """Test the async question service round trip."""
+        category = await category_async.create_category(
+            async_db_session, CategoryCreate(name="Async")
+        )
+
+        with allure.step("Create questions and page through them"):
+            for i in range(3):
+                await question_async.create_question(
+                    async_db_session,
+                    QuestionCreate(
+                        question_text=f"Async Q{i}?", answer_text="A", category_id=category.id
+                    ),
+                )
+            page, after = await question_async.get_questions_page(async_db_session, limit=2)
+            rest, last = await question_async.get_questions_page(
+                async_db_session, limit=2, after=after
+            )
+            quantity_questions = 3
+            assert len(page) + len(rest) == quantity_questions, "Paging lost questions."
+            assert last is None, "The second page must be the last one."
+
+        with allure.step("Find, update and delete a question"):
+            found = await question_async.get_question_by_text_case_insensitive(
+                async_db_session, "ASYNC Q0?"
+            )
+            assert found is not None, "Case-insensitive lookup should find the question."
+            updated = await question_async.update_question(
+                async_db_session, found.id, QuestionUpdate(answer_text="B")
+            )
+            assert updated is not None, "update_question should return the question."
+            assert updated.answer_text == "B", "The answer text was not updated."
+            assert await question_async.delete_question(async_db_session, found.id)
+            assert await question_async.get_question(async_db_session, found.id) is None
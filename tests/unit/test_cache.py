@@ -0,0 +1,147 @@
+import allure
+from app.core.cache import TTLCache
+from app.schemas.category import Category, CategoryCreate, CategoryUpdate
+from app.schemas.question import QuestionCreate
+from app.services import category as category_service
+from app.services import question as question_service
+from app.services.cache import category_cache, question_cache
+from app.services.versions import snapshot
+from sqlalchemy import Connection, event, text
+from sqlalchemy.orm import Session
+
+
+@allure.feature("Entity Cache Unit Tests")
+class TestEntityCache:
+    """Unit tests for the in-process entity cache."""
+
+    @allure.story("TTL Cache")
+    @allure.title("Test LRU eviction, expiry and counters")
+    def test_ttl_cache_eviction_and_expiry(self) -> None:
+        """Test the least recently used entry is evicted and stale entries miss."""
+        now = [0.0]
+        cache = TTLCache(maxsize=2, ttl=10.0, clock=lambda: now[0])
+
+        with allure.step("Fill the cache and touch the first entry"):
+            cache.set(1, Category(id=1, name="One"))
+            cache.set(2, Category(id=2, name="Two"))
+            assert cache.get(1) is not None, "A fresh entry should be a hit."
+
+        with allure.step("Insert a third entry, evicting the least recently used"):
+            cache.set(3, Category(id=3, name="Three"))
+            assert cache.get(2) is None, "The least recently used entry should be evicted."
+            assert cache.get(1) is not None, "The recently used entry should be kept."
+
+        with allure.step("Advance the clock past the TTL"):
+            now[0] = 10.0
+            assert cache.get(3) is None, "An expired entry should be a miss."
+
+        with allure.step("Verify the counters"):
+            expected_stats = {"size": 1, "hits": 2, "misses": 2}
+            assert cache.stats() == expected_stats, "Hit/miss counters are incorrect."
+
+    @allure.story("Invalidation")
+    @allure.title("Test cached reads are invalidated by committed writes")
+    def test_cached_reads_invalidated_on_commit(self, db_session: Session) -> None:
+        """Test updates and cascading deletes drop the affected cache entries."""
+        with allure.step("Create a category with a question and read both twice"):
+            category = category_service.create_category(db_session, CategoryCreate(name="Go"))
+            question = question_service.create_question(
+                db_session,
+                QuestionCreate(
+                    question_text="What is a goroutine?",
+                    answer_text="A lightweight thread.",
+                    category_id=category.id,
+                ),
+            )
+            for _ in range(2):
+                category_service.get_category_cached(db_session, category.id)
+                question_service.get_question_cached(db_session, question.id)
+            assert category_cache.hits == question_cache.hits == 1, (
+                "The second read of each entity should be served from the cache."
+            )
+
+        with allure.step("Rename the category and read it again"):
+            category_service.update_category(db_session, category.id, CategoryUpdate(name="Golang"))
+            cached = category_service.get_category_cached(db_session, category.id)
+            assert cached is not None, "The category should still be found."
+            assert cached.name == "Golang", "The cache should not serve the old name."
+
+        with allure.step("Delete the category and read its question again"):
+            question_id = question.id
+            question_service.get_question_cached(db_session, question_id)
+            category_service.delete_category(db_session, category.id)
+            assert question_cache.get(question_id) is None, (
+                "Questions of a deleted category should be dropped from the cache."
+            )
+
+    @allure.story("Batch Reads")
+    @allure.title("Test batch reads serve hits from the cache and misses in one query")
+    def test_batch_read_single_query(self, db_session: Session) -> None:
+        """Test a batch keeps the requested order, reports missing IDs and runs one SELECT."""
+        category = category_service.create_category(db_session, CategoryCreate(name="Batch"))
+        ids = [
+            question_service.create_question(
+                db_session,
+                QuestionCreate(
+                    question_text=f"Batch Q{i}", answer_text="A", category_id=category.id
+                ),
+            ).id
+            for i in range(3)
+        ]
+        question_service.get_question_cached(db_session, ids[1])
+        statements: list[str] = []
+
+        def record(_conn: Connection, _cursor: object, statement: str, *_args: object) -> None:
+            statements.append(statement)
+
+        with allure.step("Read a batch with a cached ID, a repeat and a missing ID"):
+            engine = db_session.get_bind()
+            event.listen(engine, "before_cursor_execute", record)
+            try:
+                items, missing = question_service.get_questions_cached(
+                    db_session, [ids[2], ids[1], 999, ids[0], ids[2]]
+                )
+            finally:
+                event.remove(engine, "before_cursor_execute", record)
+
+        with allure.step("Verify order, missing IDs and the single query"):
+            assert [item.id for item in items] == [ids[2], ids[1], ids[0]], (
+                "Items should follow the requested order without repeats."
+            )
+            assert missing == [999], "The unknown ID should be reported as missing."
+            assert len(statements) == 1, f"Expected one IN query, got {statements}."
+
+    @allure.story("Invalidation")
+    @allure.title("Test cached reads are refetched after another process bumps the version")
+    def test_cached_read_refetched_on_version_bump(self, db_session: Session) -> None:
+        """Test a write seen only through `table_versions` retires the cached entry."""
+        category = category_service.create_category(db_session, CategoryCreate(name="Rust"))
+        question = question_service.create_question(
+            db_session,
+            QuestionCreate(
+                question_text="What is a borrow?", answer_text="Old", category_id=category.id
+            ),
+        )
+        question_service.get_question_cached(db_session, question.id)
+
+        with allure.step("Change the row and bump its version in SQL, as another worker would"):
+            db_session.execute(
+                text("UPDATE questions SET answer_text = 'New' WHERE id = :id"), {"id": question.id}
+            )
+            db_session.execute(
+                text(
+                    "UPDATE table_versions SET version = version + 1 WHERE table_name = 'questions'"
+                )
+            )
+            db_session.commit()
+            # The version snapshot expires after VERSIONS_TTL_SECONDS; skip the wait.
+            snapshot.clear()
+
+        with allure.step("Read the question again through the cache"):
+            cached = question_service.get_question_cached(db_session, question.id)
+            items, _ = question_service.get_questions_cached(db_session, [question.id])
+
+        with allure.step("Verify the entry was refetched"):
+            assert cached is not None, "The question should still be found."
+            assert cached.answer_text == "New", "A version bump should retire the cached entry."
+            assert items[0].answer_text == "New", "Batch reads should honour the version too."
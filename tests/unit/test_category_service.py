@@ -1,8 +1,12 @@
 import allure
+from app.db.models.table_version import TableVersion
 from app.schemas.category import CategoryCreate, CategoryUpdate
 from app.services import category as category_service
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+CATEGORIES_VERSION = select(TableVersion.version).where(TableVersion.table_name == "categories")
+
 
 @allure.feature("Category Service Unit Tests")
 class TestCategoryService:
@@ -23,6 +27,29 @@ class TestCategoryService:
             assert created_category.id is not None, "The created category must have an ID."
             assert isinstance(created_category.id, int), "The category ID should be an integer."
 
+    @allure.story("Create Category")
+    @allure.title("Test creating a category whose name differs only by case")
+    def test_create_category_case_duplicate(self, db_session: Session) -> None:
+        """Test the insert is skipped, and the categories version kept, when the name is taken."""
+        with allure.step("Create the original category"):
+            category_service.create_category(db_session, CategoryCreate(name="Databases"))
+            version = db_session.scalar(CATEGORIES_VERSION)
+            assert version == 1, "Creating a category should bump the categories version."
+
+        with allure.step("Create a category with the same name in upper case"):
+            duplicate = category_service.create_category(
+                db_session, CategoryCreate(name="DATABASES")
+            )
+
+        with allure.step("Verify nothing was inserted"):
+            assert duplicate is None, "A case-insensitive duplicate should not be created."
+            assert len(category_service.get_categories(db_session)) == 1, (
+                "Only the original category should exist."
+            )
+            assert db_session.scalar(CATEGORIES_VERSION) == version, (
+                "A skipped insert should leave the version, and so the ETags, unchanged."
+            )
+
     @allure.story("Read Category")
     @allure.title("Test getting an existing category by ID")
     def test_get_category(self, db_session: Session) -> None:
@@ -140,6 +167,28 @@ class TestCategoryService:
                 "Expected 2 categories on the second page."
             )
 
+    @allure.story("Read Category")
+    @allure.title("Test keyset pagination of categories")
+    def test_get_categories_page(self, db_session: Session) -> None:
+        """Test paging through categories by ID cursor."""
+        with allure.step("Create 5 categories"):
+            for i in range(5):
+                category_service.create_category(db_session, CategoryCreate(name=f"Category {i}"))
+
+        with allure.step("Get the first page (limit=3)"):
+            page1, after = category_service.get_categories_page(db_session, limit=3)
+            assert [c.name for c in page1] == ["Category 0", "Category 1", "Category 2"], (
+                "The first page should contain the three oldest categories."
+            )
+            assert after == page1[-1].id, "The resume key should be the last ID on the page."
+
+        with allure.step("Get the second page after the cursor"):
+            page2, after = category_service.get_categories_page(db_session, limit=3, after=after)
+            assert [c.name for c in page2] == ["Category 3", "Category 4"], (
+                "The second page should contain the remaining categories."
+            )
+            assert after is None, "The last page must not return a resume key."
+
     @allure.story("Update Category")
     @allure.title("Test updating an existing category")
     def test_update_category(self, db_session: Session) -> None:
@@ -0,0 +1,37 @@
+import allure
+import pytest
+from app.core import compression
+from app.core.compression import CompressionMiddleware
+from starlette.types import Receive, Scope, Send
+
+
+async def empty_app(_scope: Scope, _receive: Receive, _send: Send) -> None:
+    """ASGI app that is never called by `choose_encoding`."""
+
+
+def request_scope(accept_encoding: str) -> Scope:
+    """Build an HTTP scope sending `Accept-Encoding`."""
+    return {"type": "http", "headers": [(b"accept-encoding", accept_encoding.encode())]}
+
+
+@allure.feature("Compression Unit Tests")
+class TestCompression:
+    """Unit tests for the response compression middleware."""
+
+    @allure.story("Content Negotiation")
+    @allure.title("Test explicit q=0 refusals hold against the wildcard")
+    def test_choose_encoding(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test gzip is chosen when acceptable and never when refused with q=0."""
+        monkeypatch.setattr(compression, "brotli", None)
+        middleware = CompressionMiddleware(empty_app)
+
+        def chosen(accept_encoding: str) -> str | None:
+            return middleware.choose_encoding(request_scope(accept_encoding))
+
+        with allure.step("Negotiate headers accepting gzip"):
+            for header in ("gzip, deflate", "GZIP;q=0.5", "*"):
+                assert chosen(header) == "gzip", f"Expected gzip for {header!r}."
+
+        with allure.step("Negotiate headers refusing gzip"):
+            for header in ("gzip;q=0, *", "gzip;q=0.0, br", "*;q=0", "identity", ""):
+                assert chosen(header) is None, f"Expected no compression for {header!r}."
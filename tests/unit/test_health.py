@@ -0,0 +1,83 @@
+import logging
+from pathlib import Path
+
+import allure
+from app.core.logging_config import ProbeAccessFilter
+from app.db.health import ReadinessCheck
+from app.db.schema import create_schema, schema_status
+from sqlalchemy import create_engine, text
+
+READY_TTL = 60.0
+
+
+@allure.feature("Health Probe Unit Tests")
+class TestHealthProbes:
+    """Unit tests for the cached readiness check and probe log filtering."""
+
+    @allure.story("Readiness")
+    @allure.title("Test the readiness outcome is cached for its TTL")
+    async def test_readiness_cached(self) -> None:
+        """Test a failed check is reused until it expires, then re-run."""
+        unreachable = create_engine("sqlite:////nonexistent-dir/app.db")
+        check = ReadinessCheck(unreachable, ttl=READY_TTL)
+
+        with allure.step("Check an unreachable database"):
+            result = await check.result()
+            assert result["database"] == "unavailable", "The failure should be reported."
+
+        with allure.step("Point the check at a working database within the TTL"):
+            check.engine = create_engine("sqlite://")
+            result = await check.result()
+            assert result["database"] == "unavailable", "The cached outcome should be reused."
+
+        with allure.step("Expire the outcome"):
+            check.clear()
+            result = await check.result()
+            assert result["database"] == "ok", "An expired outcome should be re-checked."
+
+    @allure.story("Readiness")
+    @allure.title("Test readiness requires the schema at its head when asked to")
+    async def test_readiness_schema(self, tmp_path: Path) -> None:
+        """Test a database lacking a migration is unready only with `require_schema`."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'ready.db'}")
+        create_schema(engine)
+        check = ReadinessCheck(engine, ttl=READY_TTL, schema_status=schema_status)
+
+        with allure.step("Check a database at the head"):
+            result = await check.result()
+            assert result["schema"] == "current", "The head revision should be reported."
+            assert ReadinessCheck.is_ready(result, require_schema=True), "Expected ready."
+
+        with allure.step("Move the database behind the head"):
+            with engine.begin() as connection:
+                connection.execute(text("UPDATE alembic_version SET version_num = '1ef649ed4eb1'"))
+            check.clear()
+            result = await check.result()
+
+        with allure.step("Verify only a required schema makes it unready"):
+            assert result["schema"] == "behind", "The missing migration should be reported."
+            assert not ReadinessCheck.is_ready(result, require_schema=True), (
+                "A schema behind the head should fail readiness when required."
+            )
+            assert ReadinessCheck.is_ready(result), "Without the requirement it is only reported."
+
+    @allure.story("Probe Logging")
+    @allure.title("Test probe requests are dropped from the access log")
+    def test_probe_access_filter(self) -> None:
+        """Test access lines of probe paths are filtered and other paths kept."""
+        probe_filter = ProbeAccessFilter()
+
+        def access_record(path: str) -> logging.LogRecord:
+            args = ("10.0.0.1:5000", "GET", path, "1.1", 200)
+            return logging.LogRecord("uvicorn.access", logging.INFO, "", 0, "%s", args, None)
+
+        with allure.step("Filter probe and API access records"):
+            assert not probe_filter.filter(access_record("/health/live")), (
+                "Liveness probe lines should be dropped."
+            )
+            assert not probe_filter.filter(access_record("/health/ready")), (
+                "Readiness probe lines should be dropped."
+            )
+            assert probe_filter.filter(access_record("/api/v1/questions/")), (
+                "Other requests should still be logged."
+            )
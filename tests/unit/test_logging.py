@@ -0,0 +1,176 @@
+import gzip
+import json
+import logging
+import logging.config
+import queue
+from pathlib import Path
+
+import allure
+from app.core.log_rotation import LogRotation, build_file_handler
+from app.core.logging_config import (
+    DroppingQueueHandler,
+    JsonFormatter,
+    RequestIdFilter,
+    SamplingFilter,
+    pipeline,
+    setup_logging,
+)
+from app.core.request_id import request_id
+
+SAMPLED_RECORDS = 10
+SAMPLE_RATE = 0.25
+QUEUE_SIZE = 2
+ROTATE_BYTES = 200
+BACKUP_COUNT = 2
+
+# The logger setup uvicorn applies before it imports the app.
+UVICORN_LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "default": {"class": "logging.StreamHandler", "stream": "ext://sys.stderr"},
+        "access": {"class": "logging.StreamHandler", "stream": "ext://sys.stdout"},
+    },
+    "loggers": {
+        "uvicorn": {"handlers": ["default"], "level": "INFO", "propagate": False},
+        "uvicorn.error": {"level": "INFO"},
+        "uvicorn.access": {"handlers": ["access"], "level": "INFO", "propagate": False},
+    },
+}
+
+
+def make_record(name: str, level: int = logging.INFO, msg: str = "message") -> logging.LogRecord:
+    """Build a log record as a logger would."""
+    return logging.LogRecord(name, level, __file__, 1, msg, None, None)
+
+
+@allure.feature("Logging Unit Tests")
+class TestLoggingPipeline:
+    """Unit tests for the queued logging pipeline."""
+
+    @allure.story("Sampling")
+    @allure.title("Test high-frequency loggers are sampled below WARNING")
+    def test_sampling_filter(self) -> None:
+        """Test the configured share is kept and warnings always pass."""
+        sampling = SamplingFilter({"app.api": SAMPLE_RATE})
+
+        with allure.step("Filter a burst of records from a sampled child logger"):
+            kept = sum(
+                sampling.filter(make_record("app.api.v1.questions"))
+                for _ in range(SAMPLED_RECORDS * 4)
+            )
+
+        with allure.step("Verify the kept share and the exempt records"):
+            assert kept == SAMPLED_RECORDS, "A quarter of the records should be kept."
+            assert sampling.filter(make_record("app.api.v1", logging.WARNING)), (
+                "Warnings should never be sampled away."
+            )
+            assert sampling.filter(make_record("app.services")), (
+                "Loggers without a rate should keep every record."
+            )
+
+    @allure.story("Sampling")
+    @allure.title("Test uvicorn access lines go through the queue and are sampled")
+    def test_uvicorn_access_sampled(self, tmp_path: Path) -> None:
+        """Test setup_logging takes over uvicorn's loggers so their sample rate applies."""
+        log_file = tmp_path / "app.log"
+        root_logger = logging.getLogger()
+        saved = pipeline.handler, pipeline.listener, list(root_logger.handlers)
+        logging.config.dictConfig(UVICORN_LOGGING)
+        access_logger = logging.getLogger("uvicorn.access")
+
+        try:
+            with allure.step("Set up logging over uvicorn's configuration and log requests"):
+                setup_logging(log_file=str(log_file), sample_rates={"uvicorn.access": SAMPLE_RATE})
+                for _ in range(SAMPLED_RECORDS * 4):
+                    access_logger.info(
+                        '%s - "%s %s HTTP/%s" %d', "10.0.0.1:5000", "GET", "/api/v1/", "1.1", 200
+                    )
+                logging.getLogger("uvicorn.error").warning("Shutting down")
+                pipeline.stop()
+        finally:
+            handler, listener, root_handlers = saved
+            if handler is not None and listener is not None:
+                pipeline.install(handler, listener)
+            root_logger.handlers[:] = root_handlers
+
+        with allure.step("Verify the sampled share reached the log file"):
+            lines = log_file.read_text().splitlines()
+            assert sum("GET /api/v1/" in line for line in lines) == SAMPLED_RECORDS, (
+                "A quarter of the access lines should be written."
+            )
+            assert any("Shutting down" in line for line in lines), (
+                "uvicorn's error logger should be written to the file too."
+            )
+            assert not access_logger.handlers, "uvicorn's own access handler should be removed."
+
+    @allure.story("Overflow")
+    @allure.title("Test a full queue drops records and reports the drop")
+    def test_full_queue_drops(self) -> None:
+        """Test records beyond the queue size are dropped, then reported once there is room."""
+        log_queue: queue.Queue = queue.Queue(maxsize=QUEUE_SIZE)
+        handler = DroppingQueueHandler(log_queue)
+
+        with allure.step("Log one record more than the queue holds"):
+            for number in range(QUEUE_SIZE + 1):
+                handler.handle(make_record("app", msg=f"record {number}"))
+            assert handler.dropped == 1, "The record that did not fit should be dropped."
+
+        with allure.step("Drain the queue and log again"):
+            for _ in range(QUEUE_SIZE):
+                log_queue.get_nowait()
+            handler.handle(make_record("app", msg="after drain"))
+            log_queue.get_nowait()
+            notice = log_queue.get_nowait()
+
+        with allure.step("Verify the drop notice"):
+            assert notice.getMessage() == "Log queue full, dropped 1 records", (
+                "The next record with room should be followed by a drop notice."
+            )
+
+    @allure.story("JSON Format")
+    @allure.title("Test JSON lines carry the request ID")
+    def test_json_formatter_request_id(self) -> None:
+        """Test records logged during a request are stamped with its ID."""
+        record = make_record("app.api", msg="Reading %s")
+        record.args = ("questions",)
+
+        with allure.step("Stamp and format a record inside a request"):
+            token = request_id.set("abc123")
+            try:
+                RequestIdFilter().filter(record)
+            finally:
+                request_id.reset(token)
+            entry = json.loads(JsonFormatter().format(record))
+
+        with allure.step("Verify the JSON entry"):
+            assert entry["request_id"] == "abc123", "The request ID should be logged."
+            assert entry["message"] == "Reading questions", "The message should be formatted."
+            assert entry["level"] == "INFO", "The level should be logged."
+
+    @allure.story("Rotation")
+    @allure.title("Test rotated segments are gzipped and pruned")
+    def test_size_rotation_compresses(self, tmp_path: Path) -> None:
+        """Test size rotation leaves only the newest compressed segments."""
+        log_file = tmp_path / "app.log"
+        handler = build_file_handler(
+            str(log_file), LogRotation(max_bytes=ROTATE_BYTES, backup_count=BACKUP_COUNT)
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        with allure.step("Write enough records for several rotations"):
+            for number in range(50):
+                handler.emit(make_record("app", msg=f"line {number:03d} " + "x" * 40))
+            handler.rotator.__self__.wait()
+            handler.close()
+
+        with allure.step("Verify the archives"):
+            archives = sorted(path.name for path in tmp_path.glob("app.log.*"))
+            assert archives == ["app.log.1.gz", "app.log.2.gz"], (
+                f"Only the newest compressed segments should be kept, got {archives}."
+            )
+            newest = gzip.decompress((tmp_path / "app.log.1.gz").read_bytes()).decode()
+            current = log_file.read_text()
+            assert int(newest.split()[-2]) + 1 == int(current.split()[1]), (
+                "The newest archive should end right before the current file starts."
+            )
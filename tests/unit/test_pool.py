@@ -0,0 +1,96 @@
+import allure
+import pytest
+from app.core.config import Settings
+from app.db.pool import (
+    TimedAsyncQueuePool,
+    TimedQueuePool,
+    pool_options,
+    pool_saturation,
+    pool_stats,
+)
+from pydantic import ValidationError
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+POOL_SETTINGS = {
+    "size": 1,
+    "max_overflow": 0,
+    "timeout": 0.01,
+    "recycle": -1,
+    "pre_ping": True,
+    "use_lifo": True,
+}
+
+
+@allure.feature("Connection Pool Unit Tests")
+class TestConnectionPool:
+    """Unit tests for the configurable, instrumented connection pool."""
+
+    @allure.story("Pool Options")
+    @allure.title("Test pool options follow the dialect's default pool")
+    def test_pool_options_per_dialect(self) -> None:
+        """Test queue pools get the timed class and sizing, in-memory SQLite does not."""
+        with allure.step("Build options for server, file and in-memory databases"):
+            postgres = pool_options("postgresql://u:p@db/app", **POOL_SETTINGS)
+            aiosqlite = pool_options("sqlite+aiosqlite:///./app.db", **POOL_SETTINGS)
+            memory = pool_options("sqlite://", **POOL_SETTINGS)
+
+        with allure.step("Verify the chosen pool classes and arguments"):
+            assert postgres["poolclass"] is TimedQueuePool, "Sync drivers use the timed pool."
+            assert postgres["pool_size"] == 1, "The pool size should come from the settings."
+            assert aiosqlite["poolclass"] is TimedAsyncQueuePool, (
+                "Async drivers use the async timed pool."
+            )
+            assert memory == {"pool_pre_ping": True}, "In-memory SQLite keeps its own pool."
+
+    @allure.story("Pool Metrics")
+    @allure.title("Test checkouts, waits and timeouts are counted")
+    def test_pool_metrics(self) -> None:
+        """Test the stats report live checkouts and a checkout that timed out."""
+        engine = create_engine(
+            "sqlite://", poolclass=TimedQueuePool, pool_size=1, max_overflow=0, pool_timeout=0.01
+        )
+        TimedQueuePool.metrics.reset()
+        try:
+            with (
+                allure.step("Hold the only connection and try to check out another"),
+                engine.connect(),
+            ):
+                stats = pool_stats(engine.pool)
+                assert stats["checked_out"] == 1, "The held connection should be counted."
+                with pytest.raises(PoolTimeoutError):
+                    engine.connect()
+
+            with allure.step("Verify the counters"):
+                stats = pool_stats(engine.pool)
+                assert stats["checked_out"] == 0, "The connection should be returned."
+                assert stats["checkouts"] == 1, "One checkout should have succeeded."
+                assert stats["timeouts"] == 1, "One checkout should have timed out."
+                assert stats["wait_seconds_max"] >= POOL_SETTINGS["timeout"], (
+                    "The timed out checkout should have waited for the pool timeout."
+                )
+        finally:
+            engine.dispose()
+
+    @allure.story("Pool Saturation")
+    @allure.title("Test saturation of bounded and unbounded pools")
+    def test_pool_saturation(self) -> None:
+        """Test a full bounded pool reports 1.0 and a size-0 pool, which has no limit, None."""
+        bounded = create_engine("sqlite://", poolclass=TimedQueuePool, pool_size=1, max_overflow=0)
+        unbounded = create_engine(
+            "sqlite://", poolclass=TimedQueuePool, pool_size=0, max_overflow=0
+        )
+        try:
+            with allure.step("Check out a connection from each pool"):
+                with bounded.connect():
+                    assert pool_saturation(bounded.pool) == 1.0, "The only connection is in use."
+                with unbounded.connect():
+                    assert pool_saturation(unbounded.pool) is None, (
+                        "A pool without a size limit has no saturation."
+                    )
+        finally:
+            bounded.dispose()
+            unbounded.dispose()
+
+        with allure.step("Configure a pool size of zero"), pytest.raises(ValidationError):
+            Settings(DB_POOL_SIZE=0)
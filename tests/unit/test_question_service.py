@@ -1,8 +1,11 @@
 import allure
+from app.core.text import text_key
 from app.schemas.category import CategoryCreate
-from app.schemas.question import QuestionCreate, QuestionUpdate
+from app.schemas.question import BulkItemStatus, QuestionCreate, QuestionList, QuestionUpdate
 from app.services import category as category_service
 from app.services import question as question_service
+from pydantic_core import to_json
+from sqlalchemy import Connection, event
 from sqlalchemy.orm import Session
 
 
@@ -98,6 +101,38 @@ class TestQuestionService:
                 "The wrong question was returned on case-insensitive search."
             )
 
+    @allure.story("Read Question")
+    @allure.title("Test getting a question by text ignores whitespace and Unicode form")
+    def test_get_question_by_text_normalizes_whitespace(
+        self, db_session: Session, sample_category: category_service.CategoryModel
+    ) -> None:
+        """Test lookup by text matches on the normalized text key."""
+        with allure.step("Create a question to retrieve"):
+            created_question = question_service.create_question(
+                db_session,
+                QuestionCreate(
+                    question_text="What is a Unit Test?",
+                    answer_text="A test of one unit.",
+                    category_id=sample_category.id,
+                ),
+            )
+
+        with allure.step("Look the question up with extra whitespace and full-width letters"):
+            retrieved_question = question_service.get_question_by_text_case_insensitive(
+                db_session, "  what is a\t\uff35\uff2e\uff29\uff34   test? "
+            )
+
+        with allure.step("Verify the stored key matches and the question is returned"):
+            assert created_question.text_key == text_key("what is a unit test?"), (
+                "The stored text key should be derived from the normalized text."
+            )
+            assert retrieved_question is not None, (
+                "Expected to find the question by normalized text."
+            )
+            assert retrieved_question.id == created_question.id, (
+                "The wrong question was returned on normalized text lookup."
+            )
+
     @allure.story("Read Question")
     @allure.title("Test getting a non-existent question by text")
     def test_get_nonexistent_question_by_text(self, db_session: Session) -> None:
@@ -163,6 +198,191 @@ class TestQuestionService:
                 "The question's category ID does not match the filter."
             )
 
+    @allure.story("Read Question")
+    @allure.title("Test keyset pagination of questions")
+    def test_get_questions_page(self, db_session: Session) -> None:
+        """Test paging through questions ordered by (category_id, id)."""
+        with allure.step("Create questions in two categories, interleaved"):
+            cat1 = category_service.create_category(db_session, CategoryCreate(name="Category 1"))
+            cat2 = category_service.create_category(db_session, CategoryCreate(name="Category 2"))
+            for i in range(3):
+                for cat in (cat2, cat1):
+                    question_service.create_question(
+                        db_session,
+                        QuestionCreate(
+                            question_text=f"Q{i} in {cat.name}?",
+                            answer_text="A",
+                            category_id=cat.id,
+                        ),
+                    )
+
+        with allure.step("Walk all pages with limit=4"):
+            collected = []
+            after = None
+            pages = 0
+            while True:
+                page, after = question_service.get_questions_page(db_session, limit=4, after=after)
+                collected.extend(page)
+                pages += 1
+                if after is None:
+                    break
+
+        with allure.step("Verify ordering and completeness"):
+            expected_pages = 2
+            assert pages == expected_pages, "Six questions with limit=4 should span two pages."
+            keys = [(q.category_id, q.id) for q in collected]
+            assert keys == sorted(keys), "Questions must be ordered by (category_id, id)."
+            quantity_questions = 6
+            assert len(set(keys)) == len(keys) == quantity_questions, (
+                "Every question must appear exactly once."
+            )
+
+        with allure.step("Verify category filter is applied within pages"):
+            page, after = question_service.get_questions_page(
+                db_session, limit=10, category_id=cat2.id
+            )
+            assert after is None, "A page larger than the result set must be the last one."
+            assert {q.category_id for q in page} == {cat2.id}, "Only cat2 questions expected."
+
+        with allure.step("Verify a category-scoped cursor resumes after the last ID"):
+            first, after = question_service.get_questions_page(
+                db_session, limit=2, category_id=cat2.id
+            )
+            rest, _ = question_service.get_questions_page(
+                db_session, limit=2, after=after, category_id=cat2.id
+            )
+            assert [q.id for q in first + rest] == [q.id for q in page], (
+                "Scoped pages must continue exactly where the previous page ended."
+            )
+
+    @allure.story("Read Question")
+    @allure.title("Test the Core read path encodes byte-identical pages")
+    def test_get_question_rows_page_matches_orm(self, db_session: Session) -> None:
+        """Test Core rows encode to the same JSON as validated ORM questions."""
+        with allure.step("Create questions with non-ASCII and escaped text"):
+            category = category_service.create_category(db_session, CategoryCreate(name="Misc"))
+            for text in ("Что такое GIL?", 'What does "yield" do?', "Tabs\tand\nnewlines?"):
+                question_service.create_question(
+                    db_session,
+                    QuestionCreate(question_text=text, answer_text=text, category_id=category.id),
+                )
+
+        with allure.step("Read the same pages through the ORM and the Core path"):
+            questions, orm_next = question_service.get_questions_page(db_session, limit=2)
+            rows, core_next = question_service.get_question_rows_page(db_session, limit=2)
+            orm_json = QuestionList.dump_json(
+                QuestionList.validate_python(questions, from_attributes=True)
+            )
+            single = question_service.get_question_row(db_session, questions[0].id)
+
+        with allure.step("Verify the encoded pages are identical"):
+            assert to_json(rows) == orm_json, "Core rows must encode to the same bytes."
+            assert core_next == orm_next, "Both paths must resume from the same key."
+            assert single == rows[0], "A single row must match the page row."
+
+    @allure.story("Search Questions")
+    @allure.title("Test full-text search stays in sync with writes")
+    def test_search_questions(self, db_session: Session) -> None:
+        """Test ranked search, facets, and index sync on update and delete."""
+        with allure.step("Create questions in two categories"):
+            cat1 = category_service.create_category(db_session, CategoryCreate(name="Python"))
+            cat2 = category_service.create_category(db_session, CategoryCreate(name="Databases"))
+            decorator = question_service.create_question(
+                db_session,
+                QuestionCreate(
+                    question_text="What is a decorator?",
+                    answer_text="A Python function that wraps another function.",
+                    category_id=cat1.id,
+                ),
+            )
+            index = question_service.create_question(
+                db_session,
+                QuestionCreate(
+                    question_text="What is an index?",
+                    answer_text="A structure that speeds up lookups, also in Python dicts.",
+                    category_id=cat2.id,
+                ),
+            )
+
+        with allure.step("Search with a partially typed word"):
+            hits, facets = question_service.search_questions(db_session, "pyth", limit=10)
+            quantity_hits = 2
+            assert len(hits) == quantity_hits, "Prefix search should match both questions."
+            assert facets == {cat1.id: 1, cat2.id: 1}, "Facets should count hits per category."
+
+        with allure.step("Restrict search to one category"):
+            hits, facets = question_service.search_questions(
+                db_session, "python", limit=10, category_id=cat2.id
+            )
+            assert [q.id for q, _ in hits] == [index.id], "Only the cat2 hit should be returned."
+            assert facets == {cat1.id: 1, cat2.id: 1}, "Facets must ignore the category filter."
+
+        with allure.step("Update and delete questions, then search again"):
+            question_service.update_question(
+                db_session, decorator.id, QuestionUpdate(question_text="What is a generator?")
+            )
+            question_service.delete_question(db_session, index.id)
+            hits, _ = question_service.search_questions(db_session, "decorator", limit=10)
+            assert hits == [], "The old text must be removed from the index on update."
+            hits, _ = question_service.search_questions(db_session, "generator", limit=10)
+            assert [q.id for q, _ in hits] == [decorator.id], "The new text must be indexed."
+            _, facets = question_service.search_questions(db_session, "lookups", limit=10)
+            assert facets == {}, "Deleted questions must disappear from the index."
+
+        with allure.step("Search with no word characters"):
+            assert question_service.search_questions(db_session, '" * (', limit=10) == ([], {}), (
+                "A query without words should return no hits instead of a syntax error."
+            )
+
+    @allure.story("Bulk Create Questions")
+    @allure.title("Test bulk creation across chunks with duplicates and bad categories")
+    def test_bulk_create_questions(
+        self, db_session: Session, sample_category: category_service.CategoryModel
+    ) -> None:
+        """Test bulk creation classifies every item and inserts the valid ones."""
+        with allure.step("Create a question that already exists"):
+            question_service.create_question(
+                db_session,
+                QuestionCreate(
+                    question_text="Existing?", answer_text="A", category_id=sample_category.id
+                ),
+            )
+
+        with allure.step("Bulk create items spanning several chunks"):
+            items = [
+                QuestionCreate(
+                    question_text="New 1?", answer_text="A", category_id=sample_category.id
+                ),
+                QuestionCreate(
+                    question_text="EXISTING?", answer_text="A", category_id=sample_category.id
+                ),
+                QuestionCreate(question_text="New 2?", answer_text="A", category_id=99999),
+                QuestionCreate(
+                    question_text="new 1?", answer_text="A", category_id=sample_category.id
+                ),
+                QuestionCreate(
+                    question_text="New 3?", answer_text="A", category_id=sample_category.id
+                ),
+            ]
+            results = question_service.bulk_create_questions(db_session, items, chunk_size=2)
+
+        with allure.step("Verify per-item statuses"):
+            assert [status for status, _ in results] == [
+                BulkItemStatus.CREATED,
+                BulkItemStatus.DUPLICATE,
+                BulkItemStatus.INVALID_CATEGORY,
+                BulkItemStatus.DUPLICATE,
+                BulkItemStatus.CREATED,
+            ], "Unexpected bulk item statuses."
+
+        with allure.step("Verify the created questions are stored with the returned IDs"):
+            for (status, new_id), item in zip(results, items, strict=True):
+                if status is BulkItemStatus.CREATED:
+                    assert new_id is not None, "Created items must report their new ID."
+                    stored = question_service.get_question(db_session, new_id)
+                    assert stored is not None, "The returned ID must point to a stored question."
+                    assert stored.question_text == item.question_text, "Stored text mismatch."
+
     @allure.story("Update Question")
     @allure.title("Test updating an existing question")
     def test_update_question(
@@ -269,3 +489,90 @@ class TestQuestionService:
             deleted_question = question_service.delete_question(db_session, 99999)
         with allure.step("Verify the result is None"):
             assert deleted_question is None, "Expected None when deleting a non-existent question."
+
+    @allure.story("Question Counts")
+    @allure.title("Test category question counters follow every write")
+    def test_question_counts(self, db_session: Session) -> None:
+        """Test create, bulk create, move and delete keep the counters exact."""
+        first = category_service.create_category(db_session, CategoryCreate(name="First"))
+        second = category_service.create_category(db_session, CategoryCreate(name="Second"))
+
+        def counts() -> dict[int, int]:
+            rows = category_service.get_category_stats(db_session)
+            return {row["id"]: row["question_count"] for row in rows}
+
+        with allure.step("Create questions one by one and in bulk"):
+            moved = question_service.create_question(
+                db_session,
+                QuestionCreate(question_text="Q0", answer_text="A", category_id=first.id),
+            )
+            question_service.bulk_create_questions(
+                db_session,
+                [
+                    QuestionCreate(question_text=f"Q{i}", answer_text="A", category_id=first.id)
+                    for i in range(1, 3)
+                ],
+            )
+            assert counts() == {first.id: 3, second.id: 0}, "Creates should be counted."
+
+        with allure.step("Move one question and delete another"):
+            question_service.update_question(
+                db_session, moved.id, QuestionUpdate(category_id=second.id)
+            )
+            question_service.update_question(db_session, moved.id, QuestionUpdate(answer_text="B"))
+            removed = question_service.get_question_by_text_case_insensitive(db_session, "Q1")
+            question_service.delete_question(db_session, removed.id)
+            assert counts() == {first.id: 1, second.id: 1}, "Moves and deletes should be counted."
+
+        with allure.step("Corrupt a counter and run the repair"):
+            db_session.execute(category_service.categories_table.update().values(question_count=42))
+            db_session.commit()
+            repaired = category_service.recount_questions(db_session)
+
+        with allure.step("Verify the counters were recomputed"):
+            assert repaired == len(counts()), "Both drifted categories should be repaired."
+            assert counts() == {first.id: 1, second.id: 1}, "Counts should match the questions."
+
+    @allure.story("Question Counts")
+    @allure.title("Test every writer locks category rows before the table versions")
+    def test_lock_order(
+        self, db_session: Session, sample_category: category_service.CategoryModel
+    ) -> None:
+        """Test single and bulk creates update the counters before bumping table_versions."""
+        category_id = sample_category.id
+        updates: list[str] = []
+
+        def record(_conn: Connection, _cursor: object, statement: str, *_args: object) -> None:
+            if statement.startswith("UPDATE"):
+                updates.append(statement.split()[1])
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            with allure.step("Create a question one by one and two in bulk"):
+                question_service.create_question(
+                    db_session,
+                    QuestionCreate(
+                        question_text="Single", answer_text="A", category_id=category_id
+                    ),
+                )
+                single = list(updates)
+                updates.clear()
+                question_service.bulk_create_questions(
+                    db_session,
+                    [
+                        QuestionCreate(
+                            question_text=f"Bulk {i}",
+                            answer_text="A",
+                            category_id=category_id,
+                        )
+                        for i in range(2)
+                    ],
+                )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        with allure.step("Verify the category rows are updated first"):
+            expected = ["categories", "table_versions"]
+            assert single == expected, f"Unexpected lock order of a single create: {single}."
+            assert updates == expected, f"Unexpected lock order of a bulk create: {updates}."
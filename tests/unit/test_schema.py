@@ -0,0 +1,168 @@
+from pathlib import Path
+
+import allure
+import pytest
+from alembic import command
+from alembic.config import Config
+from app.core.config import settings
+from app.db.schema import (
+    MIGRATIONS_DIR,
+    SchemaMismatchError,
+    check_schema,
+    create_schema,
+    current_revisions,
+    head_revisions,
+    schema_status,
+)
+from sqlalchemy import create_engine, inspect, text
+
+# What `create_all` of the code before the migration series left behind, never stamped.
+LEGACY_SQLITE_DDL = (
+    (
+        "CREATE TABLE categories (id INTEGER NOT NULL, name VARCHAR NOT NULL, "
+        "CONSTRAINT pk_categories PRIMARY KEY (id))"
+    ),
+    "CREATE INDEX ix_categories_id ON categories (id)",
+    "CREATE UNIQUE INDEX ix_categories_name ON categories (name)",
+    (
+        "CREATE TABLE questions (id INTEGER NOT NULL, question_text TEXT NOT NULL, "
+        "answer_text TEXT NOT NULL, category_id INTEGER NOT NULL, "
+        "CONSTRAINT pk_questions PRIMARY KEY (id), "
+        "CONSTRAINT fk_questions_category_id_categories FOREIGN KEY(category_id) "
+        "REFERENCES categories (id) ON DELETE CASCADE)"
+    ),
+    "CREATE INDEX ix_questions_id ON questions (id)",
+    "INSERT INTO categories (id, name) VALUES (1, 'Python')",
+    "INSERT INTO questions VALUES (1, 'What is a list?', 'A sequence.', 1)",
+)
+
+
+@allure.feature("Schema Check Unit Tests")
+class TestSchemaCheck:
+    """Unit tests for the startup schema-version check."""
+
+    @allure.story("Schema Check")
+    @allure.title("Test an unversioned database is refused")
+    def test_unversioned_database_refused(self) -> None:
+        """Test a database without `alembic_version` does not match the head."""
+        engine = create_engine("sqlite://")
+
+        with allure.step("Check an empty database in refuse mode"):
+            assert current_revisions(engine) == set(), "No revision should be stamped."
+            with pytest.raises(SchemaMismatchError):
+                check_schema(engine, "refuse")
+
+        with allure.step("Check it in warn and off modes"):
+            check_schema(engine, "warn")
+            check_schema(engine, "off")
+
+    @allure.story("Development Schema")
+    @allure.title("Test create_schema stamps the migration head")
+    def test_create_schema_stamps_head(self) -> None:
+        """Test a development database created from models passes the check."""
+        engine = create_engine("sqlite://")
+
+        with allure.step("Create the schema and check it"):
+            create_schema(engine)
+            assert current_revisions(engine) == head_revisions(), (
+                "The created schema should be stamped with the head revision."
+            )
+            check_schema(engine, "refuse")
+
+        with allure.step("Move the stamp away from the head"):
+            with engine.begin() as connection:
+                connection.execute(text("UPDATE alembic_version SET version_num = 'older'"))
+            with pytest.raises(SchemaMismatchError, match="older"):
+                check_schema(engine, "refuse")
+
+    @allure.story("Migrations")
+    @allure.title("Test an empty database is migrated to the head")
+    def test_upgrade_empty_database(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test `alembic upgrade head` builds every table from nothing."""
+        url = f"sqlite:///{tmp_path / 'migrated.db'}"
+        monkeypatch.setattr(settings, "DATABASE_URL", url)
+        config = Config()
+        config.set_main_option("script_location", str(MIGRATIONS_DIR))
+
+        with allure.step("Upgrade an empty database"):
+            command.upgrade(config, "head")
+
+        with allure.step("Verify the tables and the stamp"):
+            engine = create_engine(url)
+            tables = set(inspect(engine).get_table_names())
+            assert {"categories", "questions", "table_versions"} <= tables, (
+                "The migrations should create every table."
+            )
+            assert current_revisions(engine) == head_revisions(), "Expected the head revision."
+
+    @allure.story("Migrations")
+    @allure.title("Test `alembic upgrade head` refuses a database created before migrations")
+    def test_upgrade_legacy_database_refused(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the base revision stops instead of failing on the existing tables."""
+        url = f"sqlite:///{tmp_path / 'legacy.db'}"
+        monkeypatch.setattr(settings, "DATABASE_URL", url)
+        engine = create_engine(url)
+        with engine.begin() as connection:
+            for statement in LEGACY_SQLITE_DDL:
+                connection.execute(text(statement))
+        config = Config()
+        config.set_main_option("script_location", str(MIGRATIONS_DIR))
+
+        with (
+            allure.step("Upgrade the unstamped legacy database"),
+            pytest.raises(RuntimeError, match="1ef649ed4eb1"),
+        ):
+            command.upgrade(config, "head")
+
+        with allure.step("Verify the database was left unversioned"):
+            assert current_revisions(engine) == set(), "No revision should be stamped."
+
+    @allure.story("Schema Status")
+    @allure.title("Test the schema status relative to the migration head")
+    def test_schema_status(self) -> None:
+        """Test current, behind, ahead and unversioned databases are told apart."""
+        engine = create_engine("sqlite://")
+
+        def status() -> str:
+            with engine.connect() as connection:
+                return schema_status(connection)
+
+        with allure.step("Check an unversioned database"):
+            assert status() == "unversioned", "A database without a stamp is unversioned."
+
+        with allure.step("Check a database at the head"):
+            create_schema(engine)
+            assert status() == "current", "A stamped head should be current."
+
+        with allure.step("Check a database stamped with a known older revision"):
+            with engine.begin() as connection:
+                connection.execute(text("UPDATE alembic_version SET version_num = '1ef649ed4eb1'"))
+            assert status() == "behind", "A known older revision is behind."
+
+        with allure.step("Check a database stamped by a newer build"):
+            with engine.begin() as connection:
+                connection.execute(text("UPDATE alembic_version SET version_num = 'newer'"))
+            assert status() == "ahead", "An unknown revision comes from a newer build."
+
+    @allure.story("Development Schema")
+    @allure.title("Test create_schema migrates a database created before migrations")
+    def test_create_schema_adopts_legacy_database(self, tmp_path: Path) -> None:
+        """Test an unversioned database with old tables is upgraded, not stamped head."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+        with engine.begin() as connection:
+            for statement in LEGACY_SQLITE_DDL:
+                connection.execute(text(statement))
+
+        with allure.step("Create the schema over the legacy tables"):
+            create_schema(engine)
+
+        with allure.step("Verify the missing columns were added and the rows kept"):
+            assert current_revisions(engine) == head_revisions(), "Expected the head revision."
+            check_schema(engine, "refuse")
+            with engine.connect() as connection:
+                key = connection.execute(text("SELECT text_key FROM questions")).scalar_one()
+                count = connection.execute(text("SELECT question_count FROM categories")).scalar()
+            assert key, "The existing question should get its text key."
+            assert count == 1, "The question counter should be backfilled."
@@ -0,0 +1,92 @@
+import logging
+
+import allure
+import pytest
+from app.core.config import settings
+from app.core.metrics import MetricsMiddleware, record_statement
+from app.db.database import normalize_sql, parameter_count
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from starlette.types import Receive, Scope, Send
+
+STATEMENT_BUDGET = 2
+EXECUTEMANY_VALUES = 4
+
+
+async def three_statements(_scope: Scope, _receive: Receive, send: Send) -> None:
+    """ASGI app pretending to run three SQL statements."""
+    for _ in range(3):
+        record_statement(0.001)
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+@allure.feature("SQL Profiler Unit Tests")
+class TestSqlProfiler:
+    """Unit tests for the slow-query log and the per-request statement budget."""
+
+    @allure.story("Normalization")
+    @allure.title("Test statements are normalized for logs")
+    def test_normalize_sql(self) -> None:
+        """Test whitespace, IN lists and multi-row VALUES collapse to one shape."""
+        with allure.step("Normalize statements with varying parameter lists"):
+            in_list = normalize_sql("SELECT id\n  FROM questions WHERE id IN (?, ?, ?)")
+            values = normalize_sql("INSERT INTO t (a, b) VALUES (%(a_0)s, %(b_0)s), ($1, $2)")
+
+        with allure.step("Verify the normalized shapes and parameter counts"):
+            assert in_list == "SELECT id FROM questions WHERE id IN (...)", (
+                "IN lists and whitespace should be collapsed."
+            )
+            assert values == "INSERT INTO t (a, b) VALUES (...)", (
+                "Multi-row VALUES should be collapsed."
+            )
+            assert parameter_count([(1, 2), (3, 4)], executemany=True) == EXECUTEMANY_VALUES, (
+                "executemany should count the values of every row."
+            )
+            assert parameter_count({"a": 1}, executemany=False) == 1, (
+                "A single execution should count its own values."
+            )
+
+    @allure.story("Slow Query Log")
+    @allure.title("Test statements over the threshold are logged")
+    def test_slow_query_logged(
+        self,
+        db_session: Session,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test a slow statement is logged with its parameter count and normalized SQL."""
+        monkeypatch.setattr(settings, "SLOW_QUERY_MS", 1e-6)
+
+        with (
+            allure.step("Run a statement with the threshold near zero"),
+            caplog.at_level(logging.WARNING, logger="app.db.database"),
+        ):
+            db_session.execute(text("SELECT :a,\n :b"), {"a": 1, "b": 2})
+
+        with allure.step("Verify the log record"):
+            messages = [record.getMessage() for record in caplog.records]
+            assert any("route=- params=2: SELECT ?, ?" in message for message in messages), (
+                f"The slow statement should be logged outside a request, got {messages}."
+            )
+
+    @allure.story("Statement Budget")
+    @allure.title("Test requests over the statement budget are logged")
+    async def test_statement_budget(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test a request running more statements than the budget is reported."""
+        middleware = MetricsMiddleware(three_statements, statement_budget=STATEMENT_BUDGET)
+        scope = {"type": "http", "method": "PATCH", "path": "/api/v1/questions/1"}
+
+        async def send(_message: dict) -> None:
+            return
+
+        with (
+            allure.step("Serve a request running three statements"),
+            caplog.at_level(logging.WARNING, logger="app.core.metrics"),
+        ):
+            await middleware(scope, None, send)
+
+        with allure.step("Verify the budget warning"):
+            assert any(
+                "ran 3 SQL statements" in record.getMessage() for record in caplog.records
+            ), "A request over the statement budget should be logged."